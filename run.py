@@ -11,10 +11,42 @@ import pandas as pd
 # src 폴더를 Python 경로에 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
-from src.cleansing.cleansing_unified import clean_all_data
-from src.listing.listing_unified import main as listing_main
+from src.analytics.snapshots import ensure_snapshot, load_stock_history, save_snapshot
+from src.analytics.velocity import compute_velocity
+from src.cleansing.cleansing_unified import clean_all_data, read_raw_data
+from src.cleansing.rule_stats import save_rule_stats
+from src.cleansing.color_codes import save_color_review
+from src.cleansing.fuzzy_match import update_vocabulary
+from src.cleansing.validation import (
+    raise_on_errors,
+    save_validation_report,
+    validate_cleansed_data,
+    validate_raw_data,
+    validate_raw_files,
+)
+from src.listing.best_offers import select_best_offers
+from src.listing.listing_unified import main as listing_main, build_upload_df
+from src.pipeline.fingerprint import (
+    compute_fingerprint,
+    prepare_output_path,
+    record_fingerprint,
+    reuse_existing_output,
+    stamp_fingerprint,
+)
+from src.pipeline.streaming import run_streaming
+from src.upload.client import upload_rows, upload_results_file
+from src.upload.delta import publish_delta, save_published_state
 from src.config.constants import (
     FINAL_COLUMN_ORDER,
+    BestOfferConfig,
+    FilePaths,
+    FingerprintConfig,
+    ListingProfiles,
+    PublishConfig,
+    StreamingConfig,
+    UploadConfig,
+    ValidationConfig,
+    VelocityConfig,
     get_today_date_string,
     set_global_date,
 )
@@ -57,18 +89,23 @@ def get_date_input():
             print("❌ YYMMDD 형식(6자리 숫자)으로 입력해주세요. 예: 250819")
 
 
+def has_branch_files(date_str):
+    """기본 파일 외에 지점별 원본 파일이 있는지 확인"""
+    return len(FilePaths.get_hyundai_raw_files(date_str)) > 1 or len(FilePaths.get_kia_raw_files(date_str)) > 1
+
+
 def check_files_exist(date_str):
     """해당 날짜의 파일들이 존재하는지 확인"""
     from src.config.constants import FilePaths
-    import os
+    from src.utils.raw_bundles import raw_file_exists
 
     hyundai_file = FilePaths.get_hyundai_raw_file(date_str)
     kia_file = FilePaths.get_kia_raw_file(date_str)
 
     missing_files = []
-    if not os.path.exists(hyundai_file):
+    if not raw_file_exists(hyundai_file):
         missing_files.append(hyundai_file)
-    if not os.path.exists(kia_file):
+    if not raw_file_exists(kia_file):
         missing_files.append(kia_file)
 
     if missing_files:
@@ -82,6 +119,9 @@ def check_files_exist(date_str):
     print(f"✅ 필요한 파일들이 모두 존재합니다:")
     print(f"   - {hyundai_file}")
     print(f"   - {kia_file}")
+    branch_files = FilePaths.get_hyundai_raw_files(date_str)[1:] + FilePaths.get_kia_raw_files(date_str)[1:]
+    for file in branch_files:
+        print(f"   - {file} (지점별 파일)")
     return True
 
 
@@ -100,22 +140,72 @@ def main():
         if check_files_exist(selected_date):
             break
 
-    # 선택한 날짜를 전역으로 설정
-    set_global_date(selected_date)
-    current_date = selected_date
+    run_pipeline(selected_date)
 
-    # 1. 통합 클렌징
-    print(f"\n📋 1단계: 통합 클렌징 시작...")
-    cleaned_df = clean_all_data()
-    print(f"✅ 클렌징 완료: {len(cleaned_df)}대")
 
-    # 2. 통합 리스팅
-    print(f"\n📋 2단계: 통합 리스팅 시작...")
-    result_dict = listing_main(cleaned_df)
-    print(f"✅ 리스팅 완료")
+def run_pipeline(current_date, validation_mode=None):
+    """
+    날짜 하나에 대해 클렌징 → 리스팅 → 내보내기 실행 (입력 없이 실행, 작업 큐 워커에서도 사용)
+
+    Args:
+        current_date: 처리 날짜 (YYMMDD)
+        validation_mode: 데이터 검증 모드 ("full"/"sample", None이면 ValidationConfig.MODE)
+
+    Returns:
+        mode("reused"/"streaming"/"batch"), 일괄 처리 시 all/filtered 대수 dict
+    """
+    # 선택한 날짜를 전역으로 설정
+    set_global_date(current_date)
+
+    # 입력 지문: 원본 파일과 규칙/필터가 같은 결과가 이미 있으면 재사용
+    fingerprint = None
+    if FingerprintConfig.ENABLED:
+        fingerprint = compute_fingerprint(current_date)
+        if reuse_existing_output(current_date, fingerprint):
+            # 다음 날짜 소진 속도 계산에 필요한 스냅샷/재고 이력은 재사용 시에도 유지
+            if VelocityConfig.ENABLED:
+                ensure_snapshot(current_date)
+            print(f"\n🎉 모든 처리 완료! (기존 결과 재사용)")
+            return {"mode": "reused"}
+
+    # 대용량 피드: 청크 단위 스트리밍 모드 (클렌징 → 리스팅 → 결과 파일)
+    # 지점별 파일이 있으면 청크 사이 중복 병합이 불가능하므로 일괄 처리
+    streaming = StreamingConfig.ENABLED
+    if streaming and has_branch_files(current_date):
+        print("⚠️ 지점별 원본이 있어 스트리밍 대신 일괄 처리로 병합합니다.")
+        streaming = False
+    if streaming:
+        # 원본 검증 (오류가 있으면 청크 처리 전에 중단)
+        # 전체 시트를 한 번에 읽지 않도록 시트별 앞부분만 검사 (sample 모드 고정)
+        raw_report = validate_raw_files(current_date, "sample")
+        raise_on_errors(raw_report)
+        run_streaming(current_date, fingerprint=fingerprint and fingerprint["fingerprint"])
+        if fingerprint:
+            record_fingerprint(current_date, fingerprint)
+        save_rule_stats(current_date)
+        save_color_review(current_date)
+        save_validation_report([raw_report], current_date)
+        if PublishConfig.DELTA_ENABLED:
+            upload_df = pd.read_excel(FilePaths.get_results_file("filtered", current_date), sheet_name="upload")
+            publish_delta(upload_df, current_date)
+            save_published_state(upload_df, current_date)
+        if UploadConfig.ENABLED:
+            upload_results_file(current_date)
+        print(f"\n🎉 모든 처리 완료! (스트리밍 모드)")
+        return {"mode": "streaming"}
+
+    # 1~2. 통합 클렌징 → 통합 리스팅
+    prepared = prepare_results(current_date, validation_mode=validation_mode)
+    result_dict = prepared["result_dict"]
 
     # 3. 최종 결과 파일 생성 (날짜 포함)
-    create_final_result_file(current_date, result_dict)
+    if prepared["write"]:
+        create_final_result_file(current_date, result_dict, fingerprint and fingerprint["fingerprint"])
+        if fingerprint:
+            record_fingerprint(current_date, fingerprint)
+
+    # 4. 게시 상태 저장, 업로드, 퍼지 매칭 어휘 반영
+    finish_results(current_date, prepared)
 
     print(f"\n🎉 모든 처리 완료!")
     print(f"📅 처리 날짜: {current_date}")
@@ -124,10 +214,84 @@ def main():
     print(f"     └─ all 시트: 전체 차량 (필터 없음)")
     print(f"     └─ filtered 시트: 필터링된 차량 (전체 컬럼)")
     print(f"     └─ upload 시트: 업로드용 (선택 컬럼만)")
+    print(f"     └─ exclusions 시트: 제외 사유 × 모델별 집계")
+    print(f"     └─ summary 시트: 모델/트림/연료별 요약 + 필터 단계별 통과 대수")
+    if VelocityConfig.ENABLED:
+        print(f"     └─ velocity 시트: key_admin별 재고 소진 속도")
+    if BestOfferConfig.ENABLED:
+        print(f"     └─ best 시트: key_admin별 최저가 차량 (흔한 색상)")
+    return {"mode": "batch", "all": len(result_dict["all"]), "filtered": len(result_dict["filtered"])}
+
+
+def prepare_results(current_date, raw_data=None, raw_report=None, validation_mode=None):
+    """
+    결과 파일 생성 전 단계 (원본 검증 → 클렌징 → 스냅샷/소진 속도 → 리스팅 → 변경분 계산)
+
+    규칙 통계, 스냅샷 이력, 게시 상태가 이전 날짜 결과에 이어지므로 날짜 순서대로 실행
+
+    Args:
+        current_date: 처리 날짜 (YYMMDD)
+        raw_data: 미리 읽은 원본 (read_raw_data() 결과, None이면 여기서 읽음)
+        raw_report: 미리 만든 원본 검증 보고서 (None이면 raw_data를 검증)
+        validation_mode: 데이터 검증 모드 ("full"/"sample", None이면 ValidationConfig.MODE)
+
+    Returns:
+        result_dict(리스팅 결과), upload_df, change_df(변경분, 미사용 시 None), write(결과 파일 생성 여부) dict
+    """
+    # 0. 원본 검증 (클렌징용으로 읽은 원본을 그대로 검사, 오류가 있으면 클렌징 전에 중단)
+    # 미리 읽은 현대 시트는 클렌징 프로세스 풀에 그대로 넘김 (검증을 끄면 워커에서 직접 읽음)
+    if raw_data is None and ValidationConfig.ENABLED:
+        raw_data = read_raw_data(current_date)
+    if raw_report is None:
+        raw_report = validate_raw_data(raw_data, validation_mode)
+    raise_on_errors(raw_report)
+
+    # 1. 통합 클렌징
+    print(f"\n📋 1단계: 통합 클렌징 시작...")
+    cleaned_df = clean_all_data(raw_data)
+    print(f"✅ 클렌징 완료: {len(cleaned_df)}대")
+    save_rule_stats(current_date)
+    save_color_review(current_date)
+    save_validation_report([raw_report, validate_cleansed_data(cleaned_df, validation_mode)], current_date)
+
+    # 스냅샷 저장 및 key_admin별 재고 소진 속도 분석 (과거 스냅샷 포함)
+    velocity_df = None
+    if VelocityConfig.ENABLED:
+        save_snapshot(cleaned_df, current_date)
+        velocity_df = compute_velocity(load_stock_history(), as_of=current_date)
+
+    # 2. 통합 리스팅
+    print(f"\n📋 2단계: 통합 리스팅 시작...")
+    result_dict = listing_main(cleaned_df, velocity_df=velocity_df)
+    if BestOfferConfig.ENABLED:
+        result_dict["best"] = select_best_offers(result_dict["filtered"])
+    print(f"✅ 리스팅 완료")
+
+    upload_df = build_upload_df(result_dict["filtered"])
+    change_df = publish_delta(upload_df, current_date) if PublishConfig.DELTA_ENABLED else None
+    write = True
+    if change_df is not None and change_df.empty and PublishConfig.SKIP_UNCHANGED_WORKBOOK:
+        print(f"\n⏭️ 마지막 게시 대비 변경분이 없어 결과 파일 생성을 건너뜁니다.")
+        write = False
+    return {"result_dict": result_dict, "upload_df": upload_df, "change_df": change_df, "write": write}
+
 
+def finish_results(current_date, prepared):
+    """결과 파일 생성 후 단계 (게시 상태 저장, 업로드, 퍼지 매칭 어휘 반영)"""
+    if prepared["change_df"] is not None:
+        save_published_state(prepared["upload_df"], current_date)
 
-def create_final_result_file(date_str, result_dict):
-    """날짜가 붙은 최종 결과 파일 생성 (3개 시트: all, filtered, upload)"""
+    # upload 데이터를 카탈로그 엔드포인트로 전송 (설정된 경우)
+    if UploadConfig.ENABLED:
+        print(f"\n📋 4단계: 업로드...")
+        upload_rows(prepared["upload_df"], current_date)
+
+    # 이번 실행의 정상 추출 결과를 퍼지 매칭 어휘에 반영
+    update_vocabulary(prepared["result_dict"]["all"], current_date)
+
+
+def create_final_result_file(date_str, result_dict, fingerprint=None):
+    """날짜가 붙은 최종 결과 파일 생성 (all, filtered, upload, exclusions, summary 시트, 입력 지문 기록)"""
     from src.config.constants import FilePaths
     from datetime import datetime
 
@@ -137,7 +301,9 @@ def create_final_result_file(date_str, result_dict):
     output_filename = FilePaths.get_results_file("filtered", date_str)
 
     # ExcelWriter 옵션 설정 (Excel 호환성 향상)
+    prepare_output_path(output_filename)
     with pd.ExcelWriter(output_filename, engine='openpyxl', mode='w') as writer:
+        stamp_fingerprint(writer.book, fingerprint)
         # all 시트: 전체 데이터 (필터 없음)
         result_dict["all"].to_excel(writer, sheet_name='all', index=False)
         print(f"   ✅ all 시트 생성: {len(result_dict['all'])}대")
@@ -147,34 +313,45 @@ def create_final_result_file(date_str, result_dict):
         print(f"   ✅ filtered 시트 생성: {len(result_dict['filtered'])}대")
 
         # upload 시트: 업로드용 데이터 (선택 컬럼만)
-        upload_columns = [
-            "code_sales_a",
-            "code_sales_b",
-            "code_color_a",
-            "code_color_b",
-            "request",
-            "stock",
-            "company",
-            "model",
-            "trim",
-            "year",
-            "fuel",
-            "options",
-            "wheel_tire",
-            "color_exterior",
-            "color_interior",
-            "price"
-        ]
-
-        # 존재하는 컬럼만 선택
-        available_columns = [col for col in upload_columns if col in result_dict["filtered"].columns]
-        upload_df = result_dict["filtered"][available_columns].copy()
+        upload_df = build_upload_df(result_dict["filtered"])
         upload_df.to_excel(writer, sheet_name='upload', index=False)
         print(f"   ✅ upload 시트 생성: {len(upload_df)}대, {len(upload_df.columns)}개 컬럼")
 
+        # exclusions 시트: 제외 사유 × 모델별 집계
+        if "exclusions" in result_dict:
+            result_dict["exclusions"].to_excel(writer, sheet_name='exclusions', index=False)
+            print(f"   ✅ exclusions 시트 생성: {len(result_dict['exclusions'])}개 모델")
+
+        # summary 시트: company/model/trim/fuel별 재고·가격 요약과 필터 단계별 통과 대수
+        if "summary" in result_dict:
+            result_dict["summary"].to_excel(writer, sheet_name='summary', index=False)
+            print(f"   ✅ summary 시트 생성: {len(result_dict['summary']) - 1}개 그룹")
+
+        # velocity 시트: key_admin별 재고 소진 속도
+        if "velocity" in result_dict:
+            result_dict["velocity"].to_excel(writer, sheet_name='velocity', index=False)
+            print(f"   ✅ velocity 시트 생성: {len(result_dict['velocity'])}개 key_admin")
+
+        # best 시트: key_admin별 최저가 차량
+        if "best" in result_dict:
+            result_dict["best"].to_excel(writer, sheet_name='best', index=False)
+            print(f"   ✅ best 시트 생성: {len(result_dict['best'])}대")
+
     print(f"✅ 결과 파일 생성 완료: {output_filename}")
     print(f"📊 전체 차량: {len(result_dict['all'])}대, 필터링된 차량: {len(result_dict['filtered'])}대")
 
+    # 기본 프로필 외의 리스팅 프로필은 프로필별 파일로 저장 (filtered, upload 시트)
+    for profile_name, profile_df in result_dict.get("profiles", {}).items():
+        if profile_name == ListingProfiles.DEFAULT:
+            continue
+        profile_filename = FilePaths.get_results_file("filtered", date_str, profile=profile_name)
+        prepare_output_path(profile_filename)
+        with pd.ExcelWriter(profile_filename, engine='openpyxl', mode='w') as writer:
+            stamp_fingerprint(writer.book, fingerprint)
+            profile_df.to_excel(writer, sheet_name='filtered', index=False)
+            build_upload_df(profile_df).to_excel(writer, sheet_name='upload', index=False)
+        print(f"✅ 프로필 [{profile_name}] 결과 파일 생성: {profile_filename} ({len(profile_df)}대)")
+
 
 if __name__ == "__main__":
     main()
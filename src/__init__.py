@@ -1 +1,5 @@
 # Stock Management Project - Source Package
+from .utils.pandas_options import enable_copy_on_write
+
+# 클렌징 → 리스팅 사이의 불필요한 복사를 막기 위해 Copy-on-Write 사용
+enable_copy_on_write()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+스냅샷 저장소 모듈
+날짜별 통합 클렌징 결과(data/snapshots/cleansed_YYMMDD.pkl)와
+key_admin별 재고 합계 이력(data/snapshots/stock_history.pkl)을 관리
+
+재고 이력은 (date, key_admin, stock) 긴 형식 한 파일로 유지하여
+1년치 일별 스냅샷도 한 번에 읽을 수 있게 함
+
+사용법 (과거 결과 파일의 all 시트로 스냅샷 채우기):
+    python -m src.analytics.snapshots --backfill
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.config.constants import FilePaths
+
+
+SNAPSHOT_PATTERN = re.compile(r"cleansed_(\d{6})\.pkl$")
+RESULTS_PATTERN = re.compile(r"stock_filtered_(\d{6})\.xlsx$")
+HISTORY_COLUMNS = ["date", "key_admin", "stock"]
+HISTORY_DTYPES = {"date": str, "key_admin": str, "stock": "int64"}
+
+
+def summarize_stock(df, date_str):
+    """key_admin별 재고 합계 (재고는 정수 변환, 변환 불가 값은 0)"""
+    stock = pd.to_numeric(df["stock"], errors="coerce").fillna(0).astype(int)
+    summary = stock.groupby(df["key_admin"].to_numpy(), sort=True).sum()
+    return pd.DataFrame(
+        {"date": date_str, "key_admin": summary.index, "stock": summary.to_numpy()}
+    )
+
+
+def load_stock_history():
+    """재고 이력 로드 (없으면 빈 데이터프레임)"""
+    if os.path.exists(FilePaths.STOCK_HISTORY):
+        return pd.read_pickle(FilePaths.STOCK_HISTORY)
+    return pd.DataFrame(columns=HISTORY_COLUMNS).astype(HISTORY_DTYPES)
+
+
+def update_stock_history(stock_df, date_str):
+    """재고 이력에서 해당 날짜를 교체하여 저장 (날짜 순 정렬)"""
+    history = load_stock_history()
+    history = pd.concat([history[history["date"] != date_str], stock_df], ignore_index=True)
+    # 빈 이력(object 컬럼)과 합쳐도 재고는 정수형으로 유지 (velocity 피벗 시 다운캐스트 경고 방지)
+    history = history.astype({"stock": "int64"})
+    history = history.sort_values(["date", "key_admin"], kind="stable", ignore_index=True)
+    os.makedirs(FilePaths.SNAPSHOTS_DIR, exist_ok=True)
+    history.to_pickle(FilePaths.STOCK_HISTORY)
+    return history
+
+
+def save_snapshot(cleaned_df, date_str):
+    """
+    통합 클렌징 결과를 날짜별 스냅샷으로 저장하고 재고 이력 갱신
+
+    Args:
+        cleaned_df: 통합 클렌징 데이터프레임 (key_admin, stock 컬럼 포함)
+        date_str: 처리 날짜 (YYMMDD)
+    """
+    os.makedirs(FilePaths.SNAPSHOTS_DIR, exist_ok=True)
+    cleaned_df.to_pickle(FilePaths.get_snapshot_file(date_str))
+    update_stock_history(summarize_stock(cleaned_df, date_str), date_str)
+    print(f"💾 스냅샷 저장: {FilePaths.get_snapshot_file(date_str)}")
+
+
+def ensure_snapshot(date_str):
+    """
+    기존 결과 파일을 재사용한 날짜의 스냅샷과 재고 이력 보장
+
+    스냅샷이 없으면 결과 파일의 all 시트로 만들고, 재고 이력에 날짜가 없으면 스냅샷으로 채움
+    """
+    history = load_stock_history()
+    has_history = (history["date"] == date_str).any()
+    if os.path.exists(FilePaths.get_snapshot_file(date_str)):
+        if not has_history:
+            update_stock_history(summarize_stock(load_snapshot(date_str), date_str), date_str)
+        return
+    all_df = pd.read_excel(FilePaths.get_results_file("filtered", date_str), sheet_name="all")
+    save_snapshot(all_df, date_str)
+
+
+def list_snapshot_dates():
+    """저장된 클렌징 스냅샷 날짜 목록 (오름차순)"""
+    pattern = os.path.join(FilePaths.SNAPSHOTS_DIR, "cleansed_*.pkl")
+    dates = []
+    for path in glob.glob(pattern):
+        match = SNAPSHOT_PATTERN.search(os.path.basename(path))
+        if match:
+            dates.append(match.group(1))
+    return sorted(dates)
+
+
+def load_snapshot(date_str):
+    """날짜별 클렌징 스냅샷 로드"""
+    return pd.read_pickle(FilePaths.get_snapshot_file(date_str))
+
+
+def backfill_snapshots():
+    """스냅샷이 없는 날짜의 과거 결과 파일(all 시트)로 스냅샷 생성"""
+    existing = set(list_snapshot_dates())
+    pattern = os.path.join(FilePaths.RESULTS_DIR, "stock_filtered_*.xlsx")
+    added = []
+    for path in sorted(glob.glob(pattern)):
+        match = RESULTS_PATTERN.search(os.path.basename(path))
+        if not match or match.group(1) in existing:
+            continue
+        all_df = pd.read_excel(path, sheet_name="all")
+        save_snapshot(all_df, match.group(1))
+        added.append(match.group(1))
+    print(f"✅ 스냅샷 채우기 완료: {len(added)}개 날짜 추가")
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스냅샷 저장소 관리")
+    parser.add_argument("--backfill", action="store_true", help="과거 결과 파일로 스냅샷 채우기")
+    args = parser.parse_args()
+
+    if args.backfill:
+        backfill_snapshots()
+    dates = list_snapshot_dates()
+    print(f"📚 저장된 스냅샷: {len(dates)}개" + (f" ({dates[0]} ~ {dates[-1]})" if dates else ""))
+
+
+if __name__ == "__main__":
+    main()
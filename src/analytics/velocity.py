@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+재고 소진 속도 분석 모듈
+재고 이력(날짜 × key_admin)으로 key_admin별 재고 변화량, 최근 기간 일평균 소진량,
+재고 소진 예상 일수(days of supply)를 계산
+
+- 재고 감소분만 소진으로 집계 (입고로 인한 증가는 0)
+- 스냅샷 간격이 일정하지 않아도 실제 경과 일수로 나누어 일평균 계산
+- 날짜 × key_admin 행렬에 시간 기준 rolling 창을 한 번에 적용
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.analytics.snapshots import ensure_snapshot, load_stock_history
+from src.config.constants import VelocityConfig
+
+
+VELOCITY_COLUMNS = [
+    "key_admin",
+    "stock",
+    "stock_delta",
+    "depleted_units",
+    "window_days",
+    "depletion_per_day",
+    "days_of_supply",
+    "snapshots",
+]
+
+
+def compute_velocity(history, as_of=None, window_days=None):
+    """
+    key_admin별 소진 속도 계산 (기준일 스냅샷에 있는 key_admin만)
+
+    Args:
+        history: load_stock_history() 결과 (date, key_admin, stock)
+        as_of: 기준일 (YYMMDD, None이면 마지막 날짜)
+        window_days: rolling 창 크기 (일, None이면 VelocityConfig.WINDOW_DAYS)
+
+    Returns:
+        VELOCITY_COLUMNS 데이터프레임 (일평균 소진량 내림차순)
+        - stock_delta: 직전 스냅샷 대비 재고 변화량
+        - depleted_units / window_days: 창 안의 소진 대수와 경과 일수
+        - days_of_supply: 현재 재고 / 일평균 소진량 (소진 없으면 inf, 이력이 1개뿐이면 빈 값)
+    """
+    if window_days is None:
+        window_days = VelocityConfig.WINDOW_DAYS
+    if as_of is not None:
+        history = history[history["date"] <= as_of]
+    if history.empty:
+        return pd.DataFrame(columns=VELOCITY_COLUMNS)
+
+    latest = history["date"].max()
+    wide = history.pivot_table(
+        index="date", columns="key_admin", values="stock", aggfunc="sum", fill_value=0
+    ).sort_index()
+    wide.index = pd.to_datetime(wide.index, format="%y%m%d")
+
+    # 스냅샷 사이 재고 감소분 = 소진, 경과 일수는 날짜 간격
+    delta = wide.diff()
+    depleted = (-delta).clip(lower=0).fillna(0)
+    gap_days = wide.index.to_series().diff().dt.days.fillna(0)
+
+    window = f"{window_days}D"
+    depleted_sum = depleted.rolling(window).sum().iloc[-1]
+    days_sum = gap_days.rolling(window).sum().iloc[-1]
+
+    keys = history.loc[history["date"] == latest, "key_admin"].unique()
+    stock = wide.iloc[-1].reindex(keys)
+    result = pd.DataFrame(
+        {
+            "key_admin": keys,
+            "stock": stock.to_numpy(),
+            "stock_delta": delta.iloc[-1].reindex(keys).to_numpy(),
+            "depleted_units": depleted_sum.reindex(keys).to_numpy(),
+            "window_days": days_sum,
+            "snapshots": history["key_admin"].value_counts().reindex(keys).to_numpy(),
+        }
+    )
+
+    if days_sum > 0:
+        rate = result["depleted_units"] / days_sum
+        result["depletion_per_day"] = rate
+        days_of_supply = (result["stock"] / rate.where(rate > 0)).fillna(np.inf)
+        result["days_of_supply"] = days_of_supply.where(result["snapshots"] >= 2)
+    else:
+        result["depletion_per_day"] = np.nan
+        result["days_of_supply"] = np.nan
+
+    result = result.sort_values(
+        ["depletion_per_day", "key_admin"], ascending=[False, True], kind="stable", ignore_index=True
+    )
+    return result[VELOCITY_COLUMNS].round({"depletion_per_day": 3, "days_of_supply": 1})
+
+
+def map_days_of_supply(df, velocity_df):
+    """행별 재고 소진 예상 일수 배열 (분석 결과에 없는 key_admin은 NaN)"""
+    days_of_supply = velocity_df.set_index("key_admin")["days_of_supply"]
+    return df["key_admin"].map(days_of_supply).to_numpy(dtype=float)
+
+
+def rewrite_velocity_sheet(path, date_str):
+    """
+    다른 날짜의 결과 파일을 재사용한 경우 velocity 시트만 이 날짜 재고 이력 기준으로 다시 작성
+
+    나머지 시트는 원본/규칙/설정이 같으면 날짜와 무관하므로 그대로 둠
+    (스냅샷과 재고 이력은 재사용한 all 시트로 먼저 채움)
+    """
+    ensure_snapshot(date_str)
+    velocity_df = compute_velocity(load_stock_history(), as_of=date_str)
+    with pd.ExcelWriter(path, engine="openpyxl", mode="a", if_sheet_exists="replace") as writer:
+        velocity_df.to_excel(writer, sheet_name="velocity", index=False)
+    print(f"📉 velocity 시트 다시 작성: {len(velocity_df)}개 key_admin ({path})")
+    return velocity_df
@@ -3,40 +3,222 @@ import pandas as pd
 import re
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.cleansing.common import extract_year, initialize_base_columns, reorder_cleansing_columns, clean_text
-from src.config.constants import FilePaths
+from src.cleansing.rule_stats import (
+    Rule,
+    register_chain,
+    match_rule,
+    record_result,
+    reset_rule_stats,
+    get_rule_stats,
+    merge_rule_stats,
+)
+from src.cleansing.excel_readers import open_excel, select_engine
+from src.cleansing.raw_layouts import list_target_sheets, read_raw_sheet
+from src.cleansing.sheet_cache import (
+    get_sheet_cache_keys,
+    is_sheet_cached,
+    load_cached_sheets,
+    save_cached_sheets,
+)
+from src.config.constants import FilePaths, ParallelConfig, RuleStatsConfig, SheetCacheConfig
 
 
-def clean_data():
-    """재고 데이터를 로드하고 전처리하는 함수"""
+# 모델명 패턴 (원본 순서 = 우선순위)
+MODEL_RULES = register_chain("hyundai_model", [
+    Rule("팰리세이드", "디 올 뉴 팰리세이드", ("팰리세이드",)),
+    Rule("싼타페", "싼타페", ("싼타페",)),
+    Rule("아이오닉9", "아이오닉9", ("아이오닉9",)),
+    Rule("아반떼", "아반떼", ("아반떼",)),
+    Rule("캐스퍼", "캐스퍼", ("캐스퍼",)),
+    Rule("그랜저", "그랜저", ("그랜저",)),
+    Rule("투싼", "투싼", ("투싼",)),
+    Rule("쏘나타", "쏘나타", ("쏘나타",)),
+    Rule("스타리아", "스타리아", ("스타리아",)),
+    Rule("GV70", "GV70", ("GV70",)),
+])
+
+# 연료 패턴 (원본 순서 = 우선순위)
+FUEL_RULES = register_chain("hyundai_fuel", [
+    Rule("전기모터", "전기", ("전기모터",)),
+    Rule("하이브리드", "하이브리드", ("하이브리드",)),
+    Rule("LPi", "LPI", ("LPi",)),
+    Rule("가솔린", "가솔린", ("가솔린",)),
+])
+
+
+# 원본에서 읽는 컬럼 + 시트명(model_raw) (원본 위치는 raw_layouts의 현대 레이아웃)
+CLEANSED_COLUMNS = ["code_sales_a", "code_sales_b", "code_color_a", "code_color_b", "request", "stock", "trim_raw", "options", "color_exterior", "color_interior", "price", "model_raw"]
+
+
+def clean_data(raw_sheets=None, file_path=None):
+    """
+    재고 데이터를 로드하고 전처리하는 함수
+
+    Args:
+        raw_sheets: read_raw_sheets()로 미리 읽은 시트 (없는 시트는 원본에서 읽음)
+        file_path: 원본 파일 (None이면 오늘 날짜의 기본 파일, 지점별 파일 처리 시 지정)
+    """
     print("재고 데이터 로드 및 전처리 시작...")
     
     # 데이터 로드 및 정리
-    file_path = FilePaths.get_hyundai_raw_file()
-    df_raw = pd.read_excel(file_path, sheet_name=None)
+    if file_path is None:
+        file_path = FilePaths.get_hyundai_raw_file()
+    engine = select_engine(file_path, "hyundai")
+    sheet_names = get_model_sheet_names(file_path, engine)
+
+    # 내용이 바뀌지 않은 시트는 캐시된 클렌징 결과 재사용
+    cache_keys = get_sheet_cache_keys(file_path, sheet_names) if SheetCacheConfig.ENABLED else {}
+    results = load_cached_sheets(cache_keys)
+    pending = [sheet for sheet in sheet_names if sheet not in results]
+    if results:
+        print(f"♻️ 시트 캐시 재사용: {len(results)}개 시트 (새로 처리 {len(pending)}개)")
+
+    workers = resolve_worker_count(len(pending))
+    if workers > 1:
+        # 차종별 시트를 프로세스 풀에서 병렬로 클렌징 (미리 읽은 시트는 그대로 넘기고, 없는 시트는 워커에서 읽음)
+        print(f"⚡ 시트 병렬 처리: {len(pending)}개 시트, {workers}개 프로세스")
+        fresh = clean_sheets_parallel(file_path, pending, workers, engine, raw_sheets)
+    else:
+        fresh = clean_sheets_sequential(file_path, pending, engine, raw_sheets)
+    save_cached_sheets(cache_keys, fresh)
+    results.update(fresh)
+
+    # 원본 시트 순서대로 합치고 시트별 규칙 적중 집계 합산
     df_list = []
-    for sheet, df in df_raw.items():
-        if "조건" not in sheet:
-            df = df.assign(시트명=sheet)  # 시트명을 컬럼으로 추가
-            df_list.append(df)
+    for sheet in sheet_names:
+        sheet_df, stats = results[sheet]
+        merge_rule_stats(stats)
+        df_list.append(sheet_df)
     df = pd.concat(df_list, ignore_index=True)
-    df = df.dropna(subset=["가격"])
+
+    print(f"✅ 현대차 전처리 완료! {len(df)}개 차량 데이터")
+    print(f"📊 컬럼 구성: {len(df.columns)}개 필드")  # type: ignore
+    return df
+
+
+def read_raw_sheets(file_path, engine=None, coerce=True):
+    """
+    차종별 시트를 레이아웃 컬럼만 미리 읽는 함수 (클렌징 없음, 시트 캐시에 있는 시트는 건너뜀)
+
+    Args:
+        coerce: False면 숫자 컬럼을 원본 값 그대로 (데이터 검증용)
+
+    Returns:
+        시트 이름 -> 레이아웃 데이터프레임 (model_raw = 시트명) dict
+    """
+    if engine is None:
+        engine = select_engine(file_path, "hyundai")
+    sheet_names = get_model_sheet_names(file_path, engine)
+    if SheetCacheConfig.ENABLED:
+        cache_keys = get_sheet_cache_keys(file_path, sheet_names)
+        sheet_names = [sheet for sheet in sheet_names if not is_sheet_cached(cache_keys.get(sheet))]
+    with open_excel(file_path, "hyundai", engine) as book:
+        return {
+            sheet: read_raw_sheet(book, sheet, "hyundai", coerce).assign(model_raw=sheet)
+            for sheet in sheet_names
+        }
+
+
+def get_model_sheet_names(file_path, engine=None):
+    """차종별 시트 이름 목록 (조건 시트 제외, 원본 순서)"""
+    with open_excel(file_path, "hyundai", engine) as book:
+        return list_target_sheets("hyundai", book.sheet_names)
+
+
+def resolve_worker_count(sheet_count):
+    """병렬 처리 프로세스 수 결정 (0 = CPU 코어 수, 시트 수를 넘지 않음)"""
+    workers = ParallelConfig.HYUNDAI_WORKERS or os.cpu_count() or 1
+    return max(1, min(workers, sheet_count))
+
+
+def clean_sheet(file_path, sheet_name, rule_settings, engine, raw_df=None):
+    """
+    시트 하나를 읽고 클렌징하는 함수 (프로세스 풀 작업 단위)
+
+    Args:
+        file_path: 현대 원본 파일 경로 또는 zip 번들 항목
+        sheet_name: 차종 시트 이름 (model_raw가 됨)
+        rule_settings: 부모 프로세스의 (RuleStatsConfig.ENABLED, REORDER, RECORD_OVERLAPS)
+        engine: 부모 프로세스에서 선택한 엑셀 엔진 (작업마다 벤치마크하지 않음)
+        raw_df: 부모 프로세스에서 미리 읽은 시트 (None이면 원본에서 읽음)
+
+    Returns:
+        (클렌징된 데이터프레임, 이 시트의 규칙 적중 집계)
+    """
+    RuleStatsConfig.ENABLED, RuleStatsConfig.REORDER, RuleStatsConfig.RECORD_OVERLAPS = rule_settings
+    reset_rule_stats()
+    if raw_df is None:
+        with open_excel(file_path, "hyundai", engine) as book:
+            raw_df = read_raw_sheet(book, sheet_name, "hyundai").assign(model_raw=sheet_name)
+    return cleanse_raw_data(raw_df), get_rule_stats()
+
+
+def clean_sheets_parallel(file_path, sheet_names, workers, engine, raw_sheets=None):
+    """
+    차종별 시트를 병렬로 클렌징하는 함수
+
+    Args:
+        raw_sheets: 미리 읽은 시트 (검증을 위해 미리 읽은 경우, 없는 시트는 워커에서 읽음)
+
+    Returns:
+        시트 이름 -> (클렌징된 데이터프레임, 규칙 적중 집계) dict
+    """
+    rule_settings = (RuleStatsConfig.ENABLED, RuleStatsConfig.REORDER, RuleStatsConfig.RECORD_OVERLAPS)
+    raw_sheets = raw_sheets or {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            sheet_name: executor.submit(
+                clean_sheet, file_path, sheet_name, rule_settings, engine, raw_sheets.get(sheet_name)
+            )
+            for sheet_name in sheet_names
+        }
+        return {sheet_name: future.result() for sheet_name, future in futures.items()}
+
+
+def clean_sheets_sequential(file_path, sheet_names, engine, raw_sheets=None):
+    """
+    차종별 시트를 현재 프로세스에서 하나씩 클렌징하는 함수 (시트별 규칙 적중 집계를 따로 보관)
+
+    Args:
+        raw_sheets: 미리 읽은 시트 (없는 시트만 원본에서 읽음)
+
+    Returns:
+        시트 이름 -> (클렌징된 데이터프레임, 규칙 적중 집계) dict
+    """
+    raw_sheets = dict(raw_sheets or {})
+    missing = [sheet for sheet in sheet_names if sheet not in raw_sheets]
+    if missing:
+        with open_excel(file_path, "hyundai", engine) as book:
+            for sheet_name in missing:
+                # 시트명을 컬럼으로 추가
+                raw_sheets[sheet_name] = read_raw_sheet(book, sheet_name, "hyundai").assign(model_raw=sheet_name)
+
+    results = {}
+    totals = get_rule_stats()
+    for sheet_name in sheet_names:
+        reset_rule_stats()
+        results[sheet_name] = (cleanse_raw_data(raw_sheets[sheet_name]), get_rule_stats())
+    reset_rule_stats()
+    merge_rule_stats(totals)
+    return results
+
+
+def cleanse_raw_data(df):
+    """레이아웃으로 읽은 시트 데이터(model_raw = 시트명 포함)에 클렌징 규칙을 적용하는 함수"""
+    df = df.dropna(subset=["price"])
     
-    # 컬럼 정리 - 새로운 현대 데이터 구조에 맞게 수정
-    df = df[["판매코드", "Unnamed: 2", "칼라코드", "Unnamed: 4", "요청", "재고", "차종", "옵션", "외/내장칼라", "Unnamed: 10", "가격", "시트명"]]
-    df.columns = ["code_sales_a", "code_sales_b", "code_color_a", "code_color_b", "request", "stock", "trim_raw", "options", "color_exterior", "color_interior", "price", "model_raw"]  # type: ignore
+    # 컬럼 정리 (가격 없는 행 = 두 번째 헤더/빈 행 제외)
+    df = df[CLEANSED_COLUMNS]
 
     # 기본 필드들 초기화 (공통 함수 사용)
     df = initialize_base_columns(df, "현대")
     
     # 클렌징 규칙 적용
-    df = apply_cleansing_rules(df)
-
-    print(f"✅ 현대차 전처리 완료! {len(df)}개 차량 데이터")
-    print(f"📊 컬럼 구성: {len(df.columns)}개 필드")  # type: ignore
-    return df
+    return apply_cleansing_rules(df)
 
 
 def apply_cleansing_rules(df):
@@ -53,6 +235,7 @@ def apply_cleansing_rules(df):
         
         # 트림 추출 (모델별로 구분)
         df.at[idx, "trim"] = extract_trim_by_model(raw_trim, sheet_name)
+        record_result("hyundai_trim", df.at[idx, "trim"])
         
         # 연료 추출
         df.at[idx, "fuel"] = extract_fuel(raw_trim)
@@ -78,18 +261,12 @@ def apply_cleansing_rules(df):
     return df
 
 
-def extract_model_from_raw_model(raw_model):
+def extract_model_from_raw_model(raw_model, record=True):
     """Raw_모델에서 특정 케이스 규칙에 따라 모델 정보를 추출하는 함수"""
     # 모델명 패턴 매칭
-    model_patterns = [
-        "팰리세이드", "싼타페", "아이오닉9", "아반떼", "캐스퍼", "그랜저", "투싼", "쏘나타", "스타리아", "GV70"
-    ]
-    
-    for pattern in model_patterns:
-        if pattern in raw_model:
-            if pattern == "팰리세이드":
-                return "디 올 뉴 팰리세이드"
-            return pattern
+    rule = match_rule("hyundai_model", MODEL_RULES, raw_model, record=record)
+    if rule is not None:
+        return rule.result
     
     return "?"
 
@@ -97,7 +274,7 @@ def extract_model_from_raw_model(raw_model):
 def extract_trim_by_model(raw_trim, sheet_name):
     """모델별로 트림 정보를 추출하는 함수"""
     # sheet_name에서 모델 정보 추출
-    model = extract_model_from_raw_model(sheet_name)
+    model = extract_model_from_raw_model(sheet_name, record=False)
     
     if model == "디 올 뉴 팰리세이드":
         # 팰리세이드는 연료타입 + 트림 조합으로 처리
@@ -213,14 +390,9 @@ def extract_trim_by_model(raw_trim, sheet_name):
 
 def extract_fuel(raw_model):
     """연료 정보를 추출하는 함수"""
-    if "전기모터" in raw_model:
-        return "전기"
-    elif "하이브리드" in raw_model:
-        return "하이브리드"
-    elif "LPi" in raw_model:
-        return "LPI"
-    elif "가솔린" in raw_model:
-        return "가솔린"
+    rule = match_rule("hyundai_fuel", FUEL_RULES, raw_model)
+    if rule is not None:
+        return rule.result
     else:
         return "?"
 
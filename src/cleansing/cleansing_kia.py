@@ -12,9 +12,39 @@ from src.cleansing.common import (
     reorder_cleansing_columns,
     clean_text,
 )
+from src.cleansing.rule_stats import Rule, register_chain, match_rule, record_result
+from src.cleansing.excel_readers import open_excel
+from src.cleansing.raw_layouts import read_raw_sheet
 from src.config.constants import FilePaths
 
 
+# 차종 → 모델 패턴 (원본 순서 = 우선순위, 일치한 패턴은 trim_raw에서 제거)
+MODEL_RULES = register_chain("kia_model", [
+    Rule("봉고", "봉고", ("봉고",)),
+    Rule("EV4", "EV4", ("EV4",)),
+    Rule("EV6", "EV6", ("EV6",)),
+    Rule("EV9", "EV9", ("EV9",)),
+    Rule("K5", "K5", ("K5",)),
+    Rule("타스만", "타스만", ("타스만",)),
+    Rule("니로", "니로", ("니로",)),
+    Rule("EV3", "EV3", ("EV3",)),
+    Rule("K8", "K8", ("K8",)),
+    Rule("K9", "K9", ("K9",)),
+    Rule("쏘렌토", "쏘렌토", ("쏘렌토",)),
+    Rule("카니발", "카니발", ("카니발",)),
+    Rule("1 1/4톤 샤시", "봉고", ("1 1/4톤 샤시",)),
+])
+
+# 연료 패턴 (원본 순서 = 우선순위)
+FUEL_RULES = register_chain("kia_fuel", [
+    Rule("LPI", "LPI", ("LPI",), True),
+    Rule("전기", "전기", ("전기모터", "EV")),
+    Rule("LPG", "LPG", ("LPG",)),
+    Rule("하이브리드", "하이브리드", ("하이브리드", "HEV")),
+    Rule("가솔린", "가솔린", ("가솔린", "T/GDI", "GSL")),
+])
+
+
 def extract_drive_and_seating(raw_trim):
     """구동방식과 인승 정보를 추출하는 함수"""
     drive_type = "2WD"
@@ -36,88 +66,57 @@ def extract_drive_and_seating(raw_trim):
     return drive_type, seating
 
 
-def clean_data():
-    """기아차 재고 데이터를 로드하고 전처리하는 함수"""
-    file_path = FilePaths.get_kia_raw_file()
-    df_raw = pd.read_excel(file_path, sheet_name=None)
-    df = df_raw["sheet1"]
-
-    df = df.iloc[1:].reset_index(drop=True)
-    df = df.dropna(subset=["가격"])
-
-    df = df[
-        [
-            "판매코드",
-            "Unnamed: 1",
-            "칼라코드",
-            "Unnamed: 3",
-            "요청",
-            "재고",
-            "차종",
-            "옵션",
-            "외/내장칼라",
-            "Unnamed: 9",
-            "가격",
-        ]
-    ]
-    df.columns = ["code_sales_a", "code_sales_b", "code_color_a", "code_color_b", "request", "stock", "model_raw", "options", "color_exterior", "color_interior", "price"]  # type: ignore
+# 원본에서 읽는 컬럼 (원본 위치는 raw_layouts의 기아 레이아웃)
+CLEANSED_COLUMNS = ["code_sales_a", "code_sales_b", "code_color_a", "code_color_b", "request", "stock", "model_raw", "options", "color_exterior", "color_interior", "price"]
 
-    df["trim_raw"] = ""
 
-    # 기본 필드들 초기화 (공통 함수 사용)
-    df = initialize_base_columns(df, "기아")
+def clean_data(raw_df=None, file_path=None):
+    """
+    기아차 재고 데이터를 로드하고 전처리하는 함수
 
-    df = apply_cleansing_rules(df)
+    Args:
+        raw_df: read_raw_data()로 미리 읽은 sheet1 (None이면 원본에서 읽음)
+        file_path: 원본 파일 (None이면 오늘 날짜의 기본 파일, 지점별 파일 처리 시 지정)
+    """
+    if raw_df is None:
+        raw_df = read_raw_data(file_path or FilePaths.get_kia_raw_file())
+
+    df = cleanse_raw_data(raw_df)
 
     print(f"✅ 기아차 전처리 완료! {len(df)}개 차량 데이터")
     print(f"📊 컬럼 구성: {len(df.columns)}개 필드")  # type: ignore
     return df
 
 
+def read_raw_data(file_path, coerce=True):
+    """기아 원본 sheet1을 레이아웃 컬럼만 읽는 함수 (클렌징 없음, coerce=False면 숫자 컬럼을 원본 값 그대로)"""
+    with open_excel(file_path, "kia") as book:
+        return read_raw_sheet(book, "sheet1", "kia", coerce)
+
+
+def cleanse_raw_data(df):
+    """레이아웃으로 읽은 sheet1 데이터에 클렌징 규칙을 적용하는 함수 (가격 없는 행 = 헤더/빈 행 제외)"""
+    df = df.dropna(subset=["price"])
+
+    df = df[CLEANSED_COLUMNS]
+
+    df["trim_raw"] = ""
+
+    # 기본 필드들 초기화 (공통 함수 사용)
+    df = initialize_base_columns(df, "기아")
+
+    return apply_cleansing_rules(df)
+
+
 def apply_cleansing_rules(df):
     """기아차 클렌징 규칙을 적용하는 함수"""
     for idx, row in df.iterrows():
         raw_model = str(row["model_raw"]) if pd.notna(row["model_raw"]) else ""
 
-        if "봉고" in raw_model:
-            df.at[idx, "model"] = "봉고"
-            df.at[idx, "trim_raw"] = raw_model.replace("봉고", "").strip()
-        elif "EV4" in raw_model:
-            df.at[idx, "model"] = "EV4"
-            df.at[idx, "trim_raw"] = raw_model.replace("EV4", "").strip()
-        elif "EV6" in raw_model:
-            df.at[idx, "model"] = "EV6"
-            df.at[idx, "trim_raw"] = raw_model.replace("EV6", "").strip()
-        elif "EV9" in raw_model:
-            df.at[idx, "model"] = "EV9"
-            df.at[idx, "trim_raw"] = raw_model.replace("EV9", "").strip()
-        elif "K5" in raw_model:
-            df.at[idx, "model"] = "K5"
-            df.at[idx, "trim_raw"] = raw_model.replace("K5", "").strip()
-        elif "타스만" in raw_model:
-            df.at[idx, "model"] = "타스만"
-            df.at[idx, "trim_raw"] = raw_model.replace("타스만", "").strip()
-        elif "니로" in raw_model:
-            df.at[idx, "model"] = "니로"
-            df.at[idx, "trim_raw"] = raw_model.replace("니로", "").strip()
-        elif "EV3" in raw_model:
-            df.at[idx, "model"] = "EV3"
-            df.at[idx, "trim_raw"] = raw_model.replace("EV3", "").strip()
-        elif "K8" in raw_model:
-            df.at[idx, "model"] = "K8"
-            df.at[idx, "trim_raw"] = raw_model.replace("K8", "").strip()
-        elif "K9" in raw_model:
-            df.at[idx, "model"] = "K9"
-            df.at[idx, "trim_raw"] = raw_model.replace("K9", "").strip()
-        elif "쏘렌토" in raw_model:
-            df.at[idx, "model"] = "쏘렌토"
-            df.at[idx, "trim_raw"] = raw_model.replace("쏘렌토", "").strip()
-        elif "카니발" in raw_model:
-            df.at[idx, "model"] = "카니발"
-            df.at[idx, "trim_raw"] = raw_model.replace("카니발", "").strip()
-        elif "1 1/4톤 샤시" in raw_model:
-            df.at[idx, "model"] = "봉고"
-            df.at[idx, "trim_raw"] = raw_model.replace("1 1/4톤 샤시", "").strip()
+        rule = match_rule("kia_model", MODEL_RULES, raw_model)
+        if rule is not None:
+            df.at[idx, "model"] = rule.result
+            df.at[idx, "trim_raw"] = raw_model.replace(rule.patterns[0], "").strip()
         else:
             df.at[idx, "model"] = "?"
             df.at[idx, "trim_raw"] = raw_model
@@ -127,6 +126,7 @@ def apply_cleansing_rules(df):
         raw_model = str(row["model_raw"]) if pd.notna(row["model_raw"]) else ""
 
         df.at[idx, "trim"] = extract_trim(raw_model, raw_trim)
+        record_result("kia_trim", df.at[idx, "trim"])
         df.at[idx, "fuel"] = extract_fuel(raw_model)
         df.at[idx, "year"] = extract_year(raw_model)
         wheel_tire, cleaned_option = extract_wheel_tire(row["options"])
@@ -363,16 +363,9 @@ def extract_trim(raw_model, raw_trim):
 
 def extract_fuel(raw_trim):
     """연료 정보를 추출하는 함수"""
-    if "LPI" in raw_trim.upper():
-        return "LPI"
-    elif "전기모터" in raw_trim or "EV" in raw_trim:
-        return "전기"
-    elif "LPG" in raw_trim:
-        return "LPG"
-    elif "하이브리드" in raw_trim or "HEV" in raw_trim:
-        return "하이브리드"
-    elif "가솔린" in raw_trim or "T/GDI" in raw_trim or "GSL" in raw_trim:
-        return "가솔린"
+    rule = match_rule("kia_fuel", FUEL_RULES, raw_trim)
+    if rule is not None:
+        return rule.result
     else:
         return "?"
 
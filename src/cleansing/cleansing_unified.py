@@ -5,8 +5,17 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.cleansing.cleansing_hyundai import clean_data as clean_hyundai_data
+from src.cleansing.cleansing_hyundai import read_raw_sheets as read_hyundai_raw_sheets
 from src.cleansing.cleansing_kia import clean_data as clean_kia_data
+from src.cleansing.cleansing_kia import read_raw_data as read_kia_raw_data
+from src.cleansing.color_codes import apply_color_dictionary, reset_color_review
 from src.cleansing.common import reorder_cleansing_columns
+from src.cleansing.rule_stats import reset_rule_stats
+from src.cleansing.fuzzy_match import apply_fuzzy_fallback
+from src.cleansing.raw_layouts import apply_brand_dtypes
+from src.cleansing.source_merge import merge_sources
+from src.config.constants import FilePaths
+from src.engine import get_engine
 
 
 def apply_common_cleansing(df):
@@ -20,27 +29,117 @@ def apply_common_cleansing(df):
     return df
 
 
-def clean_all_data():
-    """현대차와 기아차 데이터를 모두 클렌징하고 통합하는 함수"""
+def finalize_combined_data(combined_df, vocab=None):
+    """
+    통합된 데이터에 브랜드 공통 후처리를 적용하는 함수
+
+    Args:
+        combined_df: 현대/기아 클렌징 결과를 합친 데이터프레임
+        vocab: 퍼지 매칭 어휘 (None이면 저장된 어휘 사용)
+    """
+    # 모델/트림 "?" 행 퍼지 매칭 보완 (key 생성 전)
+    combined_df = apply_fuzzy_fallback(combined_df, vocab)
+
+    # 색상 코드 → 표준 색상명/계열 (사전에 없는 코드는 검토 파일용으로 집계)
+    combined_df = apply_color_dictionary(combined_df)
+    
+    # Key 컬럼 추가 (company_model_trim_year)
+    combined_df["key_admin"] = get_engine().build_key_admin(combined_df)
+    
+    # 공통 클렌징 로직 적용 (보조금 매칭, 비용 계산, 가격 매칭)
+    return apply_common_cleansing(combined_df)
+
+
+def read_raw_data(date_str):
+    """
+    날짜의 현대/기아 원본(지점별 파일 포함)을 클렌징 없이 미리 읽는 함수 (다른 날짜 클렌징과 겹쳐 실행)
+
+    숫자 컬럼은 원본 값 그대로 읽으므로 같은 데이터프레임을 validate_raw_data()로 검증할 수 있고,
+    레이아웃 타입 변환은 clean_all_data()에서 함
+
+    Returns:
+        {"hyundai": [(원본 파일, 시트 이름 -> 데이터프레임)], "kia": [(원본 파일, 데이터프레임)]}
+        (clean_all_data()의 raw_data)
+    """
+    return {
+        "hyundai": [
+            (path, read_hyundai_raw_sheets(path, coerce=False))
+            for path in FilePaths.get_hyundai_raw_files(date_str)
+        ],
+        "kia": [
+            (path, read_kia_raw_data(path, coerce=False)) for path in FilePaths.get_kia_raw_files(date_str)
+        ],
+    }
+
+
+def apply_raw_dtypes(raw_data):
+    """read_raw_data()로 읽은 원본의 숫자 컬럼을 레이아웃 타입으로 변환 (숫자가 아닌 값은 NaN)"""
+    return {
+        "hyundai": [
+            (path, None if sheets is None else {
+                sheet: apply_brand_dtypes(df, "hyundai") for sheet, df in sheets.items()
+            })
+            for path, sheets in raw_data["hyundai"]
+        ],
+        "kia": [
+            (path, None if df is None else apply_brand_dtypes(df, "kia")) for path, df in raw_data["kia"]
+        ],
+    }
+
+
+def clean_brand_sources(clean_data, sources, brand):
+    """
+    브랜드의 원본 파일별로 클렌징한 뒤 같은 차량을 병합하는 함수
+
+    Args:
+        clean_data: 브랜드 모듈의 clean_data(미리 읽은 원본, 파일 경로)
+        sources: (원본 파일, 미리 읽은 원본 또는 None) 리스트
+        brand: 통계 출력용 브랜드명
+    """
+    cleaned = []
+    for path, raw in sources:
+        if len(sources) > 1:
+            print(f"   📄 {path}")
+        cleaned.append((path, clean_data(raw, path)))
+    merged_df, _ = merge_sources(cleaned, brand=brand)
+    return merged_df
+
+
+def clean_all_data(raw_data=None):
+    """
+    현대차와 기아차 데이터를 모두 클렌징하고 통합하는 함수
+
+    같은 브랜드의 지점별 원본이 여러 개면 코드 키가 같은 차량을 한 행으로 병합
+    (SourceMergeConfig.POLICY)
+
+    Args:
+        raw_data: read_raw_data()로 미리 읽은 원본 (None이면 원본 파일에서 읽음)
+    """
     print("🚗 현대차 + 기아차 통합 클렌징 시작...")
+    reset_rule_stats()
+    reset_color_review()
+    if raw_data is None:
+        raw_data = {
+            "hyundai": [(path, None) for path in FilePaths.get_hyundai_raw_files()],
+            "kia": [(path, None) for path in FilePaths.get_kia_raw_files()],
+        }
+    else:
+        raw_data = apply_raw_dtypes(raw_data)
     
     # 1. 현대차 데이터 클렌징 (개별 처리)
     print("\n📋 현대차 데이터 처리 중...")
-    hyundai_df = clean_hyundai_data()
+    hyundai_df = clean_brand_sources(clean_hyundai_data, raw_data["hyundai"], "현대")
     
     # 2. 기아차 데이터 클렌징 (개별 처리)
     print("\n📋 기아차 데이터 처리 중...")
-    kia_df = clean_kia_data()
+    kia_df = clean_brand_sources(clean_kia_data, raw_data["kia"], "기아")
     
     # 3. 데이터 통합
     print("\n🔗 데이터 통합 중...")
     combined_df = pd.concat([hyundai_df, kia_df], ignore_index=True)
     
-    # 4. Key 컬럼 추가 (company_model_trim_year)
-    combined_df["key_admin"] = combined_df["company"] + "_" + combined_df["model"] + "_" + combined_df["trim"] + "_" + combined_df["year"]
-    
-    # 5. 공통 클렌징 로직 적용 (보조금 매칭, 비용 계산, 가격 매칭)
-    combined_df = apply_common_cleansing(combined_df)
+    # 4. 퍼지 매칭 보완, key 컬럼 추가, 공통 클렌징 로직 적용
+    combined_df = finalize_combined_data(combined_df)
     
     print(f"\n✅ 통합 클렌징 완료!")
     print(f"📊 현대차: {len(hyundai_df)}대")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+색상 코드 사전 모듈
+외장(code_color_a)/내장(code_color_b) 색상 코드를 참조 사전(data/reference/color_*.csv)의
+표준 색상명과 색상 계열(화이트/블랙/그레이…)로 변환
+
+- 사전 컬럼: company, code, name(표준 색상명), family(색상 계열)
+- 데이터프레임의 고유 (company, 코드) 조합만 사전 색인과 한 번에 조인한 뒤 행으로 펼침
+- 사전에 없는 코드는 "?"로 두고 results/color_review_YYMMDD.csv에 모아 검토
+  (원본 색상명, 대수, 제안 색상명/계열 포함 → 확인 후 사전에 추가)
+"""
+
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.constants import ColorConfig, FilePaths, get_today_date_string
+
+
+# 부위 -> (코드 컬럼, 원본 색상명 컬럼)
+COLOR_PARTS = {
+    "exterior": ("code_color_a", "color_exterior"),
+    "interior": ("code_color_b", "color_interior"),
+}
+DICTIONARY_COLUMNS = ["company", "code", "name", "family"]
+REVIEW_COLUMNS = ["part", "company", "code", "color_text", "count", "suggested_name", "suggested_family"]
+
+# 색상 계열 제안 키워드 (앞에서부터 확인, 투톤은 첫 번째 색 기준)
+FAMILY_KEYWORDS = [
+    ("화이트", "화이트"), ("순백", "화이트"), ("글래시어", "화이트"), ("글레이셔", "화이트"),
+    ("실버", "실버"),
+    ("블랙", "블랙"), ("옵시디언", "블랙"),
+    ("차콜", "그레이"), ("그레이", "그레이"),
+    ("블루", "블루"), ("네이비", "블루"), ("인디고", "블루"), ("감청", "블루"), ("페트롤", "블루"),
+    ("브라운", "브라운"), ("카멜", "브라운"), ("코냑", "브라운"), ("브론즈", "브라운"),
+    ("레드", "레드"), ("버건디", "레드"), ("마룬", "레드"),
+    ("그린", "그린"), ("세이지", "그린"), ("틸", "그린"), ("에메랄드", "그린"),
+    ("베이지", "베이지"),
+    ("옐로우", "옐로우"), ("골드", "골드"),
+]
+UNKNOWN_COLOR = "?"
+
+# 사전 캐시 (부위 -> (파일 수정 시각, 데이터프레임)), 사전에 없는 코드 집계 (프로세스 단위)
+_dictionaries = {}
+_unseen = {}
+
+
+def suggest_color_name(text):
+    """원본 색상명에서 표준 색상명 제안 (괄호/밑줄 뒤 가니시·패키지 설명 제거, 공백 정리)"""
+    text = re.split(r"[(_]", str(text), maxsplit=1)[0]
+    return " ".join(text.split())
+
+
+def suggest_color_family(text):
+    """원본 색상명에서 색상 계열 제안 (키워드가 없으면 "기타")"""
+    primary = re.split(r"[/&]", str(text), maxsplit=1)[0]
+    for keyword, family in FAMILY_KEYWORDS:
+        if keyword in primary:
+            return family
+    return "기타"
+
+
+def load_color_dictionary(part):
+    """
+    부위별 색상 사전 로드 (파일이 바뀌지 않으면 캐시 사용, 파일이 없으면 빈 사전)
+
+    Returns:
+        (company, code) 색인의 name/family 데이터프레임
+    """
+    path = FilePaths.COLOR_DICTIONARIES[part]
+    mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    cached = _dictionaries.get(part)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    if mtime is None:
+        dictionary = pd.DataFrame(columns=DICTIONARY_COLUMNS, dtype=str)
+    else:
+        dictionary = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig")[DICTIONARY_COLUMNS]
+    # 같은 코드가 여러 번 있으면 마지막 행 사용
+    dictionary = dictionary.drop_duplicates(["company", "code"], keep="last").set_index(["company", "code"])
+    _dictionaries[part] = (mtime, dictionary)
+    return dictionary
+
+
+def apply_color_dictionary(df):
+    """
+    외장/내장 색상 코드를 표준 색상명과 계열로 변환
+
+    추가 컬럼:
+        color_exterior_name, color_exterior_family, color_interior_name, color_interior_family
+        (사전에 없는 코드는 "?")
+
+    Args:
+        df: 통합 클렌징 데이터프레임 (company, code_color_a/b, color_exterior/interior 컬럼)
+
+    Returns:
+        색상 컬럼이 추가된 데이터프레임
+    """
+    if not ColorConfig.ENABLED:
+        return df
+
+    for part, (code_column, text_column) in COLOR_PARTS.items():
+        dictionary = load_color_dictionary(part)
+
+        # 고유 (company, 코드) 조합만 사전과 조인 (행 코드 -1 = 결측 → 마지막 "?")
+        keys = pd.MultiIndex.from_arrays([df["company"], df[code_column]])
+        row_codes, uniques = keys.factorize()
+        positions = dictionary.index.get_indexer(uniques)
+        found = positions >= 0
+        for field in ("name", "family"):
+            values = np.full(len(uniques) + 1, UNKNOWN_COLOR, dtype=object)
+            values[:-1][found] = dictionary[field].to_numpy()[positions[found]]
+            df[f"color_{part}_{field}"] = values[row_codes]
+
+        if not found.all():
+            record_unseen(part, uniques, found, row_codes, df[text_column].to_numpy())
+
+    return df
+
+
+def record_unseen(part, uniques, found, row_codes, texts):
+    """사전에 없는 (company, 코드) 조합의 대수와 첫 원본 색상명 집계"""
+    valid = np.flatnonzero(row_codes >= 0)
+    counts = np.bincount(row_codes[valid], minlength=len(uniques))
+    # 고유 조합 번호는 처음 나온 순서이므로 unique의 첫 위치 = 조합별 첫 행
+    first_rows = valid[np.unique(row_codes[valid], return_index=True)[1]]
+    for unique_code in np.flatnonzero(~found):
+        company, code = uniques[unique_code]
+        entry = _unseen.setdefault((part, company, code), {"color_text": texts[first_rows[unique_code]], "count": 0})
+        entry["count"] += int(counts[unique_code])
+
+
+def reset_color_review():
+    """사전에 없는 코드 집계 초기화"""
+    _unseen.clear()
+
+
+def save_color_review(date_str=None):
+    """
+    사전에 없는 색상 코드를 검토 파일로 저장
+
+    Returns:
+        검토 파일 경로 (사전에 없는 코드가 없으면 None)
+    """
+    if not _unseen:
+        return None
+    if date_str is None:
+        date_str = get_today_date_string()
+
+    review_df = pd.DataFrame(
+        [
+            (part, company, code, entry["color_text"], entry["count"],
+             suggest_color_name(entry["color_text"]), suggest_color_family(entry["color_text"]))
+            for (part, company, code), entry in _unseen.items()
+        ],
+        columns=REVIEW_COLUMNS,
+    ).sort_values(["part", "count"], ascending=[True, False])
+    path = FilePaths.get_results_file("color_review", date_str)
+    review_df.to_csv(path, index=False, encoding="utf-8-sig")
+    print(f"🎨 사전에 없는 색상 코드 {len(review_df)}개 → 검토 파일: {path}")
+    return path
@@ -89,6 +89,9 @@ def reorder_cleansing_columns(df):
     # 최종 순서
     final_order = ordered_columns + remaining_columns
     
+    # 이미 정렬된 경우 그대로 반환, 아니면 컬럼 선택 (Copy-on-Write로 데이터는 공유)
+    if final_order == current_columns:
+        return df
     return df[final_order]
 
 
@@ -140,27 +143,31 @@ def clean_text(text: str) -> str:
     return cleaned
 
 
-def validate_dataframe(df, required_columns: list) -> bool:
+def validate_dataframe(df, required_columns: list, verbose: bool = True) -> bool:
     """
     데이터프레임 유효성 검사
     
     Args:
         df: 검사할 데이터프레임
         required_columns: 필수 컬럼 목록
+        verbose: 결과 출력 여부 (데이터 검증 단계에서는 보고서로 대신 출력)
         
     Returns:
         유효성 검사 결과
     """
     if df is None or df.empty:
-        print("❌ 데이터프레임이 비어있습니다.")
+        if verbose:
+            print("❌ 데이터프레임이 비어있습니다.")
         return False
         
     missing_columns = [col for col in required_columns if col not in df.columns]
     if missing_columns:
-        print(f"❌ 필수 컬럼이 누락되었습니다: {missing_columns}")
+        if verbose:
+            print(f"❌ 필수 컬럼이 누락되었습니다: {missing_columns}")
         return False
         
-    print(f"✅ 데이터프레임 유효성 검사 통과: {len(df)}행, {len(df.columns)}개 컬럼")
+    if verbose:
+        print(f"✅ 데이터프레임 유효성 검사 통과: {len(df)}행, {len(df.columns)}개 컬럼")
     return True
 
 
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+엑셀 리더 선택 모듈
+원본 파일 형식별로 사용할 pandas 엑셀 엔진을 고름
+
+- python-calamine(Rust 기반)이 설치되어 있으면 후보에 포함, 없으면 openpyxl(.xlsx)/xlrd(.xls)
+- "auto"이면 파일 형식별로 첫 대상 시트를 각 엔진으로 읽어 보고 가장 빠른 엔진을 선택
+  (기본 엔진과 읽은 결과가 다르면 후보에서 제외, 선택 결과는 프로세스 안에서 재사용)
+"""
+
+import importlib.util
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.cleansing.raw_layouts import list_target_sheets, read_raw_sheet
+from src.config.constants import ExcelReaderConfig
+from src.utils.raw_bundles import BundleMember, open_raw_source
+
+
+ENGINE_MODULES = {
+    "calamine": "python_calamine",
+    "openpyxl": "openpyxl",
+    "xlrd": "xlrd",
+}
+
+# 파일 형식별 후보 엔진 (마지막 = 기본 엔진, 결과 비교 기준)
+FILE_TYPE_ENGINES = {
+    ".xlsx": ("calamine", "openpyxl"),
+    ".xls": ("calamine", "xlrd"),
+}
+
+# 파일 형식 -> 선택된 엔진
+_selected = {}
+
+
+def get_file_type(source):
+    """원본 파일 형식 (확장자, 소문자)"""
+    name = source.name if isinstance(source, BundleMember) else source
+    return os.path.splitext(name)[1].lower()
+
+
+def is_engine_available(engine):
+    """엔진 패키지 설치 여부"""
+    return importlib.util.find_spec(ENGINE_MODULES[engine]) is not None
+
+
+def list_engines(file_type):
+    """파일 형식에 사용할 수 있는 엔진 목록 (기본 엔진이 마지막)"""
+    return [engine for engine in FILE_TYPE_ENGINES[file_type] if is_engine_available(engine)]
+
+
+def read_sample(source, brand, engine):
+    """첫 대상 시트를 엔진으로 읽기 (벤치마크용)"""
+    with pd.ExcelFile(open_raw_source(source), engine=engine) as book:
+        sheet_name = list_target_sheets(brand, book.sheet_names)[0]
+        return read_raw_sheet(book, sheet_name, brand)
+
+
+def benchmark_engines(source, brand, engines):
+    """
+    엔진별 첫 대상 시트 읽기 시간 측정
+
+    Returns:
+        엔진 -> 소요 시간(초) dict (기본 엔진과 결과가 다른 엔진은 제외)
+    """
+    reference = None
+    timings = {}
+    for engine in reversed(engines):
+        best = None
+        for _ in range(max(ExcelReaderConfig.BENCHMARK_ROUNDS, 1)):
+            start = time.perf_counter()
+            sample = read_sample(source, brand, engine)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        if reference is None:
+            reference = sample
+        elif not sample.equals(reference):
+            print(f"⚠️ 엑셀 리더 [{engine}] 결과가 기본 엔진과 달라 제외합니다.")
+            continue
+        timings[engine] = best
+    return timings
+
+
+def select_engine(source, brand):
+    """
+    원본 파일에 사용할 엑셀 엔진 선택
+
+    Args:
+        source: 원본 파일 경로 또는 zip 번들 항목
+        brand: "hyundai" 또는 "kia" (벤치마크에서 읽을 레이아웃)
+
+    Returns:
+        pandas read_excel 엔진 이름
+    """
+    file_type = get_file_type(source)
+    engines = list_engines(file_type)
+    configured = ExcelReaderConfig.ENGINE
+    if configured != "auto":
+        if configured in engines:
+            return configured
+        print(f"⚠️ 엑셀 리더 [{configured}]를 {file_type} 파일에 사용할 수 없어 {engines[-1]}로 읽습니다.")
+        return engines[-1]
+
+    if file_type not in _selected:
+        if len(engines) == 1:
+            _selected[file_type] = engines[0]
+        else:
+            timings = benchmark_engines(source, brand, engines)
+            _selected[file_type] = min(timings, key=timings.get)
+            summary = ", ".join(f"{engine} {seconds:.3f}초" for engine, seconds in sorted(timings.items(), key=lambda item: item[1]))
+            print(f"⚙️ 엑셀 리더 ({file_type}): {_selected[file_type]} 선택 [{summary}]")
+    return _selected[file_type]
+
+
+def open_excel(source, brand, engine=None):
+    """원본 파일을 선택된 엔진의 pd.ExcelFile로 열기"""
+    if engine is None:
+        engine = select_engine(source, brand)
+    return pd.ExcelFile(open_raw_source(source), engine=engine)
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+퍼지 매칭 보완 모듈
+모델/트림이 "?"로 남은 차량을 과거 스냅샷의 정상 추출 결과(어휘)와
+문자 n-gram 색인으로 비교하여 모델/트림을 제안하거나 자동 지정
+"""
+
+import glob
+import heapq
+import json
+import math
+import os
+import re
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.constants import FilePaths, FuzzyMatchConfig, get_today_date_string
+
+
+SNAPSHOT_PATTERN = re.compile(r"stock_filtered_(\d{6})\.xlsx$")
+VOCAB_COLUMNS = ["company", "model_raw", "trim_raw", "model", "trim"]
+
+
+def get_brand(company):
+    """회사명을 어휘 구분용 브랜드로 변환 (제네시스는 현대 원본 파일에 포함)"""
+    return "기아" if company == "기아" else "현대"
+
+
+def build_query(company, model_raw, trim_raw):
+    """
+    매칭에 사용할 원본 문자열 생성
+
+    현대는 시트명(model_raw) + 차종(trim_raw), 기아는 차종(model_raw) 전체를 사용
+    """
+    model_raw = "" if pd.isna(model_raw) else str(model_raw)
+    trim_raw = "" if pd.isna(trim_raw) else str(trim_raw)
+    if get_brand(company) == "기아":
+        return model_raw
+    return f"{model_raw} {trim_raw}"
+
+
+def normalize_text(text):
+    """소문자 변환 및 연속 공백 정리"""
+    return " ".join(str(text).lower().split())
+
+
+def char_ngrams(text, n):
+    """문자 n-gram 집합 (앞뒤 공백 패딩)"""
+    padded = f" {normalize_text(text)} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class NgramIndex:
+    """어휘 항목에 대한 문자 n-gram 역색인 (TF-IDF 코사인 점수)"""
+
+    def __init__(self, entries, n):
+        self.entries = entries
+        self.n = n
+        self.postings = defaultdict(list)
+
+        entry_grams = []
+        for entry_id, entry in enumerate(entries):
+            grams = char_ngrams(entry["query"], n)
+            entry_grams.append(grams)
+            for gram in grams:
+                self.postings[gram].append(entry_id)
+
+        total = max(len(entries), 1)
+        self.idf = {
+            gram: math.log(1 + total / len(ids)) for gram, ids in self.postings.items()
+        }
+        self.unseen_idf = math.log(1 + total)
+        self.norms = [
+            math.sqrt(sum(self.idf[gram] ** 2 for gram in grams)) or 1.0
+            for grams in entry_grams
+        ]
+
+    def search(self, text, top_k):
+        """
+        상위 top_k개 후보 검색
+
+        Returns:
+            (점수, 어휘 항목) 리스트 (점수 내림차순, 0~1)
+        """
+        grams = char_ngrams(text, self.n)
+        query_norm = math.sqrt(sum(self.idf.get(gram, self.unseen_idf) ** 2 for gram in grams))
+        if not query_norm:
+            return []
+
+        scores = defaultdict(float)
+        for gram in grams:
+            weight = self.idf.get(gram)
+            if weight is None:
+                continue
+            weight_sq = weight * weight
+            for entry_id in self.postings[gram]:
+                scores[entry_id] += weight_sq
+
+        best = heapq.nlargest(
+            top_k,
+            scores.items(),
+            key=lambda item: item[1] / self.norms[item[0]],
+        )
+        return [
+            (round(score / (query_norm * self.norms[entry_id]), 4), self.entries[entry_id])
+            for entry_id, score in best
+        ]
+
+
+def load_vocabulary():
+    """저장된 어휘 로드 (없으면 빈 어휘)"""
+    path = FilePaths.FUZZY_VOCAB
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {"snapshots": [], "entries": {}}
+
+
+def save_vocabulary(vocab):
+    """어휘 저장"""
+    os.makedirs(os.path.dirname(FilePaths.FUZZY_VOCAB), exist_ok=True)
+    with open(FilePaths.FUZZY_VOCAB, "w", encoding="utf-8") as f:
+        json.dump(vocab, f, ensure_ascii=False)
+
+
+def add_known_rows(vocab, df, date_str):
+    """
+    모델/트림이 정상 추출된 행을 어휘에 추가
+
+    Args:
+        vocab: load_vocabulary() 결과
+        df: company, model_raw, trim_raw, model, trim 컬럼을 가진 데이터프레임
+        date_str: 스냅샷 날짜 (YYMMDD)
+    """
+    known = df[(df["model"] != "?") & (df["trim"] != "?")]
+    if "match_status" in known.columns:
+        known = known[known["match_status"] != "auto"]
+    known = known[VOCAB_COLUMNS].drop_duplicates()
+    entries = vocab["entries"]
+    for company, model_raw, trim_raw, model, trim in known.itertuples(index=False):
+        query = build_query(company, model_raw, trim_raw)
+        key = f"{get_brand(company)}\t{query}"
+        entries[key] = {
+            "query": query,
+            "company": company,
+            "model": model,
+            "trim": trim,
+            "last_seen": max(date_str, entries.get(key, {}).get("last_seen", date_str)),
+        }
+    if date_str not in vocab["snapshots"]:
+        vocab["snapshots"].append(date_str)
+    return prune_vocabulary(vocab)
+
+
+def prune_vocabulary(vocab):
+    """
+    최근 FuzzyMatchConfig.VOCAB_WINDOW_DAYS일 동안 보이지 않은 어휘 항목 제거
+
+    기준일은 어휘에 반영된 가장 최근 날짜 (과거 날짜를 나중에 반영해도 최신 항목은 유지)
+    """
+    if not FuzzyMatchConfig.VOCAB_WINDOW_DAYS or not vocab["snapshots"]:
+        return vocab
+    latest = datetime.strptime(max(vocab["snapshots"]), "%y%m%d")
+    cutoff = (latest - timedelta(days=FuzzyMatchConfig.VOCAB_WINDOW_DAYS)).strftime("%y%m%d")
+    entries = vocab["entries"]
+    stale = [key for key, entry in entries.items() if entry["last_seen"] < cutoff]
+    for key in stale:
+        del entries[key]
+    if stale:
+        print(f"   🧹 어휘 정리: {len(stale)}건 제거 ({cutoff} 이전에 마지막으로 보인 항목)")
+    return vocab
+
+
+def refresh_vocabulary_from_snapshots(vocab):
+    """아직 어휘에 반영되지 않은 과거 결과 파일(all 시트)을 어휘에 반영"""
+    pattern = os.path.join(FilePaths.RESULTS_DIR, "stock_filtered_*.xlsx")
+    for path in sorted(glob.glob(pattern)):
+        match = SNAPSHOT_PATTERN.search(os.path.basename(path))
+        if not match or match.group(1) in vocab["snapshots"]:
+            continue
+        snapshot = pd.read_excel(
+            path,
+            sheet_name="all",
+            usecols=lambda column: column in VOCAB_COLUMNS or column == "match_status",
+            dtype=str,
+        )
+        add_known_rows(vocab, snapshot, match.group(1))
+        print(f"   📚 어휘 반영: {os.path.basename(path)}")
+    return vocab
+
+
+def build_indexes(vocab):
+    """브랜드별 n-gram 색인 생성"""
+    by_brand = defaultdict(list)
+    for key, entry in vocab["entries"].items():
+        by_brand[key.split("\t", 1)[0]].append(entry)
+    return {
+        brand: NgramIndex(entries, FuzzyMatchConfig.NGRAM)
+        for brand, entries in by_brand.items()
+    }
+
+
+def find_best_candidate(indexes, brand, query, model):
+    """
+    가장 점수가 높은 후보 반환
+
+    행의 모델이 이미 추출된 경우 같은 모델의 후보만 사용
+    """
+    index = indexes.get(brand)
+    if index is None:
+        return None, 0.0
+    for score, entry in index.search(query, FuzzyMatchConfig.TOP_K):
+        if model != "?" and entry["model"] != model:
+            continue
+        return entry, score
+    return None, 0.0
+
+
+def apply_fuzzy_fallback(df, vocab=None):
+    """
+    모델/트림이 "?"인 행에 퍼지 매칭 결과를 제안 또는 자동 지정
+
+    추가 컬럼:
+        match_model, match_trim, match_score: 최상위 후보와 점수
+        match_status: "auto"(자동 지정), "suggest"(제안만), ""(대상 아님/후보 없음)
+
+    Args:
+        df: 통합 클렌징 데이터프레임
+        vocab: 어휘 (None이면 저장된 어휘 + 과거 스냅샷 사용)
+
+    Returns:
+        보완된 데이터프레임
+    """
+    df["match_model"] = ""
+    df["match_trim"] = ""
+    df["match_score"] = 0.0
+    df["match_status"] = ""
+
+    if not FuzzyMatchConfig.ENABLED:
+        return df
+
+    targets = (df["model"] == "?") | (df["trim"] == "?")
+    if not targets.any():
+        return df
+
+    if vocab is None:
+        vocab = refresh_vocabulary_from_snapshots(load_vocabulary())
+        save_vocabulary(vocab)
+    indexes = build_indexes(vocab)
+    if not indexes:
+        print("⚠️ 퍼지 매칭 어휘가 비어 있어 건너뜁니다.")
+        return df
+
+    # 같은 원본 문자열은 한 번만 검색
+    target_df = df.loc[targets, ["company", "model_raw", "trim_raw", "model"]]
+    queries = [
+        (get_brand(company), build_query(company, model_raw, trim_raw), model)
+        for company, model_raw, trim_raw, model in target_df.itertuples(index=False)
+    ]
+    results = {
+        key: find_best_candidate(indexes, *key) for key in set(queries)
+    }
+
+    # 검색 결과를 행 단위 컬럼으로 펼쳐서 한 번에 대입
+    matched = pd.DataFrame(
+        [
+            (entry["model"], entry["trim"], entry["company"], score)
+            if entry is not None and score >= FuzzyMatchConfig.SUGGEST_SCORE
+            else ("", "", "", 0.0)
+            for entry, score in (results[key] for key in queries)
+        ],
+        index=target_df.index,
+        columns=["model", "trim", "company", "score"],
+    )
+    suggested = matched.index[matched["score"] > 0]
+    auto = matched.index[matched["score"] >= FuzzyMatchConfig.AUTO_ASSIGN_SCORE]
+
+    df.loc[suggested, "match_model"] = matched.loc[suggested, "model"]
+    df.loc[suggested, "match_trim"] = matched.loc[suggested, "trim"]
+    df.loc[suggested, "match_score"] = matched.loc[suggested, "score"]
+    df.loc[suggested, "match_status"] = "suggest"
+    # 자동 지정은 "?"인 컬럼만 덮어씀 (회사는 모델을 지정할 때만, 모델이 있으면 같은 모델 후보만 사용)
+    auto_model = auto[df.loc[auto, "model"].to_numpy() == "?"]
+    auto_trim = auto[df.loc[auto, "trim"].to_numpy() == "?"]
+    df.loc[auto_model, ["model", "company"]] = matched.loc[auto_model, ["model", "company"]]
+    df.loc[auto_trim, "trim"] = matched.loc[auto_trim, "trim"]
+    df.loc[auto, "match_status"] = "auto"
+
+    auto_count = len(auto)
+    suggest_count = len(suggested) - auto_count
+
+    print(
+        f"🔎 퍼지 매칭: 대상 {int(targets.sum())}대 (고유 {len(results)}건), "
+        f"자동 지정 {auto_count}대, 제안 {suggest_count}대"
+    )
+    return df
+
+
+def update_vocabulary(df, date_str=None):
+    """
+    이번 실행에서 정상 추출된 행을 어휘에 반영 (자동 지정된 행은 제외)
+
+    Args:
+        df: 통합 클렌징 데이터프레임
+        date_str: 처리 날짜 (YYMMDD)
+    """
+    if not FuzzyMatchConfig.ENABLED:
+        return
+    if date_str is None:
+        date_str = get_today_date_string()
+    vocab = add_known_rows(load_vocabulary(), df, date_str)
+    save_vocabulary(vocab)
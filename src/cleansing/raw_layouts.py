@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+원본 레이아웃 모듈
+브랜드/버전별 원본 엑셀 구조를 선언하고, 시트 앞부분에서 헤더 행과 컬럼 위치를 찾아
+필요한 컬럼만 정해진 타입으로 읽음
+
+- 컬럼은 헤더 라벨 기준으로 찾으므로 컬럼이 밀리거나 추가되어도 그대로 읽힘
+- 코드/칼라처럼 두 칸이 병합된 헤더는 (라벨, offset 1)로 오른쪽 칸을 지정 (헤더가 비어 있어야 함)
+- 알 수 없는 레이아웃은 앞부분만 읽은 뒤 필요한 헤더 목록과 함께 ValueError
+"""
+
+import os
+import sys
+from collections import namedtuple
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.config.constants import RawLayoutConfig
+
+
+# label: 헤더 라벨, offset: 라벨 위치 기준 칸 이동 (병합 헤더의 오른쪽 칸 = 1),
+# name: 클렌징 컬럼명, dtype: 읽을 때 지정할 타입
+RawColumn = namedtuple("RawColumn", ["label", "offset", "name", "dtype"])
+
+# sheet: 읽을 시트명 (None = 전체 시트), skip_sheet_keyword: 이름에 포함되면 건너뛸 시트
+RawLayout = namedtuple("RawLayout", ["brand", "version", "sheet", "skip_sheet_keyword", "columns"])
+
+# 판매코드/칼라코드/외내장칼라는 두 칸 병합 헤더 (현대/기아 공통)
+COMMON_COLUMNS = (
+    RawColumn("판매코드", 0, "code_sales_a", "str"),
+    RawColumn("판매코드", 1, "code_sales_b", "str"),
+    RawColumn("칼라코드", 0, "code_color_a", "str"),
+    RawColumn("칼라코드", 1, "code_color_b", "str"),
+    RawColumn("요청", 0, "request", "float64"),
+    RawColumn("재고", 0, "stock", "float64"),
+)
+COLOR_PRICE_COLUMNS = (
+    RawColumn("옵션", 0, "options", "str"),
+    RawColumn("외/내장칼라", 0, "color_exterior", "str"),
+    RawColumn("외/내장칼라", 1, "color_interior", "str"),
+    RawColumn("가격", 0, "price", "float64"),
+)
+
+# 브랜드별 레이아웃 (앞쪽 버전부터 확인, 새 양식은 목록에 추가)
+RAW_LAYOUTS = {
+    # 현대: 차종별 시트 (조건차 시트 제외), 차종 = 트림 원본, 시트명 = 모델 원본
+    "hyundai": [
+        RawLayout(
+            "hyundai", "2025", None, "조건",
+            COMMON_COLUMNS + (RawColumn("차종", 0, "trim_raw", "str"),) + COLOR_PRICE_COLUMNS,
+        ),
+    ],
+    # 기아: sheet1 한 장, 차종 = 모델 원본
+    "kia": [
+        RawLayout(
+            "kia", "2025", "sheet1", None,
+            COMMON_COLUMNS + (RawColumn("차종", 0, "model_raw", "str"),) + COLOR_PRICE_COLUMNS,
+        ),
+    ],
+}
+
+
+def normalize_label(value):
+    """헤더 셀 값을 비교용 문자열로 변환 (빈 칸 → "")"""
+    if value is None or (isinstance(value, float) and value != value):
+        return ""
+    return str(value).strip()
+
+
+def is_target_sheet(layout, sheet_name):
+    """레이아웃이 읽는 시트인지 확인"""
+    if layout.sheet is not None:
+        return sheet_name == layout.sheet
+    return not (layout.skip_sheet_keyword and layout.skip_sheet_keyword in sheet_name)
+
+
+def list_target_sheets(brand, sheet_names):
+    """브랜드 레이아웃이 읽는 시트 목록 (원본 순서)"""
+    layouts = RAW_LAYOUTS[brand]
+    return [
+        sheet_name for sheet_name in sheet_names
+        if any(is_target_sheet(layout, sheet_name) for layout in layouts)
+    ]
+
+
+def locate_columns(layout, header):
+    """
+    헤더 행에서 레이아웃 컬럼 위치 찾기
+
+    Returns:
+        컬럼별 위치 리스트 (라벨이 없거나 병합 칸이 비어 있지 않으면 None)
+    """
+    labels = [normalize_label(value) for value in header]
+    positions = []
+    for column in layout.columns:
+        if column.label not in labels:
+            return None
+        position = labels.index(column.label) + column.offset
+        if column.offset and position < len(labels) and labels[position]:
+            return None
+        positions.append(position)
+    return positions
+
+
+def detect_layout(brand, rows):
+    """
+    시트 앞부분 행에서 헤더 행과 레이아웃 찾기
+
+    Args:
+        brand: "hyundai" 또는 "kia"
+        rows: 시트 앞부분 행 목록 (RawLayoutConfig.HEADER_SCAN_ROWS행)
+
+    Returns:
+        (레이아웃, 헤더 행 위치, 컬럼별 위치 리스트)
+    """
+    for layout in RAW_LAYOUTS[brand]:
+        for header_index, row in enumerate(rows):
+            positions = locate_columns(layout, row)
+            if positions is not None:
+                return layout, header_index, positions
+    labels = sorted({column.label for layout in RAW_LAYOUTS[brand] for column in layout.columns})
+    raise ValueError(
+        f"{brand} 원본 레이아웃을 찾을 수 없습니다 "
+        f"(앞 {len(rows)}행에 필요한 헤더 없음: {', '.join(labels)})"
+    )
+
+
+def locate_sheet_layout(book, sheet_name, brand):
+    """
+    시트 앞부분(RawLayoutConfig.HEADER_SCAN_ROWS행)에서 레이아웃 찾기
+
+    Returns:
+        (레이아웃, 헤더 행 위치, 컬럼별 위치 리스트)
+    """
+    head = book.parse(sheet_name, header=None, nrows=RawLayoutConfig.HEADER_SCAN_ROWS)
+    return detect_layout(brand, head.values.tolist())
+
+
+def read_layout_columns(book, sheet_name, layout, header_index, positions, nrows=None, coerce=True):
+    """
+    헤더 아래 행에서 레이아웃 컬럼만 읽기
+
+    Args:
+        nrows: 읽을 행 수 (None이면 전체, 표본 검사용)
+        coerce: True면 숫자 컬럼을 레이아웃 타입으로 변환 (숫자가 아닌 값은 NaN),
+                False면 원본 값 그대로 (데이터 검증용)
+    """
+    usecols = sorted(set(positions))
+    df = book.parse(
+        sheet_name,
+        header=None,
+        skiprows=header_index + 1,
+        nrows=nrows,
+        usecols=usecols,
+        dtype={
+            position: column.dtype
+            for position, column in zip(positions, layout.columns)
+            if column.dtype == "str"
+        },
+    )
+    df = df.reindex(columns=positions)
+    df.columns = [column.name for column in layout.columns]
+    # 검증 예시의 엑셀 행 번호용 (attrs["header_index"] + 2 + 행 위치)
+    df.attrs["header_index"] = header_index
+    return apply_layout_dtypes(df, layout) if coerce else df
+
+
+def read_raw_sheet(book, sheet_name, brand, coerce=True):
+    """
+    시트에서 레이아웃 컬럼만 정해진 타입으로 읽기
+
+    Args:
+        book: pd.ExcelFile
+        sheet_name: 시트 이름
+        brand: "hyundai" 또는 "kia"
+        coerce: False면 숫자 컬럼을 원본 값 그대로 (검증 후 apply_brand_dtypes()로 변환)
+
+    Returns:
+        클렌징 컬럼명으로 된 데이터프레임 (헤더 아래 행 전체)
+    """
+    layout, header_index, positions = locate_sheet_layout(book, sheet_name, brand)
+    return read_layout_columns(book, sheet_name, layout, header_index, positions, coerce=coerce)
+
+
+def apply_layout_dtypes(df, layout):
+    """
+    읽은 컬럼을 레이아웃 타입으로 맞춤 (일괄 처리/청크 리더 공통)
+
+    숫자 컬럼은 숫자가 아닌 값을 NaN으로 변환 (한 칸 때문에 전체 읽기가 실패하지 않도록,
+    해당 값은 데이터 검증 단계에서 보고)
+    """
+    df = df.astype({column.name: column.dtype for column in layout.columns if column.dtype == "str"})
+    return df.assign(**{
+        column.name: pd.to_numeric(df[column.name], errors="coerce").astype(column.dtype)
+        for column in layout.columns
+        if column.dtype != "str"
+    })
+
+
+def apply_brand_dtypes(df, brand):
+    """
+    coerce=False로 읽은 데이터프레임을 레이아웃 타입으로 맞춤 (검증 후 클렌징 전)
+
+    브랜드의 레이아웃들은 같은 컬럼명이면 타입도 같으므로 데이터프레임에 있는 컬럼 기준으로 변환
+    """
+    columns = {
+        column.name: column
+        for layout in RAW_LAYOUTS[brand]
+        for column in layout.columns
+        if column.name in df.columns
+    }
+    return apply_layout_dtypes(df, RawLayout(brand, None, None, None, tuple(columns.values())))
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+추출 규칙 통계 모듈
+모델/연료 추출 규칙별 적중 횟수와 "?" 미일치 횟수를 집계하고,
+최근 이력의 적중 빈도에 따라 규칙 평가 순서를 재정렬
+"""
+
+import csv
+import json
+import os
+import sys
+from collections import Counter, namedtuple
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.constants import FilePaths, RuleStatsConfig, get_today_date_string
+
+
+# label: 리포트에 표시할 규칙명, result: 일치 시 반환값,
+# patterns: 포함 여부를 확인할 문자열들 (하나라도 포함되면 일치),
+# upper: True면 대문자로 변환한 텍스트에서 확인
+Rule = namedtuple("Rule", ["label", "result", "patterns", "upper"], defaults=(False,))
+
+# 집계 상태 (프로세스 단위)
+_chains = {}              # chain -> 원본 순서의 규칙 목록
+_evaluated = Counter()    # chain -> 평가 횟수
+_hits = Counter()         # (chain, label) -> 적중 횟수
+_fallthrough = Counter()  # chain -> "?" 미일치 횟수
+_overlaps = {}            # chain -> 동시에 일치한 규칙 쌍 집합
+_active_order = {}        # chain -> 재정렬된 규칙 목록
+_history_cache = None
+
+
+def register_chain(chain, rules):
+    """규칙 체인을 등록하고 그대로 반환 (모듈 로드 시 사용)"""
+    _chains[chain] = list(rules)
+    return rules
+
+
+def rule_matches(rule, text, text_upper):
+    """규칙 하나가 텍스트와 일치하는지 확인"""
+    target = text_upper if rule.upper else text
+    return any(pattern in target for pattern in rule.patterns)
+
+
+def match_rule(chain, rules, text, record=True):
+    """
+    규칙 목록을 순서대로 평가하여 처음 일치하는 규칙을 반환
+
+    Args:
+        chain: 체인 이름 (예: "hyundai_model")
+        rules: 원본 순서의 규칙 목록
+        text: 검사할 텍스트
+        record: 적중 횟수 집계 여부
+
+    Returns:
+        일치한 규칙 (없으면 None)
+    """
+    ordered = get_rule_order(chain, rules)
+    text_upper = text.upper()
+
+    if not (record and RuleStatsConfig.ENABLED):
+        return first_match(ordered, text, text_upper)
+
+    _evaluated[chain] += 1
+    if not RuleStatsConfig.RECORD_OVERLAPS:
+        # 일반 집계: 처음 일치한 규칙에서 바로 종료
+        rule = first_match(ordered, text, text_upper)
+        if rule is None:
+            _fallthrough[chain] += 1
+        else:
+            _hits[(chain, rule.label)] += 1
+        return rule
+
+    # 동시 일치 기록 모드: 동시 일치 규칙 쌍을 기록하기 위해 모든 규칙 평가
+    matched = [rule for rule in ordered if rule_matches(rule, text, text_upper)]
+    if not matched:
+        _fallthrough[chain] += 1
+        return None
+
+    if len(matched) > 1:
+        pairs = _overlaps.setdefault(chain, set())
+        labels = sorted(rule.label for rule in matched)
+        for i, first in enumerate(labels):
+            for second in labels[i + 1:]:
+                pairs.add((first, second))
+
+    _hits[(chain, matched[0].label)] += 1
+    return matched[0]
+
+
+def first_match(rules, text, text_upper):
+    """규칙 목록에서 처음 일치하는 규칙 (없으면 None)"""
+    for rule in rules:
+        if rule_matches(rule, text, text_upper):
+            return rule
+    return None
+
+
+def record_result(chain, result):
+    """규칙 체인이 아닌 추출 함수의 결과를 집계 ("?" 미일치만 구분)"""
+    if not RuleStatsConfig.ENABLED:
+        return
+    _evaluated[chain] += 1
+    if result == "?":
+        _fallthrough[chain] += 1
+
+
+def reset_rule_stats():
+    """집계 상태 초기화"""
+    _evaluated.clear()
+    _hits.clear()
+    _fallthrough.clear()
+    _overlaps.clear()
+
+
+def get_rule_stats():
+    """현재 집계 상태를 직렬화 가능한 dict로 반환"""
+    return {
+        "evaluated": dict(_evaluated),
+        "hits": {f"{chain}\t{label}": count for (chain, label), count in _hits.items()},
+        "fallthrough": dict(_fallthrough),
+        "overlaps": {chain: sorted(pairs) for chain, pairs in _overlaps.items()},
+    }
+
+
+def merge_rule_stats(stats):
+    """다른 프로세스에서 집계한 상태를 현재 집계에 합산"""
+    _evaluated.update(stats["evaluated"])
+    _fallthrough.update(stats["fallthrough"])
+    for key, count in stats["hits"].items():
+        chain, label = key.split("\t", 1)
+        _hits[(chain, label)] += count
+    for chain, pairs in stats["overlaps"].items():
+        _overlaps.setdefault(chain, set()).update(tuple(pair) for pair in pairs)
+
+
+def load_rule_history():
+    """규칙 통계 이력 로드"""
+    global _history_cache
+    if _history_cache is None:
+        path = FilePaths.RULE_STATS_HISTORY
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                _history_cache = json.load(f)
+        else:
+            _history_cache = {"runs": [], "overlaps": {}}
+    return _history_cache
+
+
+def patterns_overlap(first, second):
+    """두 규칙의 패턴이 서로 포함 관계인지 확인 (같은 텍스트에 동시 일치 가능)"""
+    for a in first.patterns:
+        for b in second.patterns:
+            if first.upper or second.upper:
+                a_cmp, b_cmp = a.upper(), b.upper()
+            else:
+                a_cmp, b_cmp = a, b
+            if a_cmp in b_cmp or b_cmp in a_cmp:
+                return True
+    return False
+
+
+def compute_rule_order(chain, rules, history):
+    """
+    최근 이력의 적중 빈도로 규칙 순서를 재정렬
+
+    서로 겹치는 규칙(패턴 포함 관계 또는 이력상 동시 일치)은
+    원본 순서를 유지하고, 겹치지 않는 규칙만 빈도순으로 앞당김
+
+    Args:
+        chain: 체인 이름
+        rules: 원본 순서의 규칙 목록
+        history: load_rule_history() 결과
+
+    Returns:
+        재정렬된 규칙 목록
+    """
+    runs = history["runs"][-RuleStatsConfig.HISTORY_RUNS:]
+    frequency = Counter()
+    for run in runs:
+        frequency.update(run["hits"].get(chain, {}))
+
+    observed = {tuple(pair) for pair in history["overlaps"].get(chain, [])}
+
+    def overlaps(first, second):
+        pair = tuple(sorted((first.label, second.label)))
+        return pair in observed or patterns_overlap(first, second)
+
+    # 앞선 규칙과 겹치는 규칙은 그 규칙 뒤에만 올 수 있음
+    predecessors = {
+        j: {i for i in range(j) if overlaps(rules[i], rules[j])}
+        for j in range(len(rules))
+    }
+
+    order = []
+    placed = set()
+    while len(order) < len(rules):
+        available = [
+            j for j in range(len(rules))
+            if j not in placed and predecessors[j] <= placed
+        ]
+        best = max(available, key=lambda j: (frequency[rules[j].label], -j))
+        order.append(rules[best])
+        placed.add(best)
+
+    return order
+
+
+def get_rule_order(chain, rules):
+    """현재 사용할 규칙 순서 반환 (재정렬 모드가 아니면 원본 순서)"""
+    if not RuleStatsConfig.REORDER:
+        return rules
+    if chain not in _active_order:
+        _active_order[chain] = compute_rule_order(chain, rules, load_rule_history())
+    return _active_order[chain]
+
+
+def save_rule_stats(date_str=None):
+    """
+    규칙별 적중 횟수 리포트를 CSV로 저장하고 이력에 추가
+
+    Args:
+        date_str: 처리 날짜 (YYMMDD)
+
+    Returns:
+        리포트 파일 경로 (집계가 비활성화된 경우 None)
+    """
+    if not RuleStatsConfig.ENABLED or not _evaluated:
+        return None
+    if date_str is None:
+        date_str = get_today_date_string()
+
+    report_path = FilePaths.get_results_file("rule_stats", date_str)
+    with open(report_path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["chain", "position", "order", "rule", "result", "hits", "share"])
+        for chain in sorted(_evaluated):
+            total = _evaluated[chain]
+            rules = _chains.get(chain, [])
+            active = get_rule_order(chain, rules)
+            for position, rule in enumerate(rules):
+                hits = _hits[(chain, rule.label)]
+                writer.writerow([
+                    chain, position, active.index(rule), rule.label, rule.result,
+                    hits, round(hits / total, 4) if total else 0,
+                ])
+            misses = _fallthrough[chain]
+            writer.writerow([
+                chain, "", "", "?", "?", misses, round(misses / total, 4) if total else 0,
+            ])
+
+    # 이력 갱신 (동시 일치 규칙 쌍은 누적 보관)
+    history = load_rule_history()
+    hits_by_chain = {}
+    for (chain, label), count in _hits.items():
+        hits_by_chain.setdefault(chain, {})[label] = count
+    history["runs"] = [run for run in history["runs"] if run["date"] != date_str]
+    history["runs"].append({
+        "date": date_str,
+        "evaluated": dict(_evaluated),
+        "hits": hits_by_chain,
+        "fallthrough": dict(_fallthrough),
+    })
+    history["runs"] = history["runs"][-RuleStatsConfig.HISTORY_RUNS:]
+    for chain, pairs in _overlaps.items():
+        known = {tuple(pair) for pair in history["overlaps"].get(chain, [])}
+        history["overlaps"][chain] = sorted(known | pairs)
+
+    with open(FilePaths.RULE_STATS_HISTORY, "w", encoding="utf-8") as f:
+        json.dump(history, f, ensure_ascii=False, indent=2)
+
+    print(f"📊 규칙 적중 리포트 저장: {report_path}")
+    for chain in sorted(_evaluated):
+        total = _evaluated[chain]
+        print(f"   - {chain}: {total}건 중 미일치(?) {_fallthrough[chain]}건")
+    return report_path
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+현대 시트 캐시 모듈
+.xlsx(zip) 안의 차종 시트별로 내용 키를 만들고, 키가 같은 시트는 이전 클렌징 결과를 재사용
+
+시트 키 = 시트명 + 시트 XML의 CRC/크기 + 시트가 참조하는 공유 문자열 + styles.xml CRC
+        + 규칙 버전(src/cleansing 코드 해시) + 규칙 통계 집계 여부
+공유 문자열 표는 통합 문서 전체가 함께 쓰므로(한 시트만 바뀌어도 번호가 밀림)
+표 전체가 아니라 시트가 실제로 참조하는 문자열만 키에 포함
+"""
+
+import glob
+import hashlib
+import os
+import pickle
+import posixpath
+import re
+import sys
+import zipfile
+from xml.etree import ElementTree
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.config.constants import FilePaths, RuleStatsConfig, SheetCacheConfig
+from src.utils.raw_bundles import open_raw_source
+
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+SHARED_STRING_CELL = re.compile(rb'<c\b[^>]*\bt="s"[^>]*>\s*<v>(\d+)</v>')
+
+_rule_version = None
+
+
+def get_rule_version():
+    """클렌징 규칙 버전 (src/cleansing 소스 해시, 프로세스당 한 번 계산)"""
+    global _rule_version
+    if _rule_version is None:
+        digest = hashlib.sha256()
+        for path in sorted(glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))):
+            digest.update(os.path.basename(path).encode("utf-8"))
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        _rule_version = digest.hexdigest()
+    return _rule_version
+
+
+def get_sheet_members(archive):
+    """시트 이름 -> 시트 XML 항목 경로 (xl/workbook.xml + 관계 파일 기준)"""
+    targets = {}
+    rels = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    for rel in rels.iter(f"{PACKAGE_REL_NS}Relationship"):
+        target = rel.get("Target")
+        if target.startswith("/"):
+            targets[rel.get("Id")] = target.lstrip("/")
+        else:
+            targets[rel.get("Id")] = posixpath.normpath(posixpath.join("xl", target))
+
+    workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    return {
+        sheet.get("name"): targets.get(sheet.get(f"{REL_NS}id"))
+        for sheet in workbook.iter(f"{MAIN_NS}sheet")
+    }
+
+
+def load_shared_strings(archive):
+    """공유 문자열 항목 목록 (<si> XML 원문, 키 계산용)"""
+    try:
+        root = ElementTree.fromstring(archive.read("xl/sharedStrings.xml"))
+    except KeyError:
+        return []
+    return [ElementTree.tostring(item) for item in root.iter(f"{MAIN_NS}si")]
+
+
+def get_sheet_cache_keys(file_path, sheet_names):
+    """
+    시트별 캐시 키 계산
+
+    Args:
+        file_path: 현대 원본 파일 경로 또는 zip 번들 항목
+        sheet_names: 키를 계산할 시트 이름 목록
+
+    Returns:
+        시트 이름 -> 키(hex) dict (.xlsx가 아니면 빈 dict)
+    """
+    source = open_raw_source(file_path)
+    if not zipfile.is_zipfile(source):
+        return {}
+    with zipfile.ZipFile(source) as archive:
+        members = get_sheet_members(archive)
+        shared_strings = load_shared_strings(archive)
+        try:
+            styles_crc = archive.getinfo("xl/styles.xml").CRC
+        except KeyError:
+            styles_crc = 0
+
+        keys = {}
+        for sheet_name in sheet_names:
+            member = members.get(sheet_name)
+            if member is None:
+                continue
+            info = archive.getinfo(member)
+            digest = hashlib.sha256()
+            digest.update(
+                f"{sheet_name}\n{info.CRC}:{info.file_size}\n{styles_crc}\n"
+                f"{get_rule_version()}\n{RuleStatsConfig.ENABLED}\n".encode("utf-8")
+            )
+            for index in SHARED_STRING_CELL.findall(archive.read(member)):
+                index = int(index)
+                digest.update(shared_strings[index] if index < len(shared_strings) else b"?")
+            keys[sheet_name] = digest.hexdigest()
+    return keys
+
+
+def get_cache_path(key):
+    """캐시 항목 경로"""
+    return os.path.join(FilePaths.SHEET_CACHE_DIR, f"{key}.pkl")
+
+
+def is_sheet_cached(key):
+    """키의 캐시 항목 존재 여부 (키가 없으면 False)"""
+    return key is not None and os.path.exists(get_cache_path(key))
+
+
+def load_cached_sheets(keys):
+    """
+    캐시에 있는 시트 결과 로드
+
+    Returns:
+        시트 이름 -> (클렌징된 데이터프레임, 규칙 적중 집계) dict
+    """
+    cached = {}
+    for sheet_name, key in keys.items():
+        path = get_cache_path(key)
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, "rb") as f:
+                cached[sheet_name] = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            continue
+        os.utime(path)  # 최근 사용 시각 갱신 (정리 기준)
+    return cached
+
+
+def save_cached_sheets(keys, results):
+    """새로 클렌징한 시트 결과 저장 후 오래된 항목 정리"""
+    saved = 0
+    for sheet_name, result in results.items():
+        key = keys.get(sheet_name)
+        if key is None:
+            continue
+        os.makedirs(FilePaths.SHEET_CACHE_DIR, exist_ok=True)
+        path = get_cache_path(key)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        saved += 1
+    if saved:
+        prune_cache()
+
+
+def prune_cache():
+    """최근 사용 순으로 SheetCacheConfig.MAX_ENTRIES개만 남기고 삭제"""
+    paths = sorted(
+        glob.glob(os.path.join(FilePaths.SHEET_CACHE_DIR, "*.pkl")),
+        key=os.path.getmtime,
+        reverse=True,
+    )
+    for path in paths[SheetCacheConfig.MAX_ENTRIES:]:
+        os.remove(path)
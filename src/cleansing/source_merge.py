@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+지점별 원본 병합 모듈
+같은 브랜드의 여러 지점 원본을 클렌징한 결과를 합치면서 같은 차량(코드 키가 같은 행)을 한 행으로 병합
+
+- 코드 키(SourceMergeConfig.KEY_COLUMNS)를 64비트 해시로 만들어 전체 행을 한 번에 그룹화
+- 한 파일 안에서 같은 키가 반복되면 n번째 행끼리만 병합 (파일 내부 행은 그대로 유지)
+- 재고 충돌 처리: sum(재고 합산), max(재고가 가장 많은 행), latest(가장 최근 파일의 행)
+- 결과 행 순서는 키가 처음 나온 순서 (원본이 하나면 입력과 동일)
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.constants import SourceMergeConfig
+from src.utils.raw_bundles import get_raw_mtime
+
+
+MERGE_POLICIES = ("sum", "max", "latest")
+
+
+def hash_source_keys(df):
+    """코드 키 컬럼의 행별 64비트 해시"""
+    return pd.util.hash_pandas_object(df[SourceMergeConfig.KEY_COLUMNS], index=False).to_numpy()
+
+
+def merge_sources(sources, policy=None, brand=""):
+    """
+    지점별 클렌징 결과를 병합하는 함수
+
+    Args:
+        sources: (원본 파일, 클렌징된 데이터프레임) 리스트 (기본 파일이 첫 번째)
+        policy: 재고 충돌 처리 방식 (None이면 SourceMergeConfig.POLICY)
+        brand: 통계 출력용 브랜드명
+
+    Returns:
+        (병합된 데이터프레임, 충돌 통계 dict)
+    """
+    if policy is None:
+        policy = SourceMergeConfig.POLICY
+    if policy not in MERGE_POLICIES:
+        raise ValueError(f"알 수 없는 병합 방식: {policy} (사용 가능: {', '.join(MERGE_POLICIES)})")
+
+    frames = [df for _, df in sources]
+    if len(frames) == 1:
+        df = frames[0]
+        return df, {"sources": 1, "rows": len(df), "merged_rows": len(df), "duplicate_keys": 0, "stock_conflicts": 0}
+
+    combined = pd.concat(frames, ignore_index=True)
+    source_ids = np.repeat(np.arange(len(frames)), [len(df) for df in frames])
+    hashes = hash_source_keys(combined)
+
+    # 그룹 번호 = 키가 처음 나온 순서 (파일 안 반복 키는 n번째끼리 묶음)
+    occurrence = pd.Series(hashes).groupby([hashes, source_ids]).cumcount().to_numpy()
+    groups = pd.DataFrame({"hash": hashes, "occurrence": occurrence}).groupby(
+        ["hash", "occurrence"], sort=False
+    ).ngroup().to_numpy()
+
+    stock = pd.to_numeric(combined["stock"], errors="coerce").fillna(0).to_numpy()
+    if policy == "max":
+        # 재고가 많은 행 우선, 같으면 앞선 파일
+        order = np.lexsort((source_ids, -stock, groups))
+    elif policy == "latest":
+        # 수정 시각이 늦은 파일 우선, 같으면 뒤의 파일
+        mtimes = np.array([get_raw_mtime(source) for source, _ in sources])
+        order = np.lexsort((-source_ids, -mtimes[source_ids], groups))
+    else:
+        order = np.lexsort((source_ids, groups))
+
+    sorted_groups = groups[order]
+    first = np.r_[True, sorted_groups[1:] != sorted_groups[:-1]]
+    kept = order[first]
+
+    merged = combined.iloc[kept].reset_index(drop=True)
+    group_sizes = np.bincount(groups)
+    group_min = np.full(len(group_sizes), np.inf)
+    group_max = np.full(len(group_sizes), -np.inf)
+    np.minimum.at(group_min, groups, stock)
+    np.maximum.at(group_max, groups, stock)
+    if policy == "sum":
+        merged["stock"] = np.bincount(groups, weights=stock)
+
+    stats = {
+        "sources": len(frames),
+        "rows": len(combined),
+        "merged_rows": len(merged),
+        "duplicate_keys": int((group_sizes > 1).sum()),
+        "stock_conflicts": int((group_max > group_min).sum()),
+    }
+    print(
+        f"🔗 {brand} 지점 원본 병합 ({policy}): {stats['sources']}개 파일 {stats['rows']}행 → "
+        f"{stats['merged_rows']}행 (중복 키 {stats['duplicate_keys']}개, 재고 충돌 {stats['stock_conflicts']}개)"
+    )
+    return merged, stats
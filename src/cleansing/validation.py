@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+데이터 검증 모듈
+원본을 읽은 뒤 클렌징 전에 스키마/타입/범위를, 클렌징 후에 "?" 비율을 컬럼 단위로 한 번에 검사
+
+- 원본 단계: 숫자 컬럼을 변환하지 않은 원본 값으로 읽어 가격 누락, 숫자가 아닌 재고/가격,
+  음수/범위 밖 값, 옵션 표기 등을 검사 (클렌징에서는 조용히 행이 빠지거나 0대가 되는 값)
+- 클렌징 단계: 회사별 모델/트림/연료/색상 "?" 비율 (알 수 없는 모델 등)
+- 검사별 위반 수, 검사 행 수, 예시 행을 보고서로 출력하고 results/validation_YYMMDD.csv로 저장
+- full 모드는 전체 행, sample 모드는 시트별 앞부분 ValidationConfig.SAMPLE_ROWS행만 검사
+- 일괄 처리는 클렌징용으로 읽은 원본을 그대로 검사 (validate_raw_data, 파일을 다시 읽지 않음)
+- FAIL_FAST면 오류 등급 위반이 있을 때 클렌징 전에 ValueError로 중단
+
+사용법:
+    python -m src.cleansing.validation --date 250901 --mode sample
+"""
+
+import argparse
+import os
+import sys
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.cleansing.common import clean_options_text, validate_dataframe
+from src.cleansing.excel_readers import open_excel
+from src.cleansing.raw_layouts import list_target_sheets, locate_sheet_layout, read_layout_columns
+from src.config.constants import FilePaths, ValidationConfig, get_today_date_string, set_global_date
+
+
+LEVEL_ERROR = "error"
+LEVEL_WARNING = "warning"
+LEVEL_INFO = "info"
+
+# name: 검사명, column: 검사 컬럼, level: 위반 시 등급, description: 보고서 설명
+Check = namedtuple("Check", ["name", "column", "level", "description"])
+
+RAW_CHECKS = [
+    Check("missing_price", "price", LEVEL_ERROR, "판매코드가 있는데 가격이 없음 (클렌징에서 행이 빠짐)"),
+    Check("missing_code", "code_sales_a", LEVEL_ERROR, "가격이 있는데 판매코드가 없음"),
+    Check("non_numeric_price", "price", LEVEL_ERROR, "가격이 숫자가 아님 (클렌징에서 행이 빠짐)"),
+    Check("non_numeric_stock", "stock", LEVEL_ERROR, "재고가 숫자가 아님 (0대로 처리됨)"),
+    Check("negative_stock", "stock", LEVEL_ERROR, "재고가 음수"),
+    Check("missing_stock", "stock", LEVEL_WARNING, "재고가 비어 있음 (0대로 처리됨)"),
+    Check("fractional_stock", "stock", LEVEL_WARNING, "재고가 정수가 아님"),
+    Check("stock_range", "stock", LEVEL_WARNING, "재고가 ValidationConfig.MAX_STOCK 초과"),
+    Check("price_range", "price", LEVEL_WARNING, "가격이 ValidationConfig.MIN_PRICE~MAX_PRICE 범위 밖"),
+    Check("non_numeric_request", "request", LEVEL_WARNING, "요청이 숫자가 아님"),
+    Check("options_format", "options", LEVEL_WARNING, "옵션 텍스트에 전각 기호/불필요한 공백 (clean_options_text 기준)"),
+]
+SCHEMA_CHECKS = {
+    "layout": Check("layout", "", LEVEL_ERROR, "원본 레이아웃(헤더)을 찾을 수 없음"),
+    "empty_sheet": Check("empty_sheet", "", LEVEL_WARNING, "헤더 아래에 데이터 행이 없음"),
+}
+
+# 클렌징 후 "?" 비율 검사 컬럼 -> 예시로 보여줄 원본 컬럼
+UNKNOWN_COLUMNS = {
+    "model": ("model_raw", "trim_raw"),
+    "trim": ("model_raw", "trim_raw"),
+    "fuel": ("model_raw", "trim_raw"),
+    "color_exterior_family": ("code_color_a", "color_exterior"),
+    "color_interior_family": ("code_color_b", "color_interior"),
+}
+
+# 판매코드 칸에 들어가는 합계 행 표기 (데이터 행이 아님)
+SUMMARY_LABELS = ("합계", "소계", "총계")
+
+BRAND_LABELS = {"hyundai": "현대", "kia": "기아"}
+REPORT_COLUMNS = [
+    "stage", "scope", "check", "column", "level", "checked", "violations", "rate", "examples", "description",
+]
+
+
+def resolve_mode(mode):
+    """검증 모드 확인 (None이면 ValidationConfig.MODE)"""
+    mode = mode or ValidationConfig.MODE
+    if mode not in ("full", "sample"):
+        raise ValueError(f"알 수 없는 검증 모드: {mode} (full 또는 sample)")
+    return mode
+
+
+def raw_violation_masks(df):
+    """
+    원본 레이아웃 데이터의 검사별 위반 마스크 (컬럼 단위 벡터 연산, 빈 행/합계 행은 제외)
+
+    Returns:
+        (데이터 행 마스크, 검사명 -> 위반 마스크 dict)
+    """
+    summary = df["code_sales_a"].astype(str).str.strip().isin(SUMMARY_LABELS).to_numpy()
+    has_code = df["code_sales_a"].notna().to_numpy() & ~summary
+    has_price = df["price"].notna().to_numpy() & ~summary
+    rows = has_code | has_price
+
+    numeric = {
+        column: pd.to_numeric(df[column], errors="coerce").to_numpy(dtype="float64")
+        for column in ("request", "stock", "price")
+    }
+    stock = numeric["stock"]
+    price = numeric["price"]
+    stock_valid = ~np.isnan(stock)
+    price_valid = ~np.isnan(price)
+
+    # 옵션 표기는 고유 값마다 한 번만 확인
+    option_codes, option_values = pd.factorize(df["options"])
+    option_changed = np.array(
+        [clean_options_text(value) != value for value in option_values], dtype=bool
+    )
+    options_format = np.zeros(len(df), dtype=bool)
+    present = option_codes >= 0
+    options_format[present] = option_changed[option_codes[present]]
+
+    masks = {
+        "missing_price": has_code & ~has_price,
+        "missing_code": has_price & ~has_code,
+        "non_numeric_price": has_price & ~price_valid,
+        "non_numeric_stock": df["stock"].notna().to_numpy() & ~stock_valid,
+        "negative_stock": stock_valid & (stock < 0),
+        "missing_stock": rows & df["stock"].isna().to_numpy(),
+        "fractional_stock": stock_valid & (np.mod(stock, 1, where=stock_valid, out=np.zeros_like(stock)) != 0),
+        "stock_range": stock_valid & (stock > ValidationConfig.MAX_STOCK),
+        "price_range": price_valid & (
+            (price < ValidationConfig.MIN_PRICE) | (price > ValidationConfig.MAX_PRICE)
+        ),
+        "non_numeric_request": df["request"].notna().to_numpy() & np.isnan(numeric["request"]),
+        "options_format": rows & options_format,
+    }
+    return rows, {name: mask & rows for name, mask in masks.items()}
+
+
+def iter_raw_frames(date_str, mode):
+    """
+    날짜의 원본 파일(지점별 파일 포함)에서 검사할 시트 읽기 (숫자 컬럼은 원본 값 그대로)
+
+    Yields:
+        (브랜드, 시트 라벨, 헤더 행 위치, 데이터프레임, 레이아웃 오류 메시지)
+    """
+    nrows = ValidationConfig.SAMPLE_ROWS if mode == "sample" else None
+    sources = [
+        ("hyundai", FilePaths.get_hyundai_raw_files(date_str)),
+        ("kia", FilePaths.get_kia_raw_files(date_str)),
+    ]
+    for brand, paths in sources:
+        for path in paths:
+            with open_excel(path, brand) as book:
+                for sheet_name in list_target_sheets(brand, book.sheet_names):
+                    label = f"{os.path.basename(str(path))}[{sheet_name}]"
+                    try:
+                        layout, header_index, positions = locate_sheet_layout(book, sheet_name, brand)
+                    except ValueError as error:
+                        yield brand, label, None, None, str(error)
+                        continue
+                    df = read_layout_columns(
+                        book, sheet_name, layout, header_index, positions, nrows=nrows, coerce=False
+                    )
+                    yield brand, label, header_index, df, None
+
+
+def format_value(value):
+    """예시용 원본 값 표기 (빈 값은 "(빈 값)", 문자열은 따옴표)"""
+    if isinstance(value, str):
+        return repr(value)
+    if pd.isna(value):
+        return "(빈 값)"
+    return str(value)
+
+
+def new_entry(stage, scope, check):
+    """검사 결과 집계 항목"""
+    return {
+        "stage": stage, "scope": scope, "check": check.name, "column": check.column, "level": check.level,
+        "checked": 0, "violations": 0, "examples": [], "description": check.description,
+    }
+
+
+def add_examples(entry, examples):
+    """예시를 ValidationConfig.MAX_EXAMPLES개까지 추가"""
+    room = ValidationConfig.MAX_EXAMPLES - len(entry["examples"])
+    if room > 0:
+        entry["examples"].extend(examples[:room])
+
+
+def build_report(entries):
+    """집계 항목을 보고서 데이터프레임으로 변환"""
+    report = pd.DataFrame(entries, columns=[column for column in REPORT_COLUMNS if column != "rate"])
+    report["rate"] = (report["violations"] / report["checked"].clip(lower=1)).round(4)
+    report["examples"] = report["examples"].map("; ".join)
+    return report[REPORT_COLUMNS]
+
+
+def iter_loaded_frames(raw_data, mode):
+    """
+    read_raw_data()로 이미 읽은 원본에서 검사할 시트 (숫자 컬럼은 원본 값 그대로)
+
+    현대 시트 캐시에 있어 읽지 않은 시트는 캐시될 때 검증을 통과한 내용이므로 검사하지 않음
+
+    Yields:
+        iter_raw_frames()와 같은 형식
+    """
+    nrows = ValidationConfig.SAMPLE_ROWS if mode == "sample" else None
+    sources = [
+        ("hyundai", [(path, sheets) for path, sheets in raw_data["hyundai"]]),
+        ("kia", [(path, {"sheet1": df}) for path, df in raw_data["kia"]]),
+    ]
+    for brand, files in sources:
+        for path, sheets in files:
+            for sheet_name, df in (sheets or {}).items():
+                label = f"{os.path.basename(str(path))}[{sheet_name}]"
+                yield brand, label, df.attrs.get("header_index", 0), df.head(nrows) if nrows else df, None
+
+
+def validate_raw_frames(frames, mode):
+    """
+    원본 시트별 검사 결과를 브랜드별로 집계
+
+    Args:
+        frames: (브랜드, 시트 라벨, 헤더 행 위치, 데이터프레임, 레이아웃 오류 메시지) 이터러블
+        mode: 보고서 제목용 검증 모드
+
+    Returns:
+        보고서 데이터프레임
+    """
+    entries = {}
+
+    def entry_for(scope, check):
+        key = (scope, check.name)
+        if key not in entries:
+            entries[key] = new_entry("raw", scope, check)
+        return entries[key]
+
+    for brand, label, header_index, df, error in frames:
+        scope = BRAND_LABELS[brand]
+        for check in SCHEMA_CHECKS.values():
+            entry_for(scope, check)["checked"] += 1
+        if error is not None:
+            entry = entry_for(scope, SCHEMA_CHECKS["layout"])
+            entry["violations"] += 1
+            add_examples(entry, [f"{label}: {error}"])
+            continue
+
+        rows, masks = raw_violation_masks(df)
+        if not validate_dataframe(df[rows], list(df.columns), verbose=False):
+            entry = entry_for(scope, SCHEMA_CHECKS["empty_sheet"])
+            entry["violations"] += 1
+            add_examples(entry, [label])
+            continue
+
+        checked = int(rows.sum())
+        for check in RAW_CHECKS:
+            entry = entry_for(scope, check)
+            entry["checked"] += checked
+            violations = np.flatnonzero(masks[check.name])
+            entry["violations"] += len(violations)
+            # 예시: 시트 라벨 + 엑셀 행 번호 + 원본 값
+            values = df[check.column].to_numpy()
+            add_examples(entry, [
+                f"{label} {header_index + 2 + position}행: {format_value(values[position])}"
+                for position in violations[:ValidationConfig.MAX_EXAMPLES]
+            ])
+
+    report = build_report(list(entries.values()))
+    print_report(report, f"원본 검증 ({mode})")
+    return report
+
+
+def validate_raw_files(date_str=None, mode=None):
+    """
+    원본 단계 검증 (클렌징 전, 원본 파일을 검증용으로 읽음)
+
+    Args:
+        date_str: 처리 날짜 (YYMMDD)
+        mode: "full" 또는 "sample" (None이면 ValidationConfig.MODE)
+
+    Returns:
+        보고서 데이터프레임 (검증 비활성화 시 빈 보고서)
+    """
+    if not ValidationConfig.ENABLED:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+    if date_str is None:
+        date_str = get_today_date_string()
+    mode = resolve_mode(mode)
+    return validate_raw_frames(iter_raw_frames(date_str, mode), mode)
+
+
+def validate_raw_data(raw_data, mode=None):
+    """
+    원본 단계 검증 (클렌징 전, read_raw_data()로 읽은 원본을 그대로 검사하여 파일을 다시 읽지 않음)
+
+    Args:
+        raw_data: cleansing_unified.read_raw_data() 결과
+        mode: "full" 또는 "sample" (None이면 ValidationConfig.MODE)
+
+    Returns:
+        보고서 데이터프레임 (검증 비활성화 시 빈 보고서)
+    """
+    if not ValidationConfig.ENABLED:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+    mode = resolve_mode(mode)
+    return validate_raw_frames(iter_loaded_frames(raw_data, mode), mode)
+
+
+def validate_cleansed_data(df, mode=None):
+    """
+    클렌징 단계 검증 (회사별 "?" 비율)
+
+    Args:
+        df: 통합 클렌징 데이터프레임
+        mode: "full" 또는 "sample" (sample이면 SAMPLE_ROWS행 무작위 표본)
+
+    Returns:
+        보고서 데이터프레임 (검증 비활성화 시 빈 보고서)
+    """
+    if not ValidationConfig.ENABLED:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+    mode = resolve_mode(mode)
+    if mode == "sample" and len(df) > ValidationConfig.SAMPLE_ROWS:
+        df = df.sample(n=ValidationConfig.SAMPLE_ROWS, random_state=0)
+
+    columns = [column for column in UNKNOWN_COLUMNS if column in df.columns]
+    unknown = df[columns] == "?"
+    counts = unknown.groupby(df["company"], sort=False).agg(["sum", "count"])
+
+    entries = []
+    for company in counts.index:
+        company_rows = df["company"] == company
+        for column in columns:
+            violations = int(counts.loc[company, (column, "sum")])
+            checked = int(counts.loc[company, (column, "count")])
+            rate = violations / checked if checked else 0.0
+            level = LEVEL_WARNING if rate > ValidationConfig.MAX_UNKNOWN_RATE else LEVEL_INFO
+            entry = new_entry(
+                "cleansed", company,
+                Check(f"unknown_{column}", column, level, f'"{column}" 값이 "?" (추출 규칙/사전 미일치)'),
+            )
+            entry["checked"] = checked
+            entry["violations"] = violations
+            if violations:
+                # 예시: 가장 많이 나온 원본 값
+                source = df.loc[company_rows & unknown[column], list(UNKNOWN_COLUMNS[column])]
+                top = source.astype(str).agg(" ".join, axis=1).str.strip().value_counts()
+                add_examples(entry, [f"{value} ({count}행)" for value, count in top.items()])
+            entries.append(entry)
+
+    report = build_report(entries)
+    print_report(report, f"클렌징 결과 검증 ({mode})")
+    return report
+
+
+def print_report(report, title):
+    """위반이 있는 검사만 출력 (info 등급 제외)"""
+    shown = report[(report["violations"] > 0) & (report["level"] != LEVEL_INFO)]
+    if shown.empty:
+        print(f"✅ {title}: 이상 없음")
+        return
+    print(f"🩺 {title}:")
+    for row in shown.itertuples(index=False):
+        icon = "❌" if row.level == LEVEL_ERROR else "⚠️"
+        print(
+            f"   {icon} [{row.scope}] {row.check}: {row.violations}/{row.checked} ({row.rate:.1%}) "
+            f"- {row.description}"
+        )
+        if row.examples:
+            print(f"      예: {row.examples}")
+
+
+def raise_on_errors(report):
+    """FAIL_FAST면 오류 등급 위반이 MAX_ERROR_ROWS를 넘을 때 ValueError (클렌징 전 중단)"""
+    if not ValidationConfig.FAIL_FAST or report.empty:
+        return
+    errors = report[(report["level"] == LEVEL_ERROR) & (report["violations"] > ValidationConfig.MAX_ERROR_ROWS)]
+    if errors.empty:
+        return
+    summary = ", ".join(f"[{row.scope}] {row.check} {row.violations}건" for row in errors.itertuples(index=False))
+    raise ValueError(f"데이터 검증 실패로 클렌징을 중단합니다: {summary}")
+
+
+def save_validation_report(reports, date_str=None):
+    """
+    단계별 보고서를 합쳐 CSV로 저장
+
+    Returns:
+        보고서 파일 경로 (보고서가 비어 있으면 None)
+    """
+    reports = [report for report in reports if not report.empty]
+    if not reports:
+        return None
+    if date_str is None:
+        date_str = get_today_date_string()
+    path = FilePaths.get_results_file("validation", date_str)
+    pd.concat(reports, ignore_index=True).to_csv(path, index=False, encoding="utf-8-sig")
+    print(f"🩺 데이터 검증 보고서 저장: {path}")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="원본 데이터 검증 (클렌징 전)")
+    parser.add_argument("--date", default=None, help="처리 날짜 (YYMMDD, 기본: 오늘)")
+    parser.add_argument("--mode", choices=["full", "sample"], default=None, help="검증 모드 (기본: ValidationConfig.MODE)")
+    args = parser.parse_args()
+
+    date_str = args.date or get_today_date_string()
+    set_global_date(date_str)
+    report = validate_raw_files(date_str, args.mode)
+    save_validation_report([report], date_str)
+    errors = report[(report["level"] == LEVEL_ERROR) & (report["violations"] > ValidationConfig.MAX_ERROR_ROWS)]
+    sys.exit(1 if not errors.empty else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,11 @@
 통합 상수 모듈
 프로젝트 전체에서 사용되는 상수들을 중앙 관리
 """
+import os
 from datetime import datetime
 
+from src.utils.raw_bundles import BundleMember, list_raw_names, resolve_raw_file
+
 # 전역 날짜 설정 (기본값: None = 오늘 날짜 사용)
 _GLOBAL_DATE = None
 
@@ -20,17 +23,36 @@ def get_today_date_string():
     return datetime.now().strftime("%y%m%d")
 
 def get_raw_file_path(company, date_str=None):
-    """날짜가 포함된 raw 파일 경로를 생성"""
+    """날짜가 포함된 raw 파일 경로를 생성 (data/raw에 없으면 같은 폴더의 zip 번들 항목)"""
     if date_str is None:
         date_str = get_today_date_string()
     
     if company.lower() == "hyundai":
-        return f"data/raw/재고리스트_현대_{date_str}.xlsx"
+        return resolve_raw_file(f"data/raw/재고리스트_현대_{date_str}.xlsx")
     elif company.lower() == "kia":
-        return f"data/raw/재고리스트_기아_{date_str}.xls"
+        return resolve_raw_file(f"data/raw/재고리스트_기아_{date_str}.xls")
     else:
         raise ValueError(f"Unknown company: {company}")
 
+def get_raw_file_paths(company, date_str=None):
+    """
+    날짜의 raw 파일 목록 (기본 파일 + 지점별 파일 재고리스트_현대_YYMMDD_<지점>.xlsx, 이름순)
+
+    지점별 파일도 data/raw 또는 같은 폴더의 zip 번들에서 찾음
+    """
+    if date_str is None:
+        date_str = get_today_date_string()
+
+    primary = get_raw_file_path(company, date_str)
+    name = primary.name if isinstance(primary, BundleMember) else os.path.basename(primary)
+    stem, extension = os.path.splitext(name)
+    branches = [
+        resolve_raw_file(f"data/raw/{branch_name}")
+        for branch_name in list_raw_names("data/raw")
+        if branch_name.startswith(f"{stem}_") and branch_name.endswith(extension)
+    ]
+    return [primary] + branches
+
 # 파일 경로 설정
 class FilePaths:
     # Raw data files (동적 생성을 위한 함수들)
@@ -41,6 +63,14 @@ class FilePaths:
     @staticmethod 
     def get_kia_raw_file(date_str=None):
         return get_raw_file_path("kia", date_str)
+
+    @staticmethod
+    def get_hyundai_raw_files(date_str=None):
+        return get_raw_file_paths("hyundai", date_str)
+
+    @staticmethod
+    def get_kia_raw_files(date_str=None):
+        return get_raw_file_paths("kia", date_str)
     
     # 기존 호환성을 위한 속성들 (오늘 날짜 기본값)
     @property
@@ -53,20 +83,56 @@ class FilePaths:
     
     # Results paths (최종 결과 파일용)
     RESULTS_DIR = "results"
+    RULE_STATS_HISTORY = os.path.join(RESULTS_DIR, "rule_stats_history.json")
+    FUZZY_VOCAB = os.path.join(RESULTS_DIR, "fuzzy_vocab.json")
+    PUBLISHED_STATE = os.path.join(RESULTS_DIR, "published_upload.pkl")
+    FINGERPRINT_INDEX = os.path.join(RESULTS_DIR, "fingerprints.json")
+
+    # 스냅샷 저장소 (날짜별 클렌징 결과 + key_admin별 재고 이력)
+    SNAPSHOTS_DIR = os.path.join("data", "snapshots")
+    STOCK_HISTORY = os.path.join(SNAPSHOTS_DIR, "stock_history.pkl")
+
+    @staticmethod
+    def get_snapshot_file(date_str):
+        """날짜별 클렌징 스냅샷 경로"""
+        return os.path.join(FilePaths.SNAPSHOTS_DIR, f"cleansed_{date_str}.pkl")
+
+    # 현대 시트 단위 클렌징 캐시 (src/cleansing/sheet_cache.py)
+    SHEET_CACHE_DIR = os.path.join("data", "cache", "sheets")
+
+    # 참조 사전 (src/cleansing/color_codes.py)
+    REFERENCE_DIR = os.path.join("data", "reference")
+    COLOR_DICTIONARIES = {
+        "exterior": os.path.join(REFERENCE_DIR, "color_exterior.csv"),
+        "interior": os.path.join(REFERENCE_DIR, "color_interior.csv"),
+    }
     
     @staticmethod
-    def get_results_file(file_type, date_str=None):
-        """결과 파일 경로를 생성"""
+    def get_results_file(file_type, date_str=None, profile=None):
+        """결과 파일 경로를 생성 (profile: 기본 프로필이 아닌 리스팅 프로필명)"""
         if date_str is None:
             date_str = get_today_date_string()
 
-        import os
         results_dir = FilePaths.RESULTS_DIR
         if not os.path.exists(results_dir):
             os.makedirs(results_dir)
 
-        if file_type == "filtered":
+        if file_type == "filtered" and profile:
+            return os.path.join(results_dir, f"stock_filtered_{date_str}_{profile}.xlsx")
+        elif file_type == "filtered":
             return os.path.join(results_dir, f"stock_filtered_{date_str}.xlsx")
+        elif file_type == "rule_stats":
+            return os.path.join(results_dir, f"rule_stats_{date_str}.csv")
+        elif file_type == "changes":
+            return os.path.join(results_dir, f"changes_{date_str}.csv")
+        elif file_type == "threshold_sweep":
+            return os.path.join(results_dir, f"threshold_sweep_{date_str}.xlsx")
+        elif file_type == "color_review":
+            return os.path.join(results_dir, f"color_review_{date_str}.csv")
+        elif file_type == "validation":
+            return os.path.join(results_dir, f"validation_{date_str}.csv")
+        elif file_type == "rule_replay":
+            return os.path.join(results_dir, f"rule_replay_{date_str}.xlsx")
         else:
             raise ValueError(f"Unknown file_type: {file_type}")
 
@@ -77,6 +143,7 @@ FINAL_COLUMN_ORDER = [
     "request", "stock", "company", "model_raw", "trim_raw",
     "model", "trim", "year", "options",
     "fuel", "wheel_tire", "color_exterior", "color_interior",
+    "color_exterior_name", "color_exterior_family", "color_interior_name", "color_interior_family",
     "price", "key_admin"
 ]
 
@@ -92,5 +159,208 @@ class DataProcessing:
         "request", "stock", "company", "model_raw", "trim_raw",
         "model", "trim", "year", "options",
         "fuel", "wheel_tire", "color_exterior", "color_interior",
+        "color_exterior_name", "color_exterior_family", "color_interior_name", "color_interior_family",
         "price", "key_admin"
-    ]
\ No newline at end of file
+    ]
+
+
+
+# 리스팅 필터 프로필 (채널별 필터 조건)
+class ListingProfiles:
+    # 기본 프로필 (stock_filtered_YYMMDD.xlsx의 all/filtered/upload 시트)
+    DEFAULT = "default"
+
+    # 프로필명 -> 조건
+    #   stock_min: 재고 기준 (이 값 이상만 리스팅)
+    #   wheel_tire: 기본 휠&타이어 조건 적용 여부
+    #   builtin_cam: 빌트인캠/무옵션 조건 적용 여부
+    #   seating: 싼타페 하이브리드 5인승 / 팰리세이드 9인승 조건 적용 여부
+    #   max_days_of_supply: (선택) 재고 소진 예상 일수가 이 값을 넘는 key_admin 제외 (소진 속도 분석 필요)
+    # 기본 프로필 외의 프로필은 stock_filtered_YYMMDD_<프로필명>.xlsx로 저장
+    PROFILES = {
+        "default": {"stock_min": 3, "wheel_tire": True, "builtin_cam": True, "seating": True},
+        "stock5": {
+            "stock_min": DataProcessing.STOCK_THRESHOLD,
+            "wheel_tire": True,
+            "builtin_cam": True,
+            "seating": True,
+        },
+        "all_options": {"stock_min": 3, "wheel_tire": True, "builtin_cam": False, "seating": True},
+    }
+
+
+# 추출 규칙 통계 설정
+class RuleStatsConfig:
+    # 규칙별 적중 횟수 집계 여부
+    ENABLED = True
+
+    # 최근 이력의 적중 빈도로 규칙 평가 순서 재정렬 여부
+    REORDER = False
+
+    # 동시에 일치하는 규칙 쌍 기록 여부 (행마다 모든 규칙을 평가하므로 느림, 프로파일링용)
+    # REORDER를 켜기 전에 한 번 켜고 실행하여 패턴만으로 알 수 없는 겹침을 이력에 남김
+    RECORD_OVERLAPS = False
+
+    # 이력에 보관하고 재정렬에 사용할 최근 실행 수
+    HISTORY_RUNS = 14
+
+
+# 퍼지 매칭 보완 설정 (모델/트림 "?" 행)
+class FuzzyMatchConfig:
+    # 퍼지 매칭 사용 여부
+    ENABLED = True
+
+    # 문자 n-gram 길이
+    NGRAM = 3
+
+    # 검색할 상위 후보 수
+    TOP_K = 5
+
+    # 이 점수 이상이면 모델/트림 자동 지정
+    AUTO_ASSIGN_SCORE = 0.9
+
+    # 이 점수 이상이면 제안만 기록
+    SUGGEST_SCORE = 0.5
+
+    # 이 기간(일) 동안 보이지 않은 어휘 항목은 제거 (0 = 제거 안 함)
+    VOCAB_WINDOW_DAYS = 180
+
+
+# 스트리밍(청크) 처리 설정
+class StreamingConfig:
+    # run.py에서 스트리밍 모드 사용 여부 (대용량 통합 피드용)
+    ENABLED = False
+
+    # 청크당 행 수 (최대 메모리는 이 값에 비례)
+    CHUNK_SIZE = 5000
+
+
+# 원본 레이아웃 설정 (src/cleansing/raw_layouts.py)
+class RawLayoutConfig:
+    # 헤더 행을 찾을 때 확인하는 시트 앞부분 행 수
+    HEADER_SCAN_ROWS = 10
+
+
+# 엑셀 리더 설정 (src/cleansing/excel_readers.py)
+class ExcelReaderConfig:
+    # "auto" = 설치된 엔진을 파일 형식별로 벤치마크해 가장 빠른 엔진 사용
+    # 또는 "calamine"/"openpyxl"/"xlrd" 고정 (calamine은 python-calamine 선택 설치)
+    ENGINE = "auto"
+
+    # 벤치마크 반복 횟수 (엔진별 최솟값 비교)
+    BENCHMARK_ROUNDS = 2
+
+
+# 데이터 검증 설정 (src/cleansing/validation.py)
+class ValidationConfig:
+    ENABLED = True
+    # "full" = 전체 행 검사 (run.py 일괄 처리), "sample" = 시트별 앞부분 SAMPLE_ROWS행만 읽어 검사
+    MODE = "full"
+    # 사람이 지켜보지 않는 반복 실행(작업 큐 워커, 여러 날짜 backfill)에서 사용할 모드
+    UNATTENDED_MODE = "sample"
+    SAMPLE_ROWS = 500
+    # True면 오류 등급 검사 위반이 MAX_ERROR_ROWS를 넘을 때 클렌징 전에 중단
+    FAIL_FAST = True
+    MAX_ERROR_ROWS = 0
+    # 검사별 예시 행 수
+    MAX_EXAMPLES = 3
+    # 범위 검사 기준
+    MAX_STOCK = 1000
+    MIN_PRICE = 5_000_000
+    MAX_PRICE = 500_000_000
+    # 클렌징 후 "?" 비율이 이 값을 넘으면 경고 (회사별)
+    MAX_UNKNOWN_RATE = 0.2
+
+
+# 색상 코드 사전 설정 (src/cleansing/color_codes.py)
+class ColorConfig:
+    # True면 code_color_a(외장)/code_color_b(내장)를 사전의 표준 색상명/계열로 변환
+    ENABLED = True
+
+
+# 지점별 원본 병합 설정 (src/cleansing/source_merge.py)
+class SourceMergeConfig:
+    # 같은 차량으로 보는 코드 컬럼 (여러 지점 파일에 같은 키가 있으면 한 행으로 병합)
+    KEY_COLUMNS = ["code_sales_a", "code_sales_b", "code_color_a", "code_color_b"]
+    # 재고 충돌 처리: "sum"(지점 재고 합산), "max"(가장 많은 재고 행), "latest"(가장 최근 파일의 행)
+    POLICY = "max"
+
+
+# 현대 시트 캐시 설정
+class SheetCacheConfig:
+    # True면 내용이 같은 차종 시트는 이전 클렌징 결과를 재사용 (시트/공유 문자열/규칙 코드 기준)
+    ENABLED = True
+    # 보관할 최대 시트 수 (오래 사용하지 않은 항목부터 삭제)
+    MAX_ENTRIES = 300
+
+
+# 병렬 처리 설정
+class ParallelConfig:
+    # 현대 차종별 시트 병렬 처리 프로세스 수 (0 = CPU 코어 수, 1 = 순차 처리)
+    HYUNDAI_WORKERS = 0
+
+
+# 데이터프레임 엔진 설정
+class EngineConfig:
+    # key_admin 생성과 리스팅 조건 평가 엔진 ("pandas" 또는 "polars", polars는 선택 설치)
+    BACKEND = "pandas"
+
+
+# 업로드 설정 (upload 시트 → 카탈로그 엔드포인트)
+class UploadConfig:
+    ENABLED = False
+    ENDPOINT = ""  # 예: "https://catalogue.example.com/api/stock"
+    TOKEN_ENV = "STOCK_UPLOAD_TOKEN"  # 값이 있으면 Authorization: Bearer 헤더로 전송
+    BATCH_SIZE = 100
+    MAX_IN_FLIGHT = 4
+    TIMEOUT = 30  # 초
+    RETRIES = 3
+    BACKOFF_FACTOR = 0.5  # 재시도 대기: 0.5초, 1초, 2초 ...
+
+
+# 변경분 게시 설정
+class PublishConfig:
+    # True면 마지막 게시 대비 추가/변경/삭제 행만 results/changes_YYMMDD.csv로 저장
+    DELTA_ENABLED = False
+    # True면 변경분이 없을 때 결과 파일(stock_filtered_YYMMDD.xlsx) 생성을 건너뜀
+    SKIP_UNCHANGED_WORKBOOK = False
+
+
+# 입력 지문 설정
+class FingerprintConfig:
+    # True면 원본 파일과 규칙/필터 코드가 같은 결과가 이미 있을 때 다시 생성하지 않음
+    ENABLED = True
+
+
+# 재고 소진 속도 분석 설정
+class VelocityConfig:
+    # True면 실행마다 스냅샷을 저장하고 결과 파일에 velocity 시트 추가
+    ENABLED = True
+    # 일평균 소진량 계산 기간 (일)
+    WINDOW_DAYS = 14
+
+
+# key_admin별 최저가 차량 선택 설정 (src/listing/best_offers.py)
+class BestOfferConfig:
+    # True면 filtered 차량 중 key_admin별 최저가 차량을 결과 파일 best 시트로 추가
+    ENABLED = True
+    # key_admin별 선택 대수
+    TOP_K = 3
+    # 선택 대상 외장 색상 계열 (color_exterior_family, 빈 리스트면 색상 제한 없음)
+    COLOR_FAMILIES = ["화이트", "블랙", "그레이"]
+
+
+# 여러 날짜 파이프라인 처리 설정 (src/pipeline/backfill.py)
+class BackfillConfig:
+    PARSE_WORKERS = 1  # 다음 날짜 원본을 미리 읽는 프로세스 수
+    QUEUE_SIZE = 2  # 단계 사이 대기열 크기 (미리 읽은/쓰기 대기 날짜 수 상한, 메모리 상한)
+
+
+# 작업 큐 설정 (딜러 그룹 × 날짜 분산 처리)
+class WorkQueueConfig:
+    DB_PATH = os.path.join("results", "work_queue.sqlite")
+    GROUPS_DIR = "groups"  # groups/<그룹명>/data/raw/
+    DEFAULT_GROUP = "default"  # 프로젝트 루트의 data/raw
+    LEASE_SECONDS = 300  # 워커가 이 시간 동안 임대를 연장하지 못하면 다른 워커가 재시도
+    MAX_ATTEMPTS = 3
+    POLL_SECONDS = 2
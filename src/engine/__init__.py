@@ -0,0 +1,7 @@
+# Engine Module
+from .backends import ENGINE_NAMES, get_engine
+
+__all__ = [
+    'ENGINE_NAMES',
+    'get_engine'
+]
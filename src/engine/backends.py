@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+데이터프레임 엔진 선택 모듈
+key_admin 생성과 리스팅 조건 평가를 수행할 엔진(pandas 또는 polars)을 반환
+
+각 엔진 모듈은 같은 함수를 제공:
+    build_key_admin(df): company_model_trim_year 키 Series
+    evaluate_rule_flags(df): 리스팅 조건별 제외 여부 불리언 배열 dict
+"""
+
+import importlib
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.config.constants import EngineConfig
+
+
+ENGINE_NAMES = ("pandas", "polars")
+
+
+def get_engine(name=None):
+    """
+    엔진 모듈 반환
+
+    Args:
+        name: 엔진명 (None이면 EngineConfig.BACKEND)
+
+    Returns:
+        엔진 모듈 (polars가 설치되지 않은 경우 pandas 엔진)
+    """
+    if name is None:
+        name = EngineConfig.BACKEND
+    if name not in ENGINE_NAMES:
+        raise ValueError(f"지원하지 않는 엔진입니다: {name} (사용 가능: {', '.join(ENGINE_NAMES)})")
+
+    try:
+        return importlib.import_module(f"src.engine.{name}_engine")
+    except ImportError:
+        if name == "pandas":
+            raise
+        print(f"⚠️ {name}가 설치되어 있지 않아 pandas 엔진을 사용합니다.")
+        return importlib.import_module("src.engine.pandas_engine")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+엔진 적합성 확인 모듈
+같은 클렌징 결과에 엔진별로 key_admin 생성과 리스팅을 수행하여
+all/filtered/upload 결과가 pandas 엔진과 동일한지 확인
+
+사용법:
+    python -m src.engine.conformance --date 250901
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.config.constants import EngineConfig, set_global_date
+from src.engine.backends import ENGINE_NAMES, get_engine
+
+
+def run_engine(cleaned_df, name):
+    """
+    지정한 엔진으로 key_admin 생성과 리스팅 조건 평가 수행
+
+    Returns:
+        (시트명 -> 데이터프레임 dict, 소요 시간(초)), 엔진을 사용할 수 없으면 (None, 0)
+    """
+    from src.listing.listing_unified import build_upload_df, evaluate_listing
+
+    engine = get_engine(name)
+    if engine.NAME != name:
+        return None, 0.0
+
+    previous = EngineConfig.BACKEND
+    EngineConfig.BACKEND = name
+    try:
+        start = time.perf_counter()
+        df = cleaned_df.assign(key_admin=engine.build_key_admin(cleaned_df))
+        all_df, filtered_df, _, _ = evaluate_listing(df)
+        upload_df = build_upload_df(filtered_df)
+        elapsed = time.perf_counter() - start
+    finally:
+        EngineConfig.BACKEND = previous
+
+    return {"all": all_df, "filtered": filtered_df, "upload": upload_df}, elapsed
+
+
+def compare_outputs(expected, actual):
+    """시트별 비교 결과 (시트명 -> 불일치 메시지, 일치하면 None)"""
+    results = {}
+    for sheet, expected_df in expected.items():
+        try:
+            pd.testing.assert_frame_equal(expected_df, actual[sheet])
+            results[sheet] = None
+        except AssertionError as e:
+            results[sheet] = str(e).splitlines()[0]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터프레임 엔진 적합성 확인")
+    parser.add_argument("--date", help="처리 날짜 (YYMMDD, 기본값: 오늘)")
+    args = parser.parse_args()
+
+    if args.date:
+        set_global_date(args.date)
+
+    from src.cleansing.cleansing_unified import clean_all_data
+
+    cleaned_df = clean_all_data()
+
+    print("\n🧪 엔진 적합성 확인")
+    reference, elapsed = run_engine(cleaned_df, "pandas")
+    print(f"   - pandas: {elapsed:.3f}초 (기준)")
+
+    failed = False
+    for name in ENGINE_NAMES:
+        if name == "pandas":
+            continue
+        outputs, elapsed = run_engine(cleaned_df, name)
+        if outputs is None:
+            print(f"   - {name}: 설치되지 않아 건너뜀")
+            continue
+        for sheet, message in compare_outputs(reference, outputs).items():
+            if message is None:
+                print(f"   ✅ {name} [{sheet}] 일치 ({len(outputs[sheet])}행)")
+            else:
+                failed = True
+                print(f"   ❌ {name} [{sheet}] 불일치: {message}")
+        print(f"   - {name}: {elapsed:.3f}초")
+
+    if failed:
+        sys.exit(1)
+    print("✅ 모든 엔진 결과 일치")
+
+
+if __name__ == "__main__":
+    main()
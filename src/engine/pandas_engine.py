@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+pandas 엔진 (기본값)
+텍스트 조건은 고유값마다 한 번만 Python 함수로 평가하여 컬럼 전체에 펼침
+"""
+
+import numpy as np
+import pandas as pd
+
+
+NAME = "pandas"
+
+# key_admin 구성 컬럼 (순서대로 "_"로 연결)
+KEY_COLUMNS = ["company", "model", "trim", "year"]
+
+# 단독으로 허용되는 빌트인캠 옵션명 (외옵션 포함된 것은 제외)
+BUILTIN_CAM_OPTIONS = ("빌트인캠", "빌트인 캠 패키지", "빌트인캠2")
+
+
+def map_unique(series, func):
+    """고유값마다 한 번만 func를 평가하여 컬럼 전체에 펼치는 함수 (결측값 포함)"""
+    codes, uniques = pd.factorize(series)
+    values = np.array([func(value) for value in uniques] + [func(np.nan)])
+    return values[codes]
+
+
+def has_builtin_cam_only_or_no_option(option_str):
+    """빌트인캠만 있거나 무옵션인지 확인"""
+    if pd.isna(option_str) or option_str == "":
+        return True  # 무옵션 포함
+    option_str = str(option_str).strip()
+    if option_str == "" or option_str == "무옵션":
+        return True  # 무옵션 포함
+    # 정확히 빌트인캠 또는 빌트인 캠 패키지만 있는지 확인 (외옵션 제외)
+    options = [opt.strip() for opt in option_str.split(",") if opt.strip()]
+    if len(options) == 1:
+        return options[0] in BUILTIN_CAM_OPTIONS
+    return False
+
+
+def is_basic_wheel_tire(df):
+    """기본 휠&타이어 여부 (제네시스 브랜드는 18인치를 기본으로 간주)"""
+    is_basic = map_unique(df["wheel_tire"], lambda value: str(value).strip() == "기본 휠&타이어")
+    has_18 = map_unique(df["wheel_tire"], lambda value: "18인치" in str(value).strip())
+    is_genesis = map_unique(df["company"], lambda value: str(value).strip() == "제네시스")
+    return is_basic | (is_genesis & has_18)
+
+
+def build_key_admin(df):
+    """key_admin 컬럼 생성 (company_model_trim_year)"""
+    return df["company"] + "_" + df["model"] + "_" + df["trim"] + "_" + df["year"]
+
+
+def evaluate_rule_flags(df):
+    """
+    리스팅 조건별 제외 여부 평가 (재고 기준 제외)
+
+    Args:
+        df: 통합 클렌징 데이터프레임
+
+    Returns:
+        조건명 -> 불리언 배열 (True면 해당 조건으로 제외)
+    """
+    is_santafe_hybrid = map_unique(df["model"], lambda value: str(value).strip() == "싼타페 하이브리드")
+    is_palisade = map_unique(df["model"], lambda value: "팰리세이드" in str(value).strip())
+    # 싼타페 하이브리드: 6인승, 7인승 제외 (5인승만)
+    has_6_or_7 = map_unique(
+        df["trim_raw"], lambda value: "6인승" in str(value) or "7인승" in str(value)
+    )
+    # 팰리세이드: 7인승, 8인승 제외 (9인승만)
+    has_7_or_8 = map_unique(
+        df["trim_raw"], lambda value: "7인승" in str(value) or "8인승" in str(value)
+    )
+    has_allowed_options = map_unique(df["options"], has_builtin_cam_only_or_no_option)
+
+    return {
+        "wheel_tire": ~is_basic_wheel_tire(df),
+        "options": ~has_allowed_options,
+        "santafe_seating": is_santafe_hybrid & has_6_or_7,
+        "palisade_seating": is_palisade & has_7_or_8,
+    }
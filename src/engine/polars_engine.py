@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+polars 엔진 (선택 설치)
+필요한 텍스트 컬럼만 polars로 옮겨 lazy 쿼리로 평가 (멀티코어 문자열 처리)
+결과는 pandas 엔진과 동일해야 하며 src.engine.conformance로 확인
+"""
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from src.engine.pandas_engine import BUILTIN_CAM_OPTIONS, KEY_COLUMNS
+
+
+NAME = "polars"
+
+# 리스팅 조건 평가에 필요한 컬럼
+RULE_COLUMNS = ["wheel_tire", "company", "model", "trim_raw", "options"]
+
+
+def to_polars_text(series):
+    """pandas 컬럼을 polars 문자열 Series로 변환 (고유값만 str 변환, 결측값은 null)"""
+    codes, uniques = pd.factorize(series)
+    values = pl.Series(series.name, [str(value) for value in uniques] + [None], dtype=pl.String)
+    return values.gather(np.where(codes < 0, len(uniques), codes))
+
+
+def to_polars_frame(df, columns):
+    """지정한 컬럼만 polars 데이터프레임으로 변환"""
+    return pl.DataFrame([to_polars_text(df[column]) for column in columns])
+
+
+def build_key_admin(df):
+    """key_admin 컬럼 생성 (company_model_trim_year)"""
+    key = (
+        to_polars_frame(df, KEY_COLUMNS)
+        .lazy()
+        .select(pl.concat_str(KEY_COLUMNS, separator="_").alias("key_admin"))
+        .collect()
+        .to_series()
+    )
+    return pd.Series(key.to_numpy(), index=df.index, name="key_admin", dtype=df["company"].dtype)
+
+
+def evaluate_rule_flags(df):
+    """
+    리스팅 조건별 제외 여부 평가 (재고 기준 제외)
+
+    Args:
+        df: 통합 클렌징 데이터프레임
+
+    Returns:
+        조건명 -> 불리언 배열 (True면 해당 조건으로 제외)
+    """
+    wheel_tire = pl.col("wheel_tire").str.strip_chars()
+    model = pl.col("model").str.strip_chars()
+    trim_raw = pl.col("trim_raw")
+    options = pl.col("options").str.strip_chars()
+    option_items = (
+        options.str.split(",")
+        .list.eval(pl.element().str.strip_chars())
+        .list.eval(pl.element().filter(pl.element() != ""))
+    )
+
+    is_basic_wheel_tire = (wheel_tire == "기본 휠&타이어").fill_null(False) | (
+        (pl.col("company").str.strip_chars() == "제네시스")
+        & wheel_tire.str.contains("18인치", literal=True)
+    ).fill_null(False)
+    has_allowed_options = (
+        pl.col("options").is_null()
+        | options.is_in(["", "무옵션"])
+        | ((option_items.list.len() == 1) & option_items.list.first().is_in(list(BUILTIN_CAM_OPTIONS)))
+    ).fill_null(False)
+    # 싼타페 하이브리드: 6인승, 7인승 제외 (5인승만)
+    santafe_seating = (
+        (model == "싼타페 하이브리드")
+        & (trim_raw.str.contains("6인승", literal=True) | trim_raw.str.contains("7인승", literal=True))
+    ).fill_null(False)
+    # 팰리세이드: 7인승, 8인승 제외 (9인승만)
+    palisade_seating = (
+        model.str.contains("팰리세이드", literal=True)
+        & (trim_raw.str.contains("7인승", literal=True) | trim_raw.str.contains("8인승", literal=True))
+    ).fill_null(False)
+
+    flags = (
+        to_polars_frame(df, RULE_COLUMNS)
+        .lazy()
+        .select(
+            (~is_basic_wheel_tire).alias("wheel_tire"),
+            (~has_allowed_options).alias("options"),
+            santafe_seating.alias("santafe_seating"),
+            palisade_seating.alias("palisade_seating"),
+        )
+        .collect()
+    )
+    return {name: flags[name].to_numpy() for name in flags.columns}
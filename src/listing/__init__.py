@@ -1,6 +1,9 @@
 # Listing Module
 from .listing_unified import main as listing_unified_main
+from .listing_unified import build_upload_df, evaluate_listing
 
 __all__ = [
-    'listing_unified_main'
+    'listing_unified_main',
+    'build_upload_df',
+    'evaluate_listing'
 ]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+key_admin별 최저가 차량 선택 모듈
+필터링된 차량 중 재고가 있고 흔한 외장 색상 계열(BestOfferConfig.COLOR_FAMILIES)인 차량에서
+key_admin별 가격이 낮은 BestOfferConfig.TOP_K대를 골라 결과 파일 best 시트로 저장
+
+- key_admin을 정수 그룹 코드로 바꾼 뒤 그룹별 최솟값을 K번 뽑음 (전체 행 정렬 없음)
+- 뽑힌 행(key_admin 수 × K 이하)만 (key_admin, 순위)로 정렬
+- 청크별 선택 결과를 합쳐 다시 선택해도 전체에서 선택한 결과와 같음 (스트리밍 모드)
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.config.constants import BestOfferConfig
+
+
+def top_k_positions(codes, values, k):
+    """
+    그룹 코드별 값이 작은 k개 행 위치
+
+    한 번에 남은 행 전체를 훑어 그룹별 최솟값 행을 하나씩 뽑는 것을 k번 반복 (O(n·k), 같은 값이면 앞선 행 우선)
+
+    Args:
+        codes: 행별 그룹 코드 (0부터, -1이면 제외)
+        values: 행별 값 (NaN이면 제외)
+        k: 그룹별 선택 개수
+
+    Returns:
+        (행 위치, 그룹 안 순위(1부터)) - 그룹 코드 순, 그룹 안에서는 값 오름차순
+    """
+    group_count = int(codes.max()) + 1 if len(codes) else 0
+    active = np.flatnonzero((codes >= 0) & ~np.isnan(values))
+    removed = np.zeros(len(codes), dtype=bool)
+    picked = []
+    ranks = []
+    for rank in range(1, k + 1):
+        if len(active) == 0:
+            break
+        active_codes = codes[active]
+        active_values = values[active]
+        group_min = np.full(group_count, np.inf)
+        np.minimum.at(group_min, active_codes, active_values)
+
+        # 그룹 최솟값과 같은 행 중 그룹별 첫 행 (active는 행 순서)
+        candidates = np.flatnonzero(active_values == group_min[active_codes])
+        _, first = np.unique(active_codes[candidates], return_index=True)
+        chosen = active[candidates[first]]
+        picked.append(chosen)
+        ranks.append(np.full(len(chosen), rank))
+
+        removed[chosen] = True
+        active = active[~removed[active]]
+
+    if not picked:
+        return np.array([], dtype=np.intp), np.array([], dtype=np.intp)
+    positions = np.concatenate(picked)
+    ranks = np.concatenate(ranks)
+    order = np.lexsort((ranks, codes[positions]))
+    return positions[order], ranks[order]
+
+
+def select_best_offers(df, k=None, families=None):
+    """
+    key_admin별 최저가 차량 선택
+
+    Args:
+        df: 필터링된 데이터프레임 (filtered 시트, 이전 선택 결과를 합친 것도 가능)
+        k: key_admin별 선택 대수 (None이면 BestOfferConfig.TOP_K)
+        families: 선택 대상 외장 색상 계열 (None이면 BestOfferConfig.COLOR_FAMILIES)
+
+    Returns:
+        best_rank(key_admin 안 가격 순위) 컬럼이 앞에 붙은 데이터프레임 (key_admin 순, 가격 오름차순)
+    """
+    if k is None:
+        k = BestOfferConfig.TOP_K
+    if families is None:
+        families = BestOfferConfig.COLOR_FAMILIES
+
+    df = df.drop(columns="best_rank", errors="ignore")
+    mask = pd.to_numeric(df["stock"], errors="coerce").fillna(0).to_numpy() > 0
+    if families:
+        if "color_exterior_family" in df.columns:
+            mask &= df["color_exterior_family"].isin(families).to_numpy()
+        else:
+            print("⚠️ color_exterior_family 컬럼이 없어 색상 제한 없이 선택합니다 (ColorConfig.ENABLED 확인)")
+    candidates = df[mask]
+
+    codes, uniques = pd.factorize(candidates["key_admin"], sort=True)
+    prices = pd.to_numeric(candidates["price"], errors="coerce").to_numpy(dtype="float64")
+    positions, ranks = top_k_positions(codes, prices, k)
+
+    best = candidates.iloc[positions].reset_index(drop=True)
+    best.insert(0, "best_rank", ranks)
+    color_label = ", ".join(families) if families else "전체 색상"
+    print(f"🏷️ key_admin별 최저가 {k}대 선택 ({color_label}): {len(uniques)}개 key_admin → {len(best)}대")
+    return best
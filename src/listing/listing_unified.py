@@ -1,112 +1,368 @@
 #!/usr/bin/env python3
 import sys
 import os
+import numpy as np
 import pandas as pd
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 
 from src.cleansing.cleansing_unified import clean_all_data
+from src.analytics.velocity import map_days_of_supply
+from src.config.constants import ListingProfiles
+from src.engine import get_engine
 
 
-def main(cleaned_df=None):
+# 기본 프로필의 재고 필터링 기준 (이 값 이상만 리스팅)
+STOCK_MIN = ListingProfiles.PROFILES[ListingProfiles.DEFAULT]["stock_min"]
+
+# 제외 사유 비트 (exclude_mask 컬럼, 0이면 모든 조건 통과)
+EXCLUDE_LOW_STOCK = 1
+EXCLUDE_WHEEL_TIRE = 2
+EXCLUDE_OPTIONS = 4
+EXCLUDE_SANTAFE_SEATING = 8
+EXCLUDE_PALISADE_SEATING = 16
+EXCLUDE_SLOW_MOVING = 32  # 프로필 max_days_of_supply 사용 시에만
+
+# 필터 적용 순서대로의 (비트, 사유명)
+EXCLUDE_REASONS = [
+    (EXCLUDE_LOW_STOCK, f"재고 {STOCK_MIN}개 미만"),
+    (EXCLUDE_WHEEL_TIRE, "기본 휠&타이어 아님"),
+    (EXCLUDE_OPTIONS, "빌트인캠/무옵션 아님"),
+    (EXCLUDE_SANTAFE_SEATING, "싼타페 하이브리드 5인승 아님"),
+    (EXCLUDE_PALISADE_SEATING, "팰리세이드 9인승 아님"),
+    (EXCLUDE_SLOW_MOVING, "재고 소진 예상 일수 초과"),
+]
+
+# 필터 적용 순서대로의 단계명과 단계별 비트 (누적 통과 대수 출력용)
+STAGE_LABELS = [
+    f"재고 {STOCK_MIN}개 이상 필터 후",
+    "기본 휠&타이어 필터 후 (제네시스 18인치 포함)",
+    "빌트인캠 또는 무옵션 필터 후",
+    "승차정원 필터 후 (싼타페하이브리드 5인승, 팰리세이드 9인승)",
+    "소진 속도 필터 후 (max_days_of_supply)",
+]
+STAGE_BITS = [
+    EXCLUDE_LOW_STOCK,
+    EXCLUDE_WHEEL_TIRE,
+    EXCLUDE_OPTIONS,
+    EXCLUDE_SANTAFE_SEATING | EXCLUDE_PALISADE_SEATING,
+    EXCLUDE_SLOW_MOVING,
+]
+
+# 엔진 조건 평가 결과(evaluate_rule_flags) -> 제외 사유 비트
+RULE_FLAG_BITS = {
+    "wheel_tire": EXCLUDE_WHEEL_TIRE,
+    "options": EXCLUDE_OPTIONS,
+    "santafe_seating": EXCLUDE_SANTAFE_SEATING,
+    "palisade_seating": EXCLUDE_PALISADE_SEATING,
+}
+
+# 프로필 조건명 -> 제외 사유 비트
+PROFILE_RULE_BITS = {
+    "wheel_tire": EXCLUDE_WHEEL_TIRE,
+    "builtin_cam": EXCLUDE_OPTIONS,
+    "seating": EXCLUDE_SANTAFE_SEATING | EXCLUDE_PALISADE_SEATING,
+}
+
+
+def compute_rule_mask(df):
+    """
+    재고 기준을 제외한 리스팅 조건을 컬럼 단위로 한 번에 평가하여 비트마스크 생성
+
+    조건 평가는 설정된 데이터프레임 엔진(EngineConfig.BACKEND)이 수행하고,
+    재고 기준은 프로필마다 다르므로 apply_profile()에서 합침
+
+    Args:
+        df: 통합 클렌징 데이터프레임
+
+    Returns:
+        행별 제외 사유 비트마스크 (uint8 배열, 재고 비트 제외)
+    """
+    flags = get_engine().evaluate_rule_flags(df)
+    mask = np.zeros(len(df), dtype=np.uint8)
+    for rule, bit in RULE_FLAG_BITS.items():
+        mask[flags[rule]] |= bit
+    return mask
+
+
+def apply_profile(rule_mask, stock, profile, days_of_supply=None):
+    """
+    공통 비트마스크에 프로필 조건을 적용 (비트 연산만 수행)
+
+    Args:
+        rule_mask: compute_rule_mask() 결과
+        stock: 정수형 재고 배열
+        profile: ListingProfiles.PROFILES의 조건 dict
+        days_of_supply: 행별 재고 소진 예상 일수 (map_days_of_supply() 결과, 없으면 None)
+
+    Returns:
+        프로필 기준 제외 사유 비트마스크 (uint8 배열)
+    """
+    enabled_bits = 0
+    for rule, bits in PROFILE_RULE_BITS.items():
+        if profile.get(rule, True):
+            enabled_bits |= bits
+    mask = rule_mask & np.uint8(enabled_bits)
+    mask[stock < profile["stock_min"]] |= EXCLUDE_LOW_STOCK
+
+    # 소진 속도 조건: 이력이 부족한 key_admin(NaN)은 통과
+    max_days_of_supply = profile.get("max_days_of_supply")
+    if max_days_of_supply is not None and days_of_supply is not None:
+        mask[days_of_supply > max_days_of_supply] |= EXCLUDE_SLOW_MOVING
+    return mask
+
+
+def compute_exclude_mask(df, profile=None):
+    """
+    모든 리스팅 조건을 컬럼 단위로 한 번에 평가하여 제외 사유 비트마스크 생성
+
+    Args:
+        df: 통합 클렌징 데이터프레임 (stock은 정수형)
+        profile: 프로필 조건 dict (None이면 기본 프로필)
+
+    Returns:
+        행별 제외 사유 비트마스크 (uint8 Series)
+    """
+    if profile is None:
+        profile = ListingProfiles.PROFILES[ListingProfiles.DEFAULT]
+    mask = apply_profile(compute_rule_mask(df), df["stock"].to_numpy(), profile)
+    return pd.Series(mask, index=df.index, name="exclude_mask")
+
+
+def build_exclusion_breakdown(df):
+    """
+    제외 사유 × 모델별 집계표 생성 (한 행이 여러 사유에 동시에 해당할 수 있음)
+
+    Args:
+        df: exclude_mask 컬럼이 있는 데이터프레임
+
+    Returns:
+        company, model별 전체/통과 대수와 사유별 제외 대수
+    """
+    mask = df["exclude_mask"].to_numpy()
+    flags = pd.DataFrame(
+        {reason: (mask & bit) != 0 for bit, reason in EXCLUDE_REASONS},
+        index=df.index,
+    )
+    flags["전체"] = True
+    flags["통과"] = mask == 0
+    breakdown = flags.groupby([df["company"], df["model"]], sort=True).sum()
+    return breakdown[["전체", "통과"] + [reason for _, reason in EXCLUDE_REASONS]].reset_index()
+
+
+# 요약 시트 그룹 키와 컬럼별 집계 방식 (청크별 부분 집계도 같은 방식으로 합산)
+SUMMARY_KEYS = ["company", "model", "trim", "fuel"]
+SUMMARY_AGGREGATIONS = {
+    "전체 대수": "sum",
+    "전체 재고": "sum",
+    "최저가": "min",
+    "최고가": "max",
+    **{label: "sum" for label in STAGE_LABELS},
+    "통과 재고": "sum",
+    "통과 최저가": "min",
+    "통과 최고가": "max",
+}
+
+
+def build_summary(all_df, default_mask):
+    """
+    company/model/trim/fuel별 요약표 생성 (범주형 키로 groupby 한 번)
+
+    Args:
+        all_df: 리스팅 전체 데이터 (stock은 정수형)
+        default_mask: 기본 프로필 제외 사유 비트마스크
+
+    Returns:
+        그룹별 전체 대수/재고/가격 범위, 필터 단계별 누적 통과 대수, 통과 차량 재고/가격 범위
+    """
+    stock = all_df["stock"].to_numpy()
+    price = pd.to_numeric(all_df["price"], errors="coerce").to_numpy(dtype=float)
+    passed = default_mask == 0
+
+    columns = {key: all_df[key].astype("category") for key in SUMMARY_KEYS}
+    columns["전체 대수"] = np.ones(len(all_df), dtype=np.int64)
+    columns["전체 재고"] = stock
+    columns["최저가"] = price
+    columns["최고가"] = price
+    applied = 0
+    for label, bits in zip(STAGE_LABELS, STAGE_BITS):
+        applied |= bits
+        columns[label] = ((default_mask & applied) == 0).astype(np.int64)
+    columns["통과 재고"] = np.where(passed, stock, 0)
+    columns["통과 최저가"] = np.where(passed, price, np.nan)
+    columns["통과 최고가"] = columns["통과 최저가"]
+
+    frame = pd.DataFrame(columns, index=all_df.index)
+    return (
+        frame.groupby(SUMMARY_KEYS, observed=True, dropna=False, sort=True)
+        .agg(SUMMARY_AGGREGATIONS)
+        .reset_index()
+    )
+
+
+def merge_summaries(summaries):
+    """청크별 요약표를 합산 (build_summary()와 같은 결과)"""
+    combined = pd.concat(summaries, ignore_index=True)
+    return (
+        combined.groupby(SUMMARY_KEYS, dropna=False, sort=True)
+        .agg(SUMMARY_AGGREGATIONS)
+        .reset_index()
+    )
+
+
+def add_summary_total(summary):
+    """요약표 끝에 전체 합계 행 추가 (단계별 통과 대수 합계 = 단계별 누적 통과 대수)"""
+    total = {column: summary[column].agg(func) for column, func in SUMMARY_AGGREGATIONS.items()}
+    total_row = pd.DataFrame([{"company": "합계", "model": "", "trim": "", "fuel": "", **total}])
+    return pd.concat([summary.astype({key: object for key in SUMMARY_KEYS}), total_row], ignore_index=True)
+
+
+# 업로드 시트 컬럼
+UPLOAD_COLUMNS = [
+    "code_sales_a",
+    "code_sales_b",
+    "code_color_a",
+    "code_color_b",
+    "request",
+    "stock",
+    "company",
+    "model",
+    "trim",
+    "year",
+    "fuel",
+    "options",
+    "wheel_tire",
+    "color_exterior",
+    "color_interior",
+    "price"
+]
+
+
+def build_upload_df(filtered_df):
+    """업로드용 데이터 생성 (선택 컬럼만)"""
+    # 존재하는 컬럼만 선택 (Copy-on-Write로 filtered 데이터를 복사 없이 공유)
+    available_columns = [col for col in UPLOAD_COLUMNS if col in filtered_df.columns]
+    return filtered_df[available_columns]
+
+
+def evaluate_listing(cleaned_df, profiles=None, velocity_df=None):
+    """
+    리스팅 조건을 평가하여 전체/필터링/프로필별 데이터 생성 (행 단위 독립 → 청크 단위 처리 가능)
+
+    Args:
+        cleaned_df: 통합 클렌징 데이터프레임
+        profiles: 프로필명 -> 조건 dict (None이면 ListingProfiles.PROFILES)
+        velocity_df: 소진 속도 분석 결과 (프로필 max_days_of_supply 조건에 사용)
+
+    Returns:
+        all_df, filtered_df, profile_dfs, default_mask
+    """
+    if profiles is None:
+        profiles = ListingProfiles.PROFILES
+
+    # 재고 정수 변환
+    # 호출자의 cleaned_df는 수정하지 않고, assign으로 나머지 컬럼은 공유 (Copy-on-Write)
+    stock = pd.to_numeric(cleaned_df["stock"], errors="coerce").fillna(0).astype(int)
+
+    # 조건 컬럼은 한 번만 평가하고, 프로필별로는 비트 연산만 수행
+    rule_mask = compute_rule_mask(cleaned_df)
+    stock_values = stock.to_numpy()
+    days_of_supply = None
+    if velocity_df is not None:
+        days_of_supply = map_days_of_supply(cleaned_df, velocity_df)
+    profile_masks = {
+        name: apply_profile(rule_mask, stock_values, profile, days_of_supply)
+        for name, profile in profiles.items()
+    }
+    if ListingProfiles.DEFAULT in profile_masks:
+        default_mask = profile_masks[ListingProfiles.DEFAULT]
+    else:
+        default_profile = ListingProfiles.PROFILES[ListingProfiles.DEFAULT]
+        default_mask = apply_profile(rule_mask, stock_values, default_profile, days_of_supply)
+
+    # 전체 데이터 (필터 없음) + 제외 사유 비트마스크
+    all_df = cleaned_df.assign(stock=stock, exclude_mask=default_mask)
+
+    # 필터링 결과는 통과한 행만 한 번 추출 (단계별 중간 복사 없음)
+    filtered_df = all_df[default_mask == 0]
+
+    profile_dfs = {}
+    for name, profile_mask in profile_masks.items():
+        if name == ListingProfiles.DEFAULT:
+            profile_dfs[name] = filtered_df
+        else:
+            profile_dfs[name] = all_df[profile_mask == 0]
+
+    return all_df, filtered_df, profile_dfs, default_mask
+
+
+def count_stage_survivors(default_mask):
+    """필터 적용 순서대로 누적 통과 대수 계산"""
+    counts = []
+    applied = 0
+    for label, bits in zip(STAGE_LABELS, STAGE_BITS):
+        applied |= bits
+        counts.append((label, int(((default_mask & applied) == 0).sum())))
+    return counts
+
+
+def main(cleaned_df=None, profiles=None, velocity_df=None):
+    """
+    통합 리스팅 실행
+
+    Args:
+        cleaned_df: 통합 클렌징 데이터프레임 (None이면 새로 생성)
+        profiles: 프로필명 -> 조건 dict (None이면 ListingProfiles.PROFILES)
+        velocity_df: 소진 속도 분석 결과 (None이면 소진 속도 조건 미적용, velocity 시트 없음)
+
+    Returns:
+        all, filtered(기본 프로필), exclusions, summary(요약표), profiles(프로필별 필터링 결과),
+        velocity(소진 속도 분석 결과가 있는 경우) dict
+    """
     print("🚗 현대차 + 기아차 통합 재고 리스트 생성 시작...")
 
+    if profiles is None:
+        profiles = ListingProfiles.PROFILES
+
     # 1. 통합 데이터 전처리 (이미 제공된 경우 사용, 아니면 새로 생성)
     if cleaned_df is None:
         cleaned_df = clean_all_data()
 
-    result_df = cleaned_df
-
     # 2. 재고 필터링 및 추가 조건 적용
-    result_df["stock"] = pd.to_numeric(result_df["stock"], errors="coerce")
-    result_df["stock"] = result_df["stock"].fillna(0).astype(int)
-
-    # 전체 데이터 (필터 없음)
-    print(f"🔍 필터링 전: {len(result_df)}대, 컬럼 수: {len(result_df.columns)}")
-    all_df = result_df.copy()
+    print(f"🔍 필터링 전: {len(cleaned_df)}대, 컬럼 수: {len(cleaned_df.columns)}")
+    all_df, filtered_df, profile_dfs, default_mask = evaluate_listing(
+        cleaned_df, profiles, velocity_df
+    )
     print(f"📋 전체 데이터 (필터 없음): {len(all_df)}대")
 
-    # 재고 필터링 (3개 이상)
-    filtered_df = result_df[result_df["stock"] >= 3].copy()
-    print(f"🔍 재고 3개 이상 필터 후: {len(filtered_df)}대")
-
-    # 추가 필터링 조건 적용
-    # 1) 기본 휠&타이어만 (GV70은 18인치가 기본)
-    if len(filtered_df) > 0:
-
-        def is_basic_wheel_tire(row):
-            wheel_tire = str(row.get("wheel_tire", "")).strip()
-            company = str(row.get("company", "")).strip()
-
-            # 제네시스 브랜드는 18인치를 기본으로 간주
-            if company == "제네시스" and "18인치" in wheel_tire:
-                return True
-
-            # 일반적인 기본 휠&타이어
-            return wheel_tire == "기본 휠&타이어"
-
-        filtered_df = filtered_df[filtered_df.apply(is_basic_wheel_tire, axis=1)].copy()
-        print(f"🔍 기본 휠&타이어 필터 후 (제네시스 18인치 포함): {len(filtered_df)}대")
-
-    # 2) 빌트인캠만 또는 무옵션 차량 필터링
-    def filter_builtin_cam_or_no_option(df):
-        def has_builtin_cam_only_or_no_option(option_str):
-            if pd.isna(option_str) or option_str == "":
-                return True  # 무옵션 포함
-            option_str = str(option_str).strip()
-            if option_str == "" or option_str == "무옵션":
-                return True  # 무옵션 포함
-            # 정확히 빌트인캠 또는 빌트인 캠 패키지만 있는지 확인 (외옵션 제외)
-            options = [opt.strip() for opt in option_str.split(",") if opt.strip()]
-            if len(options) == 1:
-                option = options[0]
-                # 정확한 빌트인캠 옵션명만 허용 (외옵션 포함된 것은 제외)
-                return (
-                    option == "빌트인캠"
-                    or option == "빌트인 캠 패키지"
-                    or option == "빌트인캠2"
-                )
-            return False
-
-        return df[df["options"].apply(has_builtin_cam_only_or_no_option)]
-
-    filtered_df = filter_builtin_cam_or_no_option(filtered_df)
-    print(f"🔍 빌트인캠 또는 무옵션 필터 후: {len(filtered_df)}대")
-
-    # 3) 싼타페 하이브리드 5인승 & 팰리세이드 9인승 필터링
-    def filter_seating_requirements(df):
-        def should_exclude_by_seating(row):
-            model = str(row.get("model", "")).strip()
-            trim_raw = str(row.get("trim_raw", "")).strip()
-
-            # 싼타페 하이브리드인 경우: 6인승, 7인승 제외 (5인승만)
-            if model == "싼타페 하이브리드":
-                if "6인승" in trim_raw or "7인승" in trim_raw:
-                    return True  # 제외
-
-            # 팰리세이드인 경우: 7인승, 8인승 제외 (9인승만)
-            if "팰리세이드" in model or "디 올 뉴 팰리세이드" in model:
-                if "7인승" in trim_raw or "8인승" in trim_raw:
-                    return True  # 제외
-
-            return False  # 포함
-
-        return df[~df.apply(should_exclude_by_seating, axis=1)]
-
-    filtered_df = filter_seating_requirements(filtered_df)
-    print(
-        f"🔍 승차정원 필터 후 (싼타페하이브리드 5인승, 팰리세이드 9인승): {len(filtered_df)}대"
-    )
+    # 필터 적용 순서대로 누적 통과 대수 출력
+    for label, count in count_stage_survivors(default_mask):
+        print(f"🔍 {label}: {count}대")
+
+    exclusion_df = build_exclusion_breakdown(all_df)
+    summary_df = add_summary_total(build_summary(all_df, default_mask))
+
+    for name, profile_df in profile_dfs.items():
+        print(f"🔍 프로필 [{name}] (재고 {profiles[name]['stock_min']}개 이상): {len(profile_df)}대")
 
     print(f"\n✅ 완료!")
     print(f"📋 전체 데이터 (all 시트): {len(all_df)}대")
     print(f"📋 필터링된 데이터 (filtered 시트): {len(filtered_df)}대")
     print(
-        f"📊 필터링 조건: 재고 3개 이상 + 기본 휠&타이어 + (빌트인캠 또는 무옵션) + 싼타페하이브리드 5인승 + 팰리세이드 9인승"
+        f"📊 필터링 조건: 재고 {STOCK_MIN}개 이상 + 기본 휠&타이어 + (빌트인캠 또는 무옵션) + 싼타페하이브리드 5인승 + 팰리세이드 9인승"
     )
 
-    # 5. 전체 데이터와 필터링된 데이터 모두 반환
-    return {"all": all_df, "filtered": filtered_df}
+    # 5. 전체 데이터와 필터링된 데이터, 제외 사유 집계, 프로필별 결과 반환
+    result = {
+        "all": all_df,
+        "filtered": filtered_df,
+        "exclusions": exclusion_df,
+        "summary": summary_df,
+        "profiles": profile_dfs,
+    }
+    if velocity_df is not None:
+        result["velocity"] = velocity_df
+    return result
 
 
 if __name__ == "__main__":
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+규칙 소급 적용 모듈
+저장된 날짜별 클렌징 스냅샷 전체에 현재 리스팅 규칙을 한 번에 적용하여
+날짜별 게시 결과(results/stock_filtered_YYMMDD.xlsx의 filtered 시트)와 비교
+
+- 스냅샷(data/snapshots/cleansed_YYMMDD.pkl)을 date 컬럼과 함께 하나로 합친 뒤
+  evaluate_listing()을 한 번만 실행 (날짜마다 run.py를 다시 실행하지 않음)
+- --recleanse: 원본이 있는 날짜는 현재 추출 규칙으로 다시 클렌징 (현대 시트 캐시 사용, 원본이 없으면 스냅샷)
+- 차량 비교 키: date + 코드 키(SourceMergeConfig.KEY_COLUMNS) 64비트 해시
+- 결과: results/rule_replay_YYMMDD.xlsx
+  - by_date 시트: 날짜별 게시(before)/재적용(after) 대수, 추가/제외된 차량 수
+  - changes 시트: 새로 통과하는 차량(추가)과 더 이상 통과하지 않는 차량(제외, 제외 사유 포함)
+- 소진 속도 조건(max_days_of_supply)은 날짜별 재고 이력이 필요하므로 재적용하지 않음
+
+사용법:
+    python -m src.listing.rule_replay                          # 모든 스냅샷
+    python -m src.listing.rule_replay --from 250101 --to 251231
+    python -m src.listing.rule_replay --recleanse              # 추출 규칙 변경 확인
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.analytics.snapshots import list_snapshot_dates, load_snapshot
+from src.cleansing.excel_readers import is_engine_available
+from src.config.constants import (
+    FilePaths,
+    ListingProfiles,
+    SourceMergeConfig,
+    get_today_date_string,
+    set_global_date,
+)
+from src.listing.listing_unified import EXCLUDE_REASONS, evaluate_listing
+from src.utils.raw_bundles import raw_file_exists
+
+
+CHANGE_ADDED = "추가"
+CHANGE_REMOVED = "제외"
+CHANGE_COLUMNS = [
+    "date", "change", "exclude_reasons", "company", "model", "trim", "key_admin", "stock", "price",
+] + SourceMergeConfig.KEY_COLUMNS
+
+
+def has_raw_files(date_str):
+    """날짜의 현대/기아 기본 원본 파일이 모두 있는지 확인 (zip 번들 포함)"""
+    return raw_file_exists(FilePaths.get_hyundai_raw_file(date_str)) and raw_file_exists(
+        FilePaths.get_kia_raw_file(date_str)
+    )
+
+
+def load_history(dates, recleanse=False):
+    """
+    날짜별 클렌징 데이터를 date 컬럼과 함께 하나로 합침
+
+    Args:
+        dates: 날짜 목록 (YYMMDD)
+        recleanse: True면 원본이 있는 날짜는 현재 추출 규칙으로 다시 클렌징
+
+    Returns:
+        date 컬럼이 앞에 붙은 데이터프레임
+    """
+    frames = []
+    for date_str in dates:
+        if recleanse and has_raw_files(date_str):
+            from src.cleansing.cleansing_unified import clean_all_data, read_raw_data
+
+            set_global_date(date_str)
+            df = clean_all_data(read_raw_data(date_str))
+        else:
+            df = load_snapshot(date_str)
+        frames.append(df.assign(date=date_str))
+    history = pd.concat(frames, ignore_index=True)
+    return history[["date"] + [column for column in history.columns if column != "date"]]
+
+
+def load_published(dates):
+    """
+    날짜별 게시 결과(filtered 시트)의 코드 키
+
+    Returns:
+        (date + 코드 키 데이터프레임, 결과 파일이 있는 날짜 목록)
+    """
+    engine = "calamine" if is_engine_available("calamine") else None
+    frames = []
+    published_dates = []
+    for date_str in dates:
+        path = FilePaths.get_results_file("filtered", date_str)
+        if not os.path.exists(path):
+            continue
+        df = pd.read_excel(
+            path, sheet_name="filtered", usecols=SourceMergeConfig.KEY_COLUMNS, dtype=str, engine=engine
+        )
+        frames.append(df.assign(date=date_str))
+        published_dates.append(date_str)
+    if not frames:
+        return pd.DataFrame(columns=["date"] + SourceMergeConfig.KEY_COLUMNS), published_dates
+    return pd.concat(frames, ignore_index=True), published_dates
+
+
+def hash_dated_keys(df):
+    """date + 코드 키 컬럼의 행별 64비트 해시 (코드는 문자열로 맞춰 계산)"""
+    keys = df[["date"] + SourceMergeConfig.KEY_COLUMNS].astype(str)
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+
+def describe_exclusions(mask):
+    """제외 사유 비트마스크를 사유명 문자열로 변환 (고유 값마다 한 번만 계산)"""
+    codes, uniques = pd.factorize(pd.Series(mask))
+    labels = np.array(
+        [", ".join(reason for bit, reason in EXCLUDE_REASONS if int(value) & bit) for value in uniques],
+        dtype=object,
+    )
+    return labels[codes]
+
+
+def replay_rules(history, published, published_dates):
+    """
+    합친 클렌징 데이터에 현재 리스팅 규칙을 한 번에 적용하고 게시 결과와 비교
+
+    Args:
+        history: load_history() 결과
+        published: load_published()의 코드 키 데이터프레임
+        published_dates: 게시 결과가 있는 날짜 목록
+
+    Returns:
+        (날짜별 집계 데이터프레임, 변경 차량 데이터프레임)
+    """
+    default_profile = {ListingProfiles.DEFAULT: ListingProfiles.PROFILES[ListingProfiles.DEFAULT]}
+    all_df, filtered_df, _, default_mask = evaluate_listing(history, default_profile)
+
+    all_hash = hash_dated_keys(all_df)
+    passed = default_mask == 0
+    published_hash = hash_dated_keys(published)
+    has_published = all_df["date"].isin(published_dates).to_numpy()
+
+    # 추가: 지금 통과하지만 게시되지 않은 차량 (게시 결과가 있는 날짜만)
+    added = passed & has_published & ~np.isin(all_hash, published_hash)
+    # 제외: 게시되었지만 지금은 통과하지 않는 차량 (스냅샷 행에서 제외 사유 확인)
+    removed_hash = published_hash[~np.isin(published_hash, all_hash[passed])]
+    row_lookup = pd.Series(np.arange(len(all_df)), index=all_hash)
+    row_lookup = row_lookup[~row_lookup.index.duplicated()]
+    removed_rows = row_lookup.reindex(removed_hash).dropna().to_numpy(dtype=np.intp)
+    missing = len(removed_hash) - len(removed_rows)
+    if missing:
+        print(f"⚠️ 게시 결과의 차량 {missing}대는 스냅샷에 없어 변경 목록에서 빠집니다")
+
+    added_df = all_df[added].assign(change=CHANGE_ADDED)
+    removed_df = all_df.iloc[removed_rows].assign(change=CHANGE_REMOVED)
+    changes = pd.concat([added_df, removed_df], ignore_index=True)
+    changes["exclude_reasons"] = describe_exclusions(changes["exclude_mask"].to_numpy())
+    changes = changes.sort_values(["date", "change", "key_admin"], kind="stable", ignore_index=True)
+    changes = changes[[column for column in CHANGE_COLUMNS if column in changes.columns]]
+
+    # 날짜별 대수 (날짜 코드로 bincount)
+    dates = sorted(all_df["date"].unique())
+    date_index = pd.Index(dates)
+
+    def count_by_date(values):
+        return np.bincount(date_index.get_indexer(values), minlength=len(dates))
+
+    by_date = pd.DataFrame({
+        "date": dates,
+        "vehicles": count_by_date(all_df["date"]),
+        "before": count_by_date(published["date"]),
+        "after": count_by_date(filtered_df["date"]),
+        "added": count_by_date(changes.loc[changes["change"] == CHANGE_ADDED, "date"]),
+        "removed": count_by_date(changes.loc[changes["change"] == CHANGE_REMOVED, "date"]),
+    })
+    # 게시 결과가 없는 날짜는 비교 불가
+    no_published = ~by_date["date"].isin(published_dates)
+    by_date[["before", "added", "removed"]] = by_date[["before", "added", "removed"]].astype("Int64")
+    by_date.loc[no_published, ["before", "added", "removed"]] = pd.NA
+    return by_date, changes
+
+
+def save_replay(by_date, changes, date_str=None):
+    """규칙 소급 적용 결과 저장 (by_date, changes 시트)"""
+    path = FilePaths.get_results_file("rule_replay", date_str)
+    with pd.ExcelWriter(path, engine="openpyxl", mode="w") as writer:
+        by_date.to_excel(writer, sheet_name="by_date", index=False)
+        changes.to_excel(writer, sheet_name="changes", index=False)
+    print(f"✅ 규칙 소급 적용 결과 저장: {path}")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장된 스냅샷 전체에 현재 리스팅 규칙 소급 적용")
+    parser.add_argument("--from", dest="date_from", help="시작 날짜 (YYMMDD, 포함)")
+    parser.add_argument("--to", dest="date_to", help="끝 날짜 (YYMMDD, 포함)")
+    parser.add_argument("--recleanse", action="store_true", help="원본이 있는 날짜는 현재 추출 규칙으로 다시 클렌징")
+    args = parser.parse_args()
+
+    dates = [
+        date_str for date_str in list_snapshot_dates()
+        if (args.date_from is None or date_str >= args.date_from)
+        and (args.date_to is None or date_str <= args.date_to)
+    ]
+    if not dates:
+        print("❌ 소급 적용할 스냅샷이 없습니다 (python -m src.analytics.snapshots --backfill로 채우기)")
+        return
+    today = get_today_date_string()
+
+    print(f"📚 스냅샷 {len(dates)}개 날짜 ({dates[0]} ~ {dates[-1]}) 로드 중...")
+    history = load_history(dates, recleanse=args.recleanse)
+    published, published_dates = load_published(dates)
+    print(f"🔁 {len(history)}대에 현재 규칙 적용 (게시 결과 {len(published_dates)}개 날짜와 비교)")
+
+    by_date, changes = replay_rules(history, published, published_dates)
+    changed_dates = int(((by_date["added"] > 0) | (by_date["removed"] > 0)).sum())
+    print(
+        f"📊 변경 날짜 {changed_dates}개: 추가 {int(by_date['added'].sum())}대, "
+        f"제외 {int(by_date['removed'].sum())}대"
+    )
+    save_replay(by_date, changes, today)
+
+
+if __name__ == "__main__":
+    main()
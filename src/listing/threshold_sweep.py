@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+재고 기준 민감도 분석 모듈
+재고 기준 1~N개 × 리스팅 조건(휠&타이어/빌트인캠/승차정원) 켜기/끄기 조합별
+통과 대수를 모델/브랜드별로 집계 (필터를 다시 실행하지 않고 한 번에 계산)
+
+(모델, 조건 비트마스크, 재고) 히스토그램을 한 번 만든 뒤,
+조합마다 허용되는 비트마스크만 더하고 재고 축 역누적합으로 "재고 t개 이상" 대수를 구함
+
+사용법:
+    python -m src.listing.threshold_sweep --date 250901 --max-stock 10
+"""
+
+import argparse
+import itertools
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.config.constants import FilePaths, set_global_date
+from src.listing.listing_unified import PROFILE_RULE_BITS, RULE_FLAG_BITS, compute_rule_mask
+
+
+DEFAULT_MAX_STOCK = 10
+SWEEP_KEYS = ["company", "model"]
+RULE_TOGGLES = list(PROFILE_RULE_BITS)
+BRAND_TOTAL_LABEL = "(전체)"
+PASSED_COLUMN = "조건 통과"
+
+
+def threshold_columns(max_stock):
+    """재고 기준별 컬럼명"""
+    return [f"재고 {threshold}개 이상" for threshold in range(1, max_stock + 1)]
+
+
+def sweep_thresholds(cleaned_df, max_stock=DEFAULT_MAX_STOCK):
+    """
+    재고 기준 × 조건 조합별 모델 단위 통과 대수 계산
+
+    Args:
+        cleaned_df: 통합 클렌징 데이터프레임
+        max_stock: 확인할 최대 재고 기준 (1 ~ max_stock)
+
+    Returns:
+        company, model, 조건 켜기 여부(wheel_tire/builtin_cam/seating),
+        조건 통과(재고 무관), 재고 t개 이상 통과 대수 컬럼의 데이터프레임
+    """
+    stock = pd.to_numeric(cleaned_df["stock"], errors="coerce").fillna(0).astype(int).to_numpy()
+    levels = np.clip(stock, 0, max_stock)
+    rule_mask = compute_rule_mask(cleaned_df).astype(np.int64)
+    mask_space = 1 << max(RULE_FLAG_BITS.values()).bit_length()
+
+    grouped = cleaned_df.groupby(SWEEP_KEYS, sort=True, dropna=False)
+    codes = grouped.ngroup().to_numpy()
+    keys = grouped.size().index.to_frame(index=False)
+
+    # 모델 × 비트마스크 × 재고(0 ~ max_stock, 초과는 max_stock) 히스토그램
+    width = max_stock + 1
+    histogram = np.bincount(
+        (codes * mask_space + rule_mask) * width + levels,
+        minlength=len(keys) * mask_space * width,
+    ).reshape(len(keys), mask_space, width)
+
+    frames = []
+    for toggles in itertools.product([True, False], repeat=len(RULE_TOGGLES)):
+        enabled_bits = 0
+        for rule, enabled in zip(RULE_TOGGLES, toggles):
+            if enabled:
+                enabled_bits |= PROFILE_RULE_BITS[rule]
+        allowed = [mask for mask in range(mask_space) if mask & enabled_bits == 0]
+        per_level = histogram[:, allowed, :].sum(axis=1)
+        at_least = per_level[:, ::-1].cumsum(axis=1)[:, ::-1]  # [:, t] = 재고 t개 이상
+
+        frame = keys.copy()
+        for rule, enabled in zip(RULE_TOGGLES, toggles):
+            frame[rule] = enabled
+        frame[PASSED_COLUMN] = at_least[:, 0]
+        frame[threshold_columns(max_stock)] = at_least[:, 1:]
+        frames.append(frame)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def summarize_by_brand(sweep_df, max_stock=DEFAULT_MAX_STOCK):
+    """모델 단위 결과를 브랜드별/전체 합계로 집계"""
+    count_columns = [PASSED_COLUMN] + threshold_columns(max_stock)
+    brand_df = (
+        sweep_df.groupby(["company"] + RULE_TOGGLES, sort=False)[count_columns]
+        .sum()
+        .reset_index()
+    )
+    brand_df.insert(1, "model", BRAND_TOTAL_LABEL)
+    total_df = sweep_df.groupby(RULE_TOGGLES, sort=False)[count_columns].sum().reset_index()
+    total_df.insert(0, "company", "합계")
+    total_df.insert(1, "model", BRAND_TOTAL_LABEL)
+    return pd.concat([brand_df, total_df], ignore_index=True)
+
+
+def save_sweep(sweep_df, brand_df, date_str):
+    """민감도 분석 결과 저장 (by_brand, by_model 시트)"""
+    path = FilePaths.get_results_file("threshold_sweep", date_str)
+    with pd.ExcelWriter(path, engine="openpyxl", mode="w") as writer:
+        brand_df.to_excel(writer, sheet_name="by_brand", index=False)
+        sweep_df.to_excel(writer, sheet_name="by_model", index=False)
+    print(f"✅ 재고 기준 민감도 분석 저장: {path}")
+    return path
+
+
+def load_cleaned_data(date_str):
+    """날짜의 통합 클렌징 데이터 (스냅샷이 있으면 스냅샷, 없으면 원본에서 생성)"""
+    if os.path.exists(FilePaths.get_snapshot_file(date_str)):
+        from src.analytics.snapshots import load_snapshot
+
+        print(f"📂 스냅샷 사용: {FilePaths.get_snapshot_file(date_str)}")
+        return load_snapshot(date_str)
+
+    from src.cleansing.cleansing_unified import clean_all_data
+
+    return clean_all_data()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="재고 기준 × 리스팅 조건 민감도 분석")
+    parser.add_argument("--date", help="처리 날짜 (YYMMDD, 기본값: 오늘)")
+    parser.add_argument("--max-stock", type=int, default=DEFAULT_MAX_STOCK, help="확인할 최대 재고 기준")
+    args = parser.parse_args()
+
+    if args.date:
+        set_global_date(args.date)
+    from src.config.constants import get_today_date_string
+
+    date_str = get_today_date_string()
+    cleaned_df = load_cleaned_data(date_str)
+
+    sweep_df = sweep_thresholds(cleaned_df, args.max_stock)
+    brand_df = summarize_by_brand(sweep_df, args.max_stock)
+
+    # 모든 조건을 켰을 때의 전체 통과 대수 출력
+    all_on = brand_df[(brand_df["company"] == "합계") & brand_df[RULE_TOGGLES].all(axis=1)]
+    counts = all_on[threshold_columns(args.max_stock)].iloc[0]
+    print("📊 모든 조건 적용 시 재고 기준별 통과 대수:")
+    print("   " + ", ".join(f"{threshold}개↑ {int(count)}대" for threshold, count in enumerate(counts, start=1)))
+
+    save_sweep(sweep_df, brand_df, date_str)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+# Pipeline Module
+from .streaming import run_streaming
+
+__all__ = [
+    'run_streaming'
+]
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+여러 날짜 파이프라인 처리 모듈
+원본 읽기 → 클렌징/리스팅 → 결과 파일 쓰기 단계를 asyncio로 겹쳐 실행
+
+- 읽기: 프로세스 풀에서 다음 날짜 원본을 미리 읽고 검증 (시트 캐시에 있는 시트, 결과가 최신인 날짜는 건너뜀,
+  검증은 ValidationConfig.UNATTENDED_MODE)
+- 클렌징/리스팅: 규칙 통계, 스냅샷 이력, 퍼지 매칭 어휘, 게시 상태가 이전 날짜에 이어지므로
+  스레드 하나에서 날짜 순서대로 실행
+- 쓰기: 결과 파일(openpyxl)은 쓰기 프로세스에서 생성하고, 성공한 뒤에 지문 기록과 게시
+  (게시 상태 저장, 업로드, 퍼지 매칭 어휘 반영)를 처리 스레드에서 실행
+  → 다음 날짜 클렌징/리스팅은 이전 날짜 게시가 끝난 뒤 시작 (다음 날짜 원본 읽기는 계속 겹침)
+- 단계 사이 대기열 크기를 제한하여 (BackfillConfig.QUEUE_SIZE) 메모리 사용량 상한 유지
+
+처리량은 가장 느린 단계에 가까워짐 (종료 시 단계별 소요 시간과 날짜/시간 출력)
+
+사용법:
+    python -m src.pipeline.backfill                 # data/raw의 모든 날짜
+    python -m src.pipeline.backfill 250901 250902   # 지정한 날짜
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.config.constants import (
+    BackfillConfig,
+    FingerprintConfig,
+    ValidationConfig,
+    VelocityConfig,
+    WorkQueueConfig,
+    set_global_date,
+)
+
+
+DONE = None  # 대기열 종료 표시
+
+
+def prefetch_date(date_str):
+    """
+    날짜 원본을 미리 읽고 검증 (읽기 프로세스에서 실행)
+
+    Returns:
+        date, fingerprint(지문 정보, 미사용 시 None), current(결과가 이미 최신), raw_data, raw_report, seconds dict
+    """
+    from src.cleansing.cleansing_unified import read_raw_data
+    from src.cleansing.validation import validate_raw_data
+    from src.pipeline.fingerprint import compute_fingerprint, is_output_current
+
+    start = time.perf_counter()
+    fingerprint = compute_fingerprint(date_str) if FingerprintConfig.ENABLED else None
+    current = fingerprint is not None and is_output_current(date_str, fingerprint["fingerprint"])
+    raw_data = None if current else read_raw_data(date_str)
+    raw_report = None if current else validate_raw_data(raw_data, ValidationConfig.UNATTENDED_MODE)
+    return {
+        "date": date_str,
+        "fingerprint": fingerprint,
+        "current": current,
+        "raw_data": raw_data,
+        "raw_report": raw_report,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def process_date(prefetched):
+    """
+    클렌징 → 리스팅 → 게시 (처리 스레드에서 날짜 순서대로 실행)
+
+    Returns:
+        결과 파일을 써야 하면 prepare_results() 결과 (게시는 결과 파일을 쓴 뒤 publish_date에서), 아니면 None
+    """
+    import run
+    from src.analytics.snapshots import ensure_snapshot
+    from src.pipeline.fingerprint import reuse_existing_output
+
+    date_str = prefetched["date"]
+    fingerprint = prefetched["fingerprint"]
+    set_global_date(date_str)
+    if fingerprint is not None and reuse_existing_output(date_str, fingerprint):
+        if VelocityConfig.ENABLED:
+            ensure_snapshot(date_str)
+        return None
+
+    prepared = run.prepare_results(
+        date_str,
+        prefetched["raw_data"],
+        raw_report=prefetched["raw_report"],
+        validation_mode=ValidationConfig.UNATTENDED_MODE,
+    )
+    if not prepared["write"]:
+        run.finish_results(date_str, prepared)
+        return None
+    return prepared
+
+
+def publish_date(date_str, prepared, fingerprint):
+    """결과 파일을 쓴 뒤 지문 기록과 게시 (처리 스레드에서 날짜 순서대로 실행, run_pipeline()과 같은 순서)"""
+    import run
+    from src.pipeline.fingerprint import record_fingerprint
+
+    if fingerprint is not None:
+        record_fingerprint(date_str, fingerprint)
+    run.finish_results(date_str, prepared)
+
+
+def write_date(date_str, result_dict, fingerprint):
+    """결과 파일 생성 (쓰기 프로세스에서 실행)"""
+    import run
+
+    start = time.perf_counter()
+    run.create_final_result_file(date_str, result_dict, fingerprint and fingerprint["fingerprint"])
+    return time.perf_counter() - start
+
+
+async def cancel_all(tasks):
+    """끝나지 않은 작업을 취소하고 종료될 때까지 대기"""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run_backfill_async(dates):
+    """
+    날짜 목록을 읽기/처리/쓰기 단계로 겹쳐 실행
+
+    Returns:
+        단계별 소요 시간(초)과 전체 소요 시간, 날짜별 상태 dict
+    """
+    loop = asyncio.get_running_loop()
+    parsed = asyncio.Queue(maxsize=BackfillConfig.QUEUE_SIZE)
+    finished = asyncio.Queue(maxsize=BackfillConfig.QUEUE_SIZE)
+    busy = {"read": 0.0, "process": 0.0, "write": 0.0}
+    status = {}
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=BackfillConfig.PARSE_WORKERS) as read_pool, \
+            ThreadPoolExecutor(max_workers=1) as process_pool, \
+            ProcessPoolExecutor(max_workers=1) as write_pool:
+
+        async def read_stage():
+            # 날짜 순서를 유지하면서 최대 PARSE_WORKERS개 날짜를 동시에 읽음
+            pending = deque()
+            for date_str in dates:
+                pending.append((date_str, loop.run_in_executor(read_pool, prefetch_date, date_str)))
+                if len(pending) >= BackfillConfig.PARSE_WORKERS:
+                    await parsed.put(await collect_read(*pending.popleft()))
+            while pending:
+                await parsed.put(await collect_read(*pending.popleft()))
+            await parsed.put(DONE)
+
+        async def collect_read(date_str, future):
+            try:
+                prefetched = await future
+            except Exception as error:
+                print(f"❌ [{date_str}] 원본 읽기 실패: {error}")
+                status[date_str] = "failed"
+                return {"date": date_str, "error": True}
+            busy["read"] += prefetched["seconds"]
+            return prefetched
+
+        async def process_stage():
+            published = None  # 이전 날짜 게시 완료 (게시 상태/어휘가 이어지므로 그 뒤에 처리)
+            while (prefetched := await parsed.get()) is not DONE:
+                date_str = prefetched["date"]
+                if prefetched.get("error"):
+                    continue
+                if published is not None:
+                    await published
+                step_start = time.perf_counter()
+                try:
+                    output = await loop.run_in_executor(process_pool, process_date, prefetched)
+                except Exception as error:
+                    print(f"❌ [{date_str}] 처리 실패: {error}")
+                    status[date_str] = "failed"
+                    continue
+                finally:
+                    busy["process"] += time.perf_counter() - step_start
+                if output is None:
+                    status[date_str] = "reused"
+                    continue
+                published = loop.create_future()
+                await finished.put((date_str, output, prefetched["fingerprint"], published))
+            await finished.put(DONE)
+
+        async def write_one(date_str, prepared, fingerprint, published):
+            try:
+                busy["write"] += await loop.run_in_executor(
+                    write_pool, write_date, date_str, prepared["result_dict"], fingerprint
+                )
+                # 결과 파일을 쓴 뒤에만 게시 (쓰기 실패 시 게시 상태/업로드가 앞서 나가지 않음)
+                step_start = time.perf_counter()
+                await loop.run_in_executor(process_pool, publish_date, date_str, prepared, fingerprint)
+                busy["process"] += time.perf_counter() - step_start
+                status[date_str] = "written"
+            except Exception as error:
+                print(f"❌ [{date_str}] 결과 파일 쓰기/게시 실패: {error}")
+                status[date_str] = "failed"
+            finally:
+                published.set_result(None)
+
+        async def write_stage():
+            while (item := await finished.get()) is not DONE:
+                await write_one(*item)
+
+        # 한 단계가 실패하면 나머지 단계도 취소 (대기열에서 멈추지 않도록, Python 3.9 호환)
+        stages = [asyncio.ensure_future(stage()) for stage in (read_stage, process_stage, write_stage)]
+        try:
+            await asyncio.gather(*stages)
+        except BaseException:
+            await cancel_all(stages)
+            raise
+
+    return {"busy": busy, "elapsed": time.perf_counter() - start, "status": status}
+
+
+def run_backfill(dates):
+    """여러 날짜 파이프라인 처리 후 처리량 출력"""
+    dates = sorted(dates)
+    print(f"🚀 파이프라인 처리 시작: {len(dates)}개 날짜 (읽기 {BackfillConfig.PARSE_WORKERS} 프로세스)")
+    report = asyncio.run(run_backfill_async(dates))
+
+    elapsed = report["elapsed"]
+    counts = {}
+    for state in report["status"].values():
+        counts[state] = counts.get(state, 0) + 1
+    print(f"\n📊 파이프라인 처리 결과: " + ", ".join(f"{state} {count}개" for state, count in sorted(counts.items())))
+    for stage, seconds in report["busy"].items():
+        print(f"   - {stage} 단계: {seconds:.1f}초")
+    slowest = max(report["busy"], key=report["busy"].get)
+    print(f"   - 전체: {elapsed:.1f}초 (단계 합계 {sum(report['busy'].values()):.1f}초, 가장 느린 단계: {slowest})")
+    if elapsed > 0:
+        print(f"⏱️ 처리량: {len(dates) / elapsed * 3600:.1f} 날짜/시간")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 날짜 파이프라인 처리 (읽기/클렌징/쓰기 단계 겹쳐 실행)")
+    parser.add_argument("dates", nargs="*", help="처리 날짜 (YYMMDD, 생략하면 data/raw의 모든 날짜)")
+    args = parser.parse_args()
+
+    dates = args.dates
+    if not dates:
+        from src.pipeline.work_queue import discover_tasks
+
+        dates = [date_str for _, date_str in discover_tasks([WorkQueueConfig.DEFAULT_GROUP])]
+    if not dates:
+        print("⚠️ 처리할 날짜가 없습니다.")
+        return
+    run_backfill(dates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+입력 지문 모듈
+원본 파일(현대/기아, 지점별 파일 포함)의 내용 해시 + 규칙/필터 코드와 설정 해시로 실행 지문을 만들어
+결과 파일에 기록하고, 같은 지문의 결과가 이미 있으면 다시 생성하지 않음
+
+- 같은 날짜 재실행: 결과 파일에 기록된 지문이 같으면 건너뜀
+- 다른 날짜로 같은 원본이 다시 들어온 경우: 기존 날짜의 결과 파일을 하드 링크로 재사용
+  (소진 속도 분석을 켜면 기본 결과 파일은 복사한 뒤 날짜별 재고 이력에 따라 달라지는 velocity 시트만 다시 작성,
+  리스팅 프로필이 max_days_of_supply를 쓰면 필터 결과도 날짜에 따라 달라지므로 지문에 날짜를 포함하여 재사용 안 함)
+
+퍼지 매칭 어휘는 실행마다 누적되므로 지문에 포함하지 않음
+"""
+
+import glob
+import hashlib
+import json
+import os
+import shutil
+import sys
+import zipfile
+from xml.etree import ElementTree
+
+from openpyxl.packaging.custom import StringProperty
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.analytics.velocity import rewrite_velocity_sheet
+from src.config.constants import (
+    BestOfferConfig,
+    ColorConfig,
+    FilePaths,
+    FuzzyMatchConfig,
+    ListingProfiles,
+    SourceMergeConfig,
+    VelocityConfig,
+    get_today_date_string,
+)
+from src.utils.raw_bundles import open_raw_stream
+
+
+FINGERPRINT_PROPERTY = "stock_filter_fingerprint"
+SOURCE_DIR = os.path.join(os.path.dirname(__file__), "..")
+# 결과 파일(시트 구성, 프로필별 파일)을 만드는 실행 스크립트
+RUN_SCRIPT = os.path.join(SOURCE_DIR, "..", "run.py")
+CUSTOM_PROPS_MEMBER = "docProps/custom.xml"
+CUSTOM_PROPS_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/custom-properties}"
+
+_code_digest = None
+
+
+def file_digest(path):
+    """파일 내용 SHA-256 (zip 번들 항목은 압축을 풀면서 계산)"""
+    digest = hashlib.sha256()
+    with open_raw_stream(path) as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def sources_digest(paths):
+    """원본 파일 목록의 해시 (파일이 하나면 file_digest()와 같음, 지점별 파일이 있으면 파일별 해시를 합쳐 계산)"""
+    digests = [file_digest(path) for path in paths]
+    if len(digests) == 1:
+        return digests[0]
+    return hashlib.sha256("\n".join(digests).encode("utf-8")).hexdigest()
+
+
+def code_digest():
+    """src 아래 소스 코드 전체 + run.py의 해시 (규칙/필터/결과 파일 버전, 프로세스당 한 번 계산)"""
+    global _code_digest
+    if _code_digest is None:
+        digest = hashlib.sha256()
+        paths = sorted(glob.glob(os.path.join(SOURCE_DIR, "**", "*.py"), recursive=True))
+        if os.path.exists(RUN_SCRIPT):
+            paths.append(RUN_SCRIPT)
+        for path in paths:
+            digest.update(os.path.relpath(path, SOURCE_DIR).replace(os.sep, "/").encode("utf-8"))
+            digest.update(file_digest(path).encode("ascii"))
+        _code_digest = digest.hexdigest()
+    return _code_digest
+
+
+def settings_digest():
+    """결과에 영향을 주는 실행 중 설정값의 해시 (리스팅 프로필, 퍼지 매칭 기준, 지점 병합, 색상 사전, 최저가 선택, 소진 속도)"""
+    settings = {
+        "profiles": ListingProfiles.PROFILES,
+        "fuzzy": [
+            FuzzyMatchConfig.ENABLED,
+            FuzzyMatchConfig.NGRAM,
+            FuzzyMatchConfig.TOP_K,
+            FuzzyMatchConfig.AUTO_ASSIGN_SCORE,
+            FuzzyMatchConfig.SUGGEST_SCORE,
+        ],
+        "source_merge": [SourceMergeConfig.POLICY, SourceMergeConfig.KEY_COLUMNS],
+        "colors": [ColorConfig.ENABLED] + [
+            file_digest(path) for path in FilePaths.COLOR_DICTIONARIES.values() if os.path.exists(path)
+        ],
+        "best_offers": [BestOfferConfig.ENABLED, BestOfferConfig.TOP_K, BestOfferConfig.COLOR_FAMILIES],
+        "velocity": [VelocityConfig.ENABLED, VelocityConfig.WINDOW_DAYS],
+    }
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def uses_stock_history():
+    """리스팅 결과가 날짜별 재고 이력에 따라 달라지는지 (소진 속도 분석 + 프로필 max_days_of_supply)"""
+    return VelocityConfig.ENABLED and any(
+        profile.get("max_days_of_supply") is not None for profile in ListingProfiles.PROFILES.values()
+    )
+
+
+def compute_fingerprint(date_str=None):
+    """
+    날짜의 실행 지문 계산
+
+    프로필 max_days_of_supply 조건을 쓰면 필터 결과가 날짜별 재고 이력에 따라 달라지므로 날짜도 지문에 포함
+    (다른 날짜의 결과 파일을 재사용하지 않음, velocity 시트만 다른 경우는 재사용 후 다시 작성)
+
+    Returns:
+        fingerprint(전체 지문), hyundai/kia(원본 해시), code, settings 해시, date(재고 이력 사용 시) dict
+    """
+    if date_str is None:
+        date_str = get_today_date_string()
+    info = {
+        "hyundai": sources_digest(FilePaths.get_hyundai_raw_files(date_str)),
+        "kia": sources_digest(FilePaths.get_kia_raw_files(date_str)),
+        "code": code_digest(),
+        "settings": settings_digest(),
+    }
+    parts = ["hyundai", "kia", "code", "settings"]
+    if uses_stock_history():
+        info["date"] = date_str
+        parts.append("date")
+    combined = "\n".join(f"{name}:{info[name]}" for name in parts)
+    info["fingerprint"] = hashlib.sha256(combined.encode("utf-8")).hexdigest()
+    return info
+
+
+def stamp_fingerprint(book, fingerprint):
+    """openpyxl 워크북의 사용자 지정 문서 속성에 지문 기록"""
+    if fingerprint:
+        book.custom_doc_props.append(StringProperty(name=FINGERPRINT_PROPERTY, value=fingerprint))
+
+
+def read_output_fingerprint(path):
+    """결과 파일에 기록된 지문 (파일이 없거나 기록이 없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with zipfile.ZipFile(path) as archive:
+            root = ElementTree.fromstring(archive.read(CUSTOM_PROPS_MEMBER))
+    except (KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+        return None
+    for prop in root.iter(f"{CUSTOM_PROPS_NS}property"):
+        if prop.get("name") == FINGERPRINT_PROPERTY:
+            return "".join(prop.itertext())
+    return None
+
+
+def get_output_paths(date_str):
+    """날짜의 결과 파일 경로 목록 (기본 결과 + 프로필별 결과)"""
+    paths = [FilePaths.get_results_file("filtered", date_str)]
+    for name in ListingProfiles.PROFILES:
+        if name != ListingProfiles.DEFAULT:
+            paths.append(FilePaths.get_results_file("filtered", date_str, profile=name))
+    return paths
+
+
+def is_output_current(date_str, fingerprint):
+    """날짜의 결과 파일이 모두 있고 같은 지문으로 생성되었는지 확인"""
+    return all(read_output_fingerprint(path) == fingerprint for path in get_output_paths(date_str))
+
+
+def prepare_output_path(path):
+    """
+    결과 파일을 새로 쓰기 전에 하드 링크 연결 해제
+
+    다른 날짜와 공유 중인 파일을 제자리에서 덮어쓰면 양쪽이 함께 바뀌므로 먼저 삭제
+    """
+    if os.path.exists(path) and os.stat(path).st_nlink > 1:
+        os.remove(path)
+
+
+def link_or_copy(source, target, copy=False):
+    """하드 링크로 결과 파일 재사용 (링크를 지원하지 않는 파일 시스템이거나 copy=True면 복사)"""
+    if os.path.exists(target):
+        os.remove(target)
+    if copy:
+        shutil.copy2(source, target)
+        return "복사"
+    try:
+        os.link(source, target)
+        return "링크"
+    except OSError:
+        shutil.copy2(source, target)
+        return "복사"
+
+
+def load_fingerprint_index():
+    """날짜별 지문 목록 로드"""
+    if os.path.exists(FilePaths.FINGERPRINT_INDEX):
+        with open(FilePaths.FINGERPRINT_INDEX, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def record_fingerprint(date_str, info):
+    """결과 파일 생성 후 날짜별 지문 목록 갱신"""
+    index = load_fingerprint_index()
+    index[date_str] = info
+    os.makedirs(os.path.dirname(FilePaths.FINGERPRINT_INDEX), exist_ok=True)
+    with open(FilePaths.FINGERPRINT_INDEX, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def find_duplicate_raw_dates(date_str, info, index):
+    """원본 파일이 같은 다른 날짜 (브랜드 -> 날짜 목록)"""
+    duplicates = {}
+    for brand in ("hyundai", "kia"):
+        duplicates[brand] = sorted(
+            other for other, other_info in index.items()
+            if other != date_str and other_info.get(brand) == info[brand]
+        )
+    return duplicates
+
+
+def reuse_existing_output(date_str, info):
+    """
+    같은 지문의 결과가 있으면 재사용
+
+    Args:
+        date_str: 처리 날짜 (YYMMDD)
+        info: compute_fingerprint() 결과
+
+    Returns:
+        재사용했으면 True (클렌징/리스팅 생략 가능)
+    """
+    fingerprint = info["fingerprint"]
+    if is_output_current(date_str, fingerprint):
+        print(f"⏭️ 입력과 규칙이 바뀌지 않아 기존 결과를 그대로 사용합니다 (지문 {fingerprint[:12]})")
+        return True
+
+    index = load_fingerprint_index()
+    duplicates = find_duplicate_raw_dates(date_str, info, index)
+    for brand, label in (("hyundai", "현대"), ("kia", "기아")):
+        if duplicates[brand]:
+            print(f"ℹ️ {label} 원본 파일이 이전 날짜와 동일합니다: {', '.join(duplicates[brand])}")
+
+    # 원본 2개가 모두 같은 날짜 중 같은 지문으로 결과가 남아 있는 가장 최근 날짜
+    candidates = sorted(set(duplicates["hyundai"]) & set(duplicates["kia"]), reverse=True)
+    for other in candidates:
+        if index[other].get("fingerprint") != fingerprint or not is_output_current(other, fingerprint):
+            continue
+        targets = get_output_paths(date_str)
+        for source, target in zip(get_output_paths(other), targets):
+            # velocity 시트를 다시 쓸 기본 결과 파일은 다른 날짜 파일이 바뀌지 않도록 복사
+            method = link_or_copy(source, target, copy=VelocityConfig.ENABLED and target == targets[0])
+            print(f"🔗 결과 파일 재사용 ({method}): {source} → {target}")
+        if VelocityConfig.ENABLED:
+            rewrite_velocity_sheet(targets[0], date_str)
+        record_fingerprint(date_str, info)
+        return True
+    return False
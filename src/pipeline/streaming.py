@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+스트리밍 파이프라인 모듈
+원본 파일을 고정 크기 청크로 읽어 클렌징 → 리스팅 → 결과 파일 기록까지
+제너레이터로 흘려보내, 최대 메모리를 전체 데이터가 아닌 청크 크기에 비례하게 유지
+
+일괄 처리(run.py 기본 모드)와 행 단위로 동일한 결과를 생성
+(소진 속도 조건은 청크 처리 전 재고 이력 기준이라 이력에 이번 날짜가 없으면 직전 스냅샷 기준으로 적용)
+"""
+
+import math
+import os
+import sys
+from itertools import chain, islice
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import xlrd
+from openpyxl.cell.cell import ERROR_CODES
+from pandas.io.parsers import TextParser
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.analytics.snapshots import load_stock_history, summarize_stock, update_stock_history
+from src.analytics.velocity import compute_velocity
+from src.cleansing import cleansing_hyundai, cleansing_kia
+from src.cleansing.cleansing_unified import finalize_combined_data
+from src.cleansing.color_codes import reset_color_review
+from src.cleansing.fuzzy_match import (
+    load_vocabulary,
+    refresh_vocabulary_from_snapshots,
+    save_vocabulary,
+    update_vocabulary,
+    VOCAB_COLUMNS,
+)
+from src.cleansing.raw_layouts import apply_layout_dtypes, detect_layout, list_target_sheets
+from src.cleansing.rule_stats import reset_rule_stats
+from src.config.constants import (
+    BestOfferConfig,
+    FilePaths,
+    FuzzyMatchConfig,
+    ListingProfiles,
+    RawLayoutConfig,
+    StreamingConfig,
+    VelocityConfig,
+    get_today_date_string,
+)
+from src.listing.best_offers import select_best_offers
+from src.listing.listing_unified import (
+    add_summary_total,
+    build_exclusion_breakdown,
+    build_summary,
+    build_upload_df,
+    count_stage_survivors,
+    evaluate_listing,
+    merge_summaries,
+)
+from src.pipeline.fingerprint import prepare_output_path, stamp_fingerprint
+from src.utils.raw_bundles import open_raw_source
+
+
+def make_header(raw_header, width):
+    """pandas read_excel과 같은 규칙으로 헤더 이름 생성 (빈 칸 → Unnamed: i, 중복 → 이름.1)"""
+    raw_header = list(raw_header) + [""] * (width - len(raw_header))
+    names = []
+    seen = {}
+    for i, value in enumerate(raw_header):
+        name = f"Unnamed: {i}" if value in ("", None) else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def rows_to_frame(rows, raw_header):
+    """
+    원본 행 목록을 pandas read_excel과 같은 타입 추론/결측 처리로 데이터프레임 변환
+
+    헤더보다 긴 행이 있으면 read_excel처럼 Unnamed: i 컬럼으로 확장
+    """
+    width = max([len(raw_header)] + [len(row) for row in rows])
+    rows = [row + [""] * (width - len(row)) for row in rows]
+    return TextParser(rows, names=make_header(raw_header, width), header=None).read()
+
+
+def convert_openpyxl_value(value):
+    """openpyxl 셀 값을 pandas openpyxl 리더와 같은 규칙으로 변환"""
+    if value is None:
+        return ""
+    if isinstance(value, str) and value in ERROR_CODES:
+        return np.nan
+    if isinstance(value, float) and math.isfinite(value) and value == int(value):
+        return int(value)
+    return value
+
+
+def convert_xlrd_cell(value, cell_type, datemode):
+    """xlrd 셀 값을 pandas xlrd 리더와 같은 규칙으로 변환"""
+    if cell_type == xlrd.XL_CELL_DATE:
+        try:
+            return xlrd.xldate.xldate_as_datetime(value, datemode)
+        except OverflowError:
+            return value
+    if cell_type == xlrd.XL_CELL_ERROR:
+        return np.nan
+    if cell_type == xlrd.XL_CELL_BOOLEAN:
+        return bool(value)
+    if cell_type == xlrd.XL_CELL_NUMBER and math.isfinite(value) and value == int(value):
+        return int(value)
+    return value
+
+
+def non_empty_rows(rows):
+    """행 끝의 빈 셀을 제거하고 빈 행은 건너뜀 (read_excel의 빈 줄 건너뛰기와 동일)"""
+    for row in rows:
+        while row and row[-1] == "":
+            row.pop()
+        if row:
+            yield row
+
+
+def iter_row_chunks(rows, raw_header, chunk_size):
+    """행 이터레이터를 chunk_size 행씩 데이터프레임으로 묶어 반환"""
+    buffer = []
+    for row in rows:
+        buffer.append(row)
+        if len(buffer) >= chunk_size:
+            yield rows_to_frame(buffer, raw_header)
+            buffer = []
+    if buffer:
+        yield rows_to_frame(buffer, raw_header)
+
+
+def iter_layout_chunks(brand, rows, chunk_size):
+    """
+    원본 레이아웃으로 헤더를 찾고 레이아웃 컬럼만 청크 단위로 반환 (클렌징 컬럼명, 레이아웃 타입)
+    """
+    head = list(islice(rows, RawLayoutConfig.HEADER_SCAN_ROWS))
+    if not head:
+        return
+    layout, header_index, positions = detect_layout(brand, head)
+    names = [column.name for column in layout.columns]
+    projected = (
+        [row[position] if position < len(row) else "" for position in positions]
+        for row in chain(head[header_index + 1:], rows)
+    )
+    for chunk in iter_row_chunks(projected, names, chunk_size):
+        yield apply_layout_dtypes(chunk, layout)
+
+
+def iter_hyundai_raw_chunks(file_path, chunk_size):
+    """현대 원본 파일을 시트 순서대로 청크 단위로 읽기 (model_raw = 시트명)"""
+    book = openpyxl.load_workbook(open_raw_source(file_path), read_only=True, data_only=True, keep_links=False)
+    try:
+        for sheet_name in list_target_sheets("hyundai", book.sheetnames):
+            sheet = book[sheet_name]
+            sheet.reset_dimensions()
+            rows = non_empty_rows(
+                [convert_openpyxl_value(value) for value in row]
+                for row in sheet.iter_rows(values_only=True)
+            )
+            for chunk in iter_layout_chunks("hyundai", rows, chunk_size):
+                yield chunk.assign(model_raw=sheet_name)
+    finally:
+        book.close()
+
+
+def iter_kia_raw_chunks(file_path, chunk_size):
+    """기아 원본 파일(sheet1)을 청크 단위로 읽기"""
+    source = open_raw_source(file_path)
+    if isinstance(source, str):
+        book = xlrd.open_workbook(source, on_demand=True)
+    else:
+        book = xlrd.open_workbook(file_contents=source.getvalue(), on_demand=True)
+    try:
+        sheet = book.sheet_by_name(list_target_sheets("kia", book.sheet_names())[0])
+        rows = non_empty_rows(
+            [
+                convert_xlrd_cell(value, cell_type, book.datemode)
+                for value, cell_type in zip(sheet.row_values(i), sheet.row_types(i))
+            ]
+            for i in range(sheet.nrows)
+        )
+        yield from iter_layout_chunks("kia", rows, chunk_size)
+    finally:
+        book.release_resources()
+
+
+def iter_cleansed_chunks(chunk_size, vocab):
+    """현대 → 기아 순서로 클렌징된 청크 반환 (일괄 처리의 통합 순서와 동일)"""
+    sources = [
+        (iter_hyundai_raw_chunks(FilePaths.get_hyundai_raw_file(), chunk_size), cleansing_hyundai),
+        (iter_kia_raw_chunks(FilePaths.get_kia_raw_file(), chunk_size), cleansing_kia),
+    ]
+    for raw_chunks, module in sources:
+        for raw_chunk in raw_chunks:
+            cleansed = module.cleanse_raw_data(raw_chunk)
+            if len(cleansed) == 0:
+                continue
+            yield finalize_combined_data(cleansed.reset_index(drop=True), vocab)
+
+
+def to_cell_value(value):
+    """데이터프레임 값을 openpyxl 셀 값으로 변환 (결측 → 빈 셀)"""
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class StreamingWorkbookWriter:
+    """openpyxl write-only 모드로 시트별 청크를 이어 쓰는 결과 파일 작성기"""
+
+    def __init__(self, file_path, sheet_names, fingerprint=None):
+        self.file_path = file_path
+        self.book = openpyxl.Workbook(write_only=True)
+        stamp_fingerprint(self.book, fingerprint)
+        self.sheets = {name: self.book.create_sheet(name) for name in sheet_names}
+        self.header_written = set()
+        self.row_counts = {name: 0 for name in sheet_names}
+
+    def append_frame(self, sheet_name, df):
+        """데이터프레임 청크를 시트 끝에 추가 (첫 청크에서 헤더 기록)"""
+        sheet = self.sheets[sheet_name]
+        if sheet_name not in self.header_written:
+            sheet.append([str(column) for column in df.columns])
+            self.header_written.add(sheet_name)
+        for row in df.itertuples(index=False, name=None):
+            sheet.append([to_cell_value(value) for value in row])
+        self.row_counts[sheet_name] += len(df)
+
+    def close(self):
+        """파일 저장"""
+        prepare_output_path(self.file_path)
+        self.book.save(self.file_path)
+
+
+def run_streaming(date_str=None, chunk_size=None, profiles=None, fingerprint=None):
+    """
+    스트리밍 모드로 클렌징 → 리스팅 → 결과 파일 생성 실행
+
+    Args:
+        date_str: 처리 날짜 (YYMMDD, None이면 전역 날짜)
+        chunk_size: 청크 행 수 (None이면 StreamingConfig.CHUNK_SIZE)
+        profiles: 리스팅 프로필 (None이면 ListingProfiles.PROFILES)
+        fingerprint: 결과 파일에 기록할 입력 지문
+
+    Returns:
+        결과 파일 경로
+    """
+    if date_str is None:
+        date_str = get_today_date_string()
+    if chunk_size is None:
+        chunk_size = StreamingConfig.CHUNK_SIZE
+    if profiles is None:
+        profiles = ListingProfiles.PROFILES
+
+    print(f"🌊 스트리밍 모드 시작 (청크 {chunk_size}행)")
+    reset_rule_stats()
+    reset_color_review()
+
+    # 퍼지 매칭 어휘는 실행 시작 시점 기준으로 고정 (일괄 처리와 동일한 매칭 결과)
+    vocab = None
+    if FuzzyMatchConfig.ENABLED:
+        vocab = refresh_vocabulary_from_snapshots(load_vocabulary())
+        save_vocabulary(vocab)
+
+    output_path = FilePaths.get_results_file("filtered", date_str)
+    sheet_names = ["all", "filtered", "upload", "exclusions", "summary"]
+    if VelocityConfig.ENABLED:
+        sheet_names.append("velocity")
+    if BestOfferConfig.ENABLED:
+        sheet_names.append("best")
+    writer = StreamingWorkbookWriter(output_path, sheet_names, fingerprint)
+    profile_writers = {
+        name: StreamingWorkbookWriter(
+            FilePaths.get_results_file("filtered", date_str, profile=name),
+            ["filtered", "upload"],
+            fingerprint,
+        )
+        for name in profiles
+        if name != ListingProfiles.DEFAULT
+    }
+
+    # 소진 속도 조건(max_days_of_supply)은 청크 처리 전에 기존 재고 이력으로 계산하여 모든 청크에 적용
+    # (이번 날짜 재고는 모든 청크를 처리한 뒤에 이력에 반영되므로, 처음 처리하는 날짜는 직전 스냅샷 기준)
+    velocity_df = None
+    if VelocityConfig.ENABLED:
+        history = load_stock_history()
+        velocity_df = compute_velocity(history, as_of=date_str)
+        uses_velocity = any(profile.get("max_days_of_supply") is not None for profile in profiles.values())
+        if uses_velocity and not (history["date"] == date_str).any():
+            print("⚠️ 스트리밍 모드의 소진 속도 조건은 직전 재고 이력 기준으로 적용합니다 (이번 날짜 재고 미포함)")
+
+    breakdowns = []
+    summaries = []
+    known_rows = []
+    stock_summaries = []
+    best_offers = []
+    stage_counts = None
+    for chunk_number, cleaned_chunk in enumerate(iter_cleansed_chunks(chunk_size, vocab), start=1):
+        all_df, filtered_df, profile_dfs, default_mask = evaluate_listing(cleaned_chunk, profiles, velocity_df)
+
+        writer.append_frame("all", all_df)
+        writer.append_frame("filtered", filtered_df)
+        writer.append_frame("upload", build_upload_df(filtered_df))
+        for name, profile_writer in profile_writers.items():
+            profile_writer.append_frame("filtered", profile_dfs[name])
+            profile_writer.append_frame("upload", build_upload_df(profile_dfs[name]))
+
+        breakdowns.append(build_exclusion_breakdown(all_df))
+        summaries.append(build_summary(all_df, default_mask))
+        chunk_counts = [count for _, count in count_stage_survivors(default_mask)]
+        stage_counts = chunk_counts if stage_counts is None else [
+            total + count for total, count in zip(stage_counts, chunk_counts)
+        ]
+        if VelocityConfig.ENABLED:
+            stock_summaries.append(summarize_stock(all_df, date_str))
+        if BestOfferConfig.ENABLED:
+            best_offers.append(select_best_offers(filtered_df))
+        if FuzzyMatchConfig.ENABLED:
+            known_rows.append(all_df[VOCAB_COLUMNS + ["match_status"]].drop_duplicates())
+        print(f"   📦 청크 {chunk_number}: {len(all_df)}대 → 필터 통과 {len(filtered_df)}대")
+
+    # 제외 사유 집계와 요약표는 청크별 부분 집계를 합산
+    if breakdowns:
+        exclusion_df = pd.concat(breakdowns).groupby(["company", "model"], sort=True).sum().reset_index()
+        writer.append_frame("exclusions", exclusion_df)
+        writer.append_frame("summary", add_summary_total(merge_summaries(summaries)))
+
+    # 재고 이력은 청크별 key_admin 재고 합계를 합산하여 갱신 (클렌징 스냅샷은 일괄 처리 모드에서만 저장)
+    if stock_summaries:
+        stock_df = (
+            pd.concat(stock_summaries)
+            .groupby(["date", "key_admin"], as_index=False, sort=True)["stock"]
+            .sum()
+        )
+        update_stock_history(stock_df, date_str)
+        writer.append_frame("velocity", compute_velocity(load_stock_history(), as_of=date_str))
+
+    # 최저가 선택은 청크별 선택 결과를 합쳐 다시 선택 (전체에서 선택한 결과와 동일)
+    if best_offers:
+        writer.append_frame("best", select_best_offers(pd.concat(best_offers, ignore_index=True)))
+    writer.close()
+    for profile_writer in profile_writers.values():
+        profile_writer.close()
+
+    if known_rows:
+        update_vocabulary(pd.concat(known_rows, ignore_index=True), date_str)
+
+    print(f"✅ 스트리밍 결과 파일 생성 완료: {output_path}")
+    print(f"📊 전체 차량: {writer.row_counts['all']}대, 필터링된 차량: {writer.row_counts['filtered']}대")
+    if stage_counts is not None:
+        print(f"🔍 단계별 통과 대수: {stage_counts}")
+    for name, profile_writer in profile_writers.items():
+        print(f"✅ 프로필 [{name}] 결과 파일 생성: {profile_writer.file_path} ({profile_writer.row_counts['filtered']}대)")
+    return output_path
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+작업 큐 모듈 (여러 딜러 그룹 × 날짜 분산 처리)
+SQLite 작업 큐에 (그룹, 날짜) 작업을 넣고, 여러 호스트의 워커가 임대(lease) 방식으로
+작업을 가져가 클렌징 → 리스팅 → 내보내기를 실행한 뒤 결과와 소요 시간을 기록
+
+- 그룹 폴더: groups/<그룹명>/data/raw/ (결과는 groups/<그룹명>/results/)
+  "default" 그룹은 프로젝트 루트의 data/raw
+- 작업은 그룹 폴더를 작업 디렉토리로 하는 별도 프로세스에서 실행
+  (규칙 통계, 퍼지 매칭 어휘, 스냅샷 등도 그룹별로 분리)
+- 같은 그룹의 날짜는 한 번에 하나씩 날짜 순서대로 실행 (그룹 사이만 병렬)
+- 워커가 비정상 종료하면 임대가 만료된 뒤 다른 워커가 다시 가져감 (최대 MAX_ATTEMPTS회)
+- 여러 호스트에서 사용할 때는 DB 파일을 파일 잠금이 동작하는 공유 파일 시스템에 둠
+
+사용법:
+    python -m src.pipeline.work_queue enqueue [--groups A B] [--dates 250901 250902]
+    python -m src.pipeline.work_queue worker
+    python -m src.pipeline.work_queue status
+    python -m src.pipeline.work_queue local --workers 3   # 로컬 워커 여러 개로 전체 실행
+"""
+
+import argparse
+import json
+import os
+import re
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.config.constants import ValidationConfig, WorkQueueConfig
+from src.utils.raw_bundles import list_raw_names
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+RAW_PATTERN = re.compile(r"재고리스트_(현대|기아)_(\d{6})\.xlsx?$")
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    group_name TEXT NOT NULL,
+    date TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    enqueued_at REAL,
+    started_at REAL,
+    finished_at REAL,
+    seconds REAL,
+    result TEXT,
+    error TEXT,
+    UNIQUE (group_name, date)
+)
+"""
+
+
+def get_group_root(group):
+    """그룹 작업 디렉토리 (default = 프로젝트 루트)"""
+    if group == WorkQueueConfig.DEFAULT_GROUP:
+        return REPO_ROOT
+    return os.path.join(REPO_ROOT, WorkQueueConfig.GROUPS_DIR, group)
+
+
+def list_groups():
+    """default + groups/ 아래 그룹 목록"""
+    groups = [WorkQueueConfig.DEFAULT_GROUP]
+    groups_dir = os.path.join(REPO_ROOT, WorkQueueConfig.GROUPS_DIR)
+    if os.path.isdir(groups_dir):
+        groups += sorted(
+            name for name in os.listdir(groups_dir)
+            if os.path.isdir(os.path.join(groups_dir, name, "data", "raw"))
+        )
+    return groups
+
+
+def discover_tasks(groups=None, dates=None):
+    """현대/기아 원본 파일이 모두 있는 (그룹, 날짜) 목록 (zip 번들 항목 포함)"""
+    tasks = []
+    for group in groups or list_groups():
+        raw_dir = os.path.join(get_group_root(group), "data", "raw")
+        if not os.path.isdir(raw_dir):
+            print(f"⚠️ 그룹 [{group}] 원본 폴더가 없습니다: {raw_dir}")
+            continue
+        brands_by_date = {}
+        for name in list_raw_names(raw_dir):
+            match = RAW_PATTERN.search(name)
+            if match:
+                brands_by_date.setdefault(match.group(2), set()).add(match.group(1))
+        for date_str, brands in sorted(brands_by_date.items()):
+            if brands == {"현대", "기아"} and (not dates or date_str in dates):
+                tasks.append((group, date_str))
+    return tasks
+
+
+def connect(db_path):
+    """작업 큐 DB 연결 (트랜잭션은 직접 관리)"""
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute(SCHEMA)
+    return conn
+
+
+def enqueue_tasks(db_path, tasks, force=False):
+    """
+    작업 등록 (이미 있는 작업은 그대로, force면 대기 상태로 초기화)
+
+    Returns:
+        새로 등록(또는 초기화)된 작업 수
+    """
+    now = time.time()
+    conn = connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        before = conn.total_changes
+        for group, date_str in tasks:
+            if force:
+                conn.execute(
+                    "INSERT INTO tasks (group_name, date, status, enqueued_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (group_name, date) DO UPDATE SET status = excluded.status, "
+                    "attempts = 0, worker = NULL, lease_until = NULL, result = NULL, error = NULL, "
+                    "enqueued_at = excluded.enqueued_at",
+                    (group, date_str, STATUS_PENDING, now),
+                )
+            else:
+                conn.execute(
+                    "INSERT OR IGNORE INTO tasks (group_name, date, status, enqueued_at) VALUES (?, ?, ?, ?)",
+                    (group, date_str, STATUS_PENDING, now),
+                )
+        added = conn.total_changes - before
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return added
+
+
+def claim_task(db_path, worker_id):
+    """
+    대기 중이거나 임대가 만료된 작업 하나를 임대
+
+    같은 그룹의 날짜들은 재고 이력, 퍼지 매칭 어휘, 게시 상태, 규칙 통계를 날짜 순서대로 이어 쓰므로
+    그룹에 실행 중인 작업이 있으면 가져가지 않고, 그룹 안에서는 날짜 순서대로 가져감
+
+    Returns:
+        작업 dict (없으면 None)
+    """
+    now = time.time()
+    conn = connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        # 재시도 횟수를 다 쓴 채 임대가 만료된 작업은 실패 처리
+        conn.execute(
+            "UPDATE tasks SET status = ?, error = '임대 만료 (워커 비정상 종료)', finished_at = ? "
+            "WHERE status = ? AND lease_until < ? AND attempts >= ?",
+            (STATUS_FAILED, now, STATUS_RUNNING, now, WorkQueueConfig.MAX_ATTEMPTS),
+        )
+        row = conn.execute(
+            "SELECT * FROM tasks AS t WHERE (t.status = ? OR (t.status = ? AND t.lease_until < ?)) "
+            "AND NOT EXISTS (SELECT 1 FROM tasks AS r WHERE r.group_name = t.group_name AND r.id != t.id "
+            "AND r.status = ? AND r.lease_until >= ?) "
+            "ORDER BY t.group_name, t.date LIMIT 1",
+            (STATUS_PENDING, STATUS_RUNNING, now, STATUS_RUNNING, now),
+        ).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            return None
+        conn.execute(
+            "UPDATE tasks SET status = ?, worker = ?, lease_until = ?, attempts = attempts + 1, "
+            "started_at = ?, error = NULL WHERE id = ?",
+            (STATUS_RUNNING, worker_id, now + WorkQueueConfig.LEASE_SECONDS, now, row["id"]),
+        )
+        conn.execute("COMMIT")
+        task = dict(row)
+        task.update(status=STATUS_RUNNING, worker=worker_id, started_at=now, attempts=row["attempts"] + 1)
+        return task
+    finally:
+        conn.close()
+
+
+def renew_lease(db_path, task_id, worker_id):
+    """작업 임대 연장 (다른 워커가 이미 가져간 경우 False)"""
+    conn = connect(db_path)
+    try:
+        cursor = conn.execute(
+            "UPDATE tasks SET lease_until = ? WHERE id = ? AND worker = ? AND status = ?",
+            (time.time() + WorkQueueConfig.LEASE_SECONDS, task_id, worker_id, STATUS_RUNNING),
+        )
+        return cursor.rowcount == 1
+    finally:
+        conn.close()
+
+
+def finish_task(db_path, task, worker_id, result=None, error=None):
+    """작업 완료/실패 기록 (실패 시 재시도 횟수가 남아 있으면 대기 상태로 되돌림)"""
+    now = time.time()
+    if error is None:
+        status = STATUS_DONE
+    elif task["attempts"] < WorkQueueConfig.MAX_ATTEMPTS:
+        status = STATUS_PENDING
+    else:
+        status = STATUS_FAILED
+    conn = connect(db_path)
+    try:
+        conn.execute(
+            "UPDATE tasks SET status = ?, lease_until = NULL, finished_at = ?, seconds = ?, "
+            "result = ?, error = ? WHERE id = ? AND worker = ?",
+            (
+                status, now, round(now - task["started_at"], 3),
+                json.dumps(result, ensure_ascii=False) if result is not None else None,
+                error, task["id"], worker_id,
+            ),
+        )
+    finally:
+        conn.close()
+    return status
+
+
+def has_open_tasks(db_path):
+    """대기 중이거나 실행 중인 작업이 있는지 확인"""
+    conn = connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE status IN (?, ?)", (STATUS_PENDING, STATUS_RUNNING)
+        ).fetchone()
+        return row[0] > 0
+    finally:
+        conn.close()
+
+
+def keep_lease(db_path, task_id, worker_id, stop):
+    """작업이 끝날 때까지 주기적으로 임대 연장 (별도 스레드)"""
+    interval = max(1.0, WorkQueueConfig.LEASE_SECONDS / 3)
+    while not stop.wait(interval):
+        if not renew_lease(db_path, task_id, worker_id):
+            return
+
+
+def execute_task(db_path, task, worker_id):
+    """그룹 폴더에서 별도 프로세스로 파이프라인 실행 후 결과 기록"""
+    group_root = get_group_root(task["group_name"])
+    log_dir = os.path.join(group_root, "results", "work_logs")
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, f"{task['date']}.log")
+    fd, result_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+    command = [
+        sys.executable, "-m", "src.pipeline.work_queue", "run-task",
+        "--date", task["date"], "--result-file", result_path,
+    ]
+
+    stop = threading.Event()
+    heartbeat = threading.Thread(target=keep_lease, args=(db_path, task["id"], worker_id, stop), daemon=True)
+    heartbeat.start()
+    try:
+        # 재시도해도 이전 시도의 로그(트레이스백)가 남도록 시도별 머리글과 함께 이어 씀
+        with open(log_path, "a", encoding="utf-8") as log:
+            started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(task["started_at"]))
+            log.write(f"===== 시도 {task['attempts']} ({worker_id}, {started}) =====\n")
+            log.flush()
+            completed = subprocess.run(command, cwd=group_root, env=env, stdout=log, stderr=subprocess.STDOUT)
+        if completed.returncode == 0:
+            with open(result_path, encoding="utf-8") as f:
+                result, error = json.load(f), None
+        else:
+            result, error = None, f"종료 코드 {completed.returncode} (로그: {log_path})"
+    finally:
+        stop.set()
+        heartbeat.join()
+        os.remove(result_path)
+
+    status = finish_task(db_path, task, worker_id, result, error)
+    label = f"[{task['group_name']}/{task['date']}] 시도 {task['attempts']}"
+    if error is None:
+        print(f"   ✅ {worker_id} {label}: {result}")
+    else:
+        print(f"   ❌ {worker_id} {label}: {error} → {status}")
+
+
+def run_worker(db_path, worker_id=None, exit_when_idle=True):
+    """
+    작업 큐에서 작업을 가져와 실행하는 워커
+
+    Args:
+        db_path: 작업 큐 DB 경로
+        worker_id: 워커 이름 (None이면 호스트명-PID)
+        exit_when_idle: 대기/실행 중인 작업이 없으면 종료
+    """
+    if worker_id is None:
+        worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:4]}"
+    print(f"👷 워커 시작: {worker_id}")
+    processed = 0
+    while True:
+        task = claim_task(db_path, worker_id)
+        if task is None:
+            if exit_when_idle and not has_open_tasks(db_path):
+                break
+            time.sleep(WorkQueueConfig.POLL_SECONDS)
+            continue
+        execute_task(db_path, task, worker_id)
+        processed += 1
+    print(f"👷 워커 종료: {worker_id} ({processed}개 작업 처리)")
+
+
+def run_task(date_str, result_file):
+    """작업 하나 실행 (워커가 그룹 폴더에서 띄우는 프로세스)"""
+    import run
+
+    start = time.perf_counter()
+    result = run.run_pipeline(date_str, validation_mode=ValidationConfig.UNATTENDED_MODE)
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    with open(result_file, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False)
+
+
+def print_status(db_path):
+    """작업별 상태와 소요 시간, 전체 처리량 출력"""
+    conn = connect(db_path)
+    try:
+        rows = [dict(row) for row in conn.execute("SELECT * FROM tasks ORDER BY group_name, date")]
+    finally:
+        conn.close()
+
+    print(f"\n📊 작업 큐 상태: {db_path}")
+    for row in rows:
+        seconds = f"{row['seconds']:.1f}초" if row["seconds"] is not None else "-"
+        detail = row["result"] or row["error"] or ""
+        print(
+            f"   - [{row['group_name']}/{row['date']}] {row['status']} "
+            f"(시도 {row['attempts']}, {seconds}, {row['worker'] or '-'}) {detail}"
+        )
+
+    counts = {}
+    for row in rows:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    print(f"   상태별: {counts}")
+    finished = [row for row in rows if row["status"] == STATUS_DONE]
+    if finished:
+        wall = max(row["finished_at"] for row in finished) - min(row["started_at"] for row in finished)
+        busy = sum(row["seconds"] for row in finished)
+        throughput = f", 시간당 {len(finished) / wall * 3600:.0f}개" if wall > 0 else ""
+        print(f"   완료 {len(finished)}개: 경과 {wall:.1f}초, 작업 시간 합계 {busy:.1f}초{throughput}")
+    return rows
+
+
+def run_local(db_path, workers, tasks, force=False):
+    """로컬 워커 프로세스 여러 개로 작업 큐 전체 실행 (확인용)"""
+    added = enqueue_tasks(db_path, tasks, force)
+    print(f"📥 작업 {added}개 등록, 로컬 워커 {workers}개 시작")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-m", "src.pipeline.work_queue", "--db", db_path, "worker",
+             "--worker-id", f"local-{number}"],
+            cwd=REPO_ROOT, env=env,
+        )
+        for number in range(1, workers + 1)
+    ]
+    for process in processes:
+        process.wait()
+    return print_status(db_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="딜러 그룹 × 날짜 작업 큐")
+    parser.add_argument("--db", default=WorkQueueConfig.DB_PATH, help="작업 큐 DB 경로")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name in ("enqueue", "local"):
+        command = commands.add_parser(name)
+        command.add_argument("--groups", nargs="*", help="그룹명 (기본값: 전체)")
+        command.add_argument("--dates", nargs="*", help="날짜 YYMMDD (기본값: 원본 파일이 있는 전체)")
+        command.add_argument("--force", action="store_true", help="이미 등록된 작업도 다시 실행")
+        if name == "local":
+            command.add_argument("--workers", type=int, default=2)
+
+    worker = commands.add_parser("worker")
+    worker.add_argument("--worker-id")
+    worker.add_argument("--keep-alive", action="store_true", help="작업이 없어도 종료하지 않음")
+
+    commands.add_parser("status")
+
+    task = commands.add_parser("run-task")
+    task.add_argument("--date", required=True)
+    task.add_argument("--result-file", required=True)
+
+    args = parser.parse_args()
+    db_path = os.path.abspath(args.db)
+    if args.command != "run-task":
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+    if args.command == "enqueue":
+        tasks = discover_tasks(args.groups, args.dates)
+        added = enqueue_tasks(db_path, tasks, args.force)
+        print(f"📥 작업 {added}개 등록 (대상 {len(tasks)}개)")
+    elif args.command == "worker":
+        run_worker(db_path, args.worker_id, exit_when_idle=not args.keep_alive)
+    elif args.command == "status":
+        print_status(db_path)
+    elif args.command == "run-task":
+        run_task(args.date, args.result_file)
+    elif args.command == "local":
+        run_local(db_path, args.workers, discover_tasks(args.groups, args.dates), args.force)
+
+
+if __name__ == "__main__":
+    main()
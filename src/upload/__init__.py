@@ -0,0 +1 @@
+# Upload Module
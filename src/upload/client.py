@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+업로드 클라이언트 모듈
+upload 시트 데이터를 배치 단위 JSON으로 나누어 카탈로그 엔드포인트에 전송
+
+- requests Session 커넥션 풀 재사용
+- 동시에 여러 배치 전송 (UploadConfig.MAX_IN_FLIGHT)
+- 재시도/백오프 (429, 5xx 응답 및 연결 오류)
+- 배치 내용 기반 Idempotency-Key 헤더 (재시도/재실행 시 중복 반영 방지)
+
+사용법:
+    python -m src.upload.client --date 250901 --endpoint http://host/api/stock
+    python -m src.upload.client --date 250901 --stub   # 로컬 스텁 서버로 전송
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.config.constants import FilePaths, UploadConfig, get_today_date_string, set_global_date
+
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(pool_size):
+    """커넥션 풀과 재시도 정책이 설정된 Session 생성"""
+    # 같은 Idempotency-Key로 재전송하므로 POST도 재시도 대상에 포함
+    retry = Retry(
+        total=UploadConfig.RETRIES,
+        backoff_factor=UploadConfig.BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["POST"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Content-Type"] = "application/json; charset=utf-8"
+    token = os.environ.get(UploadConfig.TOKEN_ENV)
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+    return session
+
+
+def build_batches(upload_df, date_str, batch_size):
+    """
+    upload 데이터를 배치 단위 JSON 본문으로 변환
+
+    Returns:
+        (Idempotency-Key, 행 수, 본문 bytes) 리스트
+    """
+    total = max(1, -(-len(upload_df) // batch_size))
+    batches = []
+    for number, start in enumerate(range(0, len(upload_df), batch_size), 1):
+        batch_df = upload_df.iloc[start:start + batch_size]
+        rows = batch_df.to_json(orient="records", force_ascii=False)
+        # 같은 날짜의 같은 내용이면 같은 키 (재실행해도 서버에서 중복 제거 가능)
+        key = hashlib.sha256(f"{date_str}\n{rows}".encode("utf-8")).hexdigest()[:32]
+        body = (
+            f'{{"date": {json.dumps(date_str)}, "batch": {number}, '
+            f'"total_batches": {total}, "rows": {rows}}}'
+        )
+        batches.append((key, len(batch_df), body.encode("utf-8")))
+    return batches
+
+
+def send_batch(session, endpoint, key, body):
+    """
+    배치 하나 전송 (재시도는 Session 어댑터가 처리)
+
+    Returns:
+        (성공 여부, 소요 시간(초), 오류 메시지)
+    """
+    start = time.perf_counter()
+    try:
+        response = session.post(
+            endpoint,
+            data=body,
+            headers={"Idempotency-Key": key},
+            timeout=UploadConfig.TIMEOUT,
+        )
+        response.raise_for_status()
+        return True, time.perf_counter() - start, None
+    except requests.RequestException as e:
+        return False, time.perf_counter() - start, str(e)
+
+
+def upload_rows(upload_df, date_str=None, endpoint=None):
+    """
+    upload 데이터를 엔드포인트로 배치 전송
+
+    Args:
+        upload_df: build_upload_df() 결과
+        date_str: 처리 날짜 (YYMMDD)
+        endpoint: 전송 URL (None이면 UploadConfig.ENDPOINT)
+
+    Returns:
+        rows, batches, failed_batches, failed_rows, elapsed, rows_per_sec,
+        latency_p50_ms, latency_p95_ms, latency_p99_ms 요약 dict
+    """
+    if date_str is None:
+        date_str = get_today_date_string()
+    if endpoint is None:
+        endpoint = UploadConfig.ENDPOINT
+    if not endpoint:
+        raise ValueError("업로드 엔드포인트가 설정되지 않았습니다 (UploadConfig.ENDPOINT)")
+
+    batches = build_batches(upload_df, date_str, UploadConfig.BATCH_SIZE)
+    workers = max(1, min(UploadConfig.MAX_IN_FLIGHT, len(batches)))
+    print(f"📤 업로드 시작: {len(upload_df)}대, {len(batches)}개 배치, 동시 전송 {workers}개 → {endpoint}")
+
+    start = time.perf_counter()
+    with create_session(workers) as session, ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(send_batch, session, endpoint, key, body) for key, _, body in batches
+        ]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array([latency for _, latency, _ in results]) * 1000
+    failed = [
+        (key, rows, error)
+        for (key, rows, _), (ok, _, error) in zip(batches, results)
+        if not ok
+    ]
+    sent_rows = len(upload_df) - sum(rows for _, rows, _ in failed)
+    summary = {
+        "rows": len(upload_df),
+        "batches": len(batches),
+        "failed_batches": len(failed),
+        "failed_rows": len(upload_df) - sent_rows,
+        "elapsed": round(elapsed, 3),
+        "rows_per_sec": round(sent_rows / elapsed, 1) if elapsed else 0.0,
+    }
+    for percentile in (50, 95, 99):
+        value = np.percentile(latencies, percentile) if len(latencies) else 0.0
+        summary[f"latency_p{percentile}_ms"] = round(float(value), 1)
+
+    for key, rows, error in failed:
+        print(f"   ❌ 배치 실패 ({rows}대, key={key}): {error}")
+    status = "✅ 업로드 완료" if not failed else "⚠️ 업로드 일부 실패"
+    print(
+        f"{status}: {sent_rows}/{len(upload_df)}대, {summary['rows_per_sec']}행/초, "
+        f"지연 p50 {summary['latency_p50_ms']}ms / p95 {summary['latency_p95_ms']}ms / "
+        f"p99 {summary['latency_p99_ms']}ms"
+    )
+    return summary
+
+
+def upload_results_file(date_str=None, endpoint=None):
+    """결과 파일의 upload 시트를 읽어 전송"""
+    if date_str is None:
+        date_str = get_today_date_string()
+    path = FilePaths.get_results_file("filtered", date_str)
+    upload_df = pd.read_excel(path, sheet_name="upload")
+    return upload_rows(upload_df, date_str, endpoint)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="upload 시트 배치 업로드")
+    parser.add_argument("--date", help="처리 날짜 (YYMMDD, 기본값: 오늘)")
+    parser.add_argument("--endpoint", help="전송 URL (기본값: UploadConfig.ENDPOINT)")
+    parser.add_argument("--stub", action="store_true", help="로컬 스텁 서버를 띄워 전송")
+    parser.add_argument("--stub-fail-every", type=int, default=0, help="스텁 서버가 N번째 요청마다 503 응답")
+    args = parser.parse_args()
+
+    if args.date:
+        set_global_date(args.date)
+
+    if not args.stub:
+        summary = upload_results_file(args.date, args.endpoint)
+        sys.exit(1 if summary["failed_batches"] else 0)
+
+    from src.upload.stub_server import start_stub_server
+
+    server = start_stub_server(fail_every=args.stub_fail_every)
+    try:
+        summary = upload_results_file(args.date, server.url)
+    finally:
+        server.shutdown()
+    print(
+        f"🧪 스텁 서버 수신: {server.state.received_rows}대 "
+        f"(요청 {server.state.requests}회, 중복 키 {server.state.duplicates}회, 강제 실패 {server.state.failures}회)"
+    )
+    sys.exit(1 if summary["failed_batches"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+변경분 게시 모듈
+오늘 upload 데이터를 마지막으로 게시한 upload 데이터와 키 + 행 해시로 비교하여
+추가(insert)/변경(update)/삭제(delete) 행만 변경분 파일로 저장
+
+사용법:
+    python -m src.upload.delta --date 250901
+"""
+
+import argparse
+import os
+import pickle
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.config.constants import FilePaths, get_today_date_string, set_global_date
+
+
+# 차량 식별 키 (판매코드 + 색상코드)
+DELTA_KEY_COLUMNS = ["code_sales_a", "code_sales_b", "code_color_a", "code_color_b"]
+
+# 변경분 파일의 작업 구분 (op 컬럼)
+OP_INSERT = "insert"
+OP_UPDATE = "update"
+OP_DELETE = "delete"
+
+
+def normalize_for_hash(series):
+    """숫자로만 이루어진 컬럼은 float로, 나머지는 문자열로 변환 (엑셀 재로드 시 dtype 차이 무시)"""
+    numeric = pd.to_numeric(series, errors="coerce")
+    if numeric.notna().sum() == series.notna().sum():
+        return numeric.astype("float64")
+    return series.astype(str)
+
+
+def compute_row_hashes(upload_df):
+    """
+    키별 행 해시 계산 (키를 제외한 컬럼 기준)
+
+    Returns:
+        키 MultiIndex의 uint64 해시 Series
+    """
+    value_columns = [col for col in upload_df.columns if col not in DELTA_KEY_COLUMNS]
+    normalized = pd.DataFrame(
+        {col: normalize_for_hash(upload_df[col]) for col in value_columns},
+        index=upload_df.index,
+    )
+    hashes = pd.util.hash_pandas_object(normalized, index=False)
+    hashes.index = pd.MultiIndex.from_frame(upload_df[DELTA_KEY_COLUMNS].astype(str))
+    return hashes
+
+
+def unique_by_key(upload_df):
+    """키가 중복된 행은 마지막 행만 사용"""
+    duplicated = upload_df.duplicated(DELTA_KEY_COLUMNS, keep="last")
+    if duplicated.any():
+        print(f"⚠️ 키가 중복된 {int(duplicated.sum())}개 행은 마지막 행만 비교합니다.")
+        return upload_df[~duplicated]
+    return upload_df
+
+
+def build_change_set(current_df, previous_df):
+    """
+    이전 게시 데이터와 비교한 변경분 생성
+
+    Args:
+        current_df: 오늘 upload 데이터
+        previous_df: 마지막으로 게시한 upload 데이터 (None이면 전체를 추가로 처리)
+
+    Returns:
+        op 컬럼 + upload 컬럼 데이터프레임 (삭제 행은 키 컬럼만 채움)
+    """
+    current_df = unique_by_key(current_df)
+    current_hashes = compute_row_hashes(current_df)
+
+    if previous_df is None:
+        ops = pd.Series(OP_INSERT, index=current_hashes.index)
+        deleted_keys = pd.MultiIndex.from_tuples([], names=DELTA_KEY_COLUMNS)
+    else:
+        previous_hashes = compute_row_hashes(unique_by_key(previous_df))
+        matched = previous_hashes.reindex(current_hashes.index)
+        ops = pd.Series(None, index=current_hashes.index, dtype=object)
+        ops[matched.isna().to_numpy()] = OP_INSERT
+        ops[(matched.notna() & (matched != current_hashes)).to_numpy()] = OP_UPDATE
+        deleted_keys = previous_hashes.index.difference(current_hashes.index, sort=False)
+
+    changed = current_df[ops.notna().to_numpy()]
+    changed = changed.assign(op=ops.dropna().to_numpy())
+    deleted = pd.DataFrame(list(deleted_keys), columns=DELTA_KEY_COLUMNS).assign(op=OP_DELETE)
+
+    change_df = pd.concat([changed, deleted], ignore_index=True)
+    return change_df[["op"] + list(current_df.columns)]
+
+
+def load_published_state():
+    """
+    마지막으로 게시한 upload 데이터 로드
+
+    Returns:
+        (게시 날짜, upload 데이터프레임), 게시 이력이 없으면 (None, None)
+    """
+    path = FilePaths.PUBLISHED_STATE
+    if not os.path.exists(path):
+        return None, None
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    return state["date"], state["upload"]
+
+
+def save_published_state(upload_df, date_str):
+    """게시 완료된 upload 데이터를 다음 비교 기준으로 저장"""
+    os.makedirs(os.path.dirname(FilePaths.PUBLISHED_STATE), exist_ok=True)
+    with open(FilePaths.PUBLISHED_STATE, "wb") as f:
+        pickle.dump({"date": date_str, "upload": upload_df}, f)
+
+
+def publish_delta(upload_df, date_str=None):
+    """
+    변경분을 계산하여 변경분 파일(changes_YYMMDD.csv)로 저장
+
+    게시 기준은 바꾸지 않으므로 결과 파일 생성 후 save_published_state()로 갱신
+
+    Args:
+        upload_df: build_upload_df() 결과
+        date_str: 처리 날짜 (YYMMDD)
+
+    Returns:
+        변경분 데이터프레임
+    """
+    if date_str is None:
+        date_str = get_today_date_string()
+
+    base_date, previous_df = load_published_state()
+    change_df = build_change_set(upload_df, previous_df)
+
+    path = FilePaths.get_results_file("changes", date_str)
+    change_df.to_csv(path, index=False, encoding="utf-8-sig")
+
+    counts = change_df["op"].value_counts()
+    base = f"{base_date} 대비" if base_date else "게시 이력 없음 →"
+    print(
+        f"📝 변경분 저장: {path} ({base} 추가 {counts.get(OP_INSERT, 0)}대, "
+        f"변경 {counts.get(OP_UPDATE, 0)}대, 삭제 {counts.get(OP_DELETE, 0)}대)"
+    )
+    return change_df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="결과 파일의 upload 시트로 변경분 생성 및 게시 기준 갱신")
+    parser.add_argument("--date", help="처리 날짜 (YYMMDD, 기본값: 오늘)")
+    args = parser.parse_args()
+
+    if args.date:
+        set_global_date(args.date)
+    date_str = args.date or get_today_date_string()
+
+    upload_df = pd.read_excel(FilePaths.get_results_file("filtered", date_str), sheet_name="upload")
+    publish_delta(upload_df, date_str)
+    save_published_state(upload_df, date_str)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+업로드 스텁 서버 모듈
+업로드 클라이언트 확인용 로컬 HTTP 서버 (표준 라이브러리 http.server)
+
+- POST 본문의 rows를 Idempotency-Key 단위로 한 번만 집계
+- fail_every: N번째 요청마다 503 응답 (재시도 확인용)
+- delay_ms: 응답 지연 (동시 전송 확인용)
+
+사용법:
+    python -m src.upload.stub_server --port 8765 --fail-every 5
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubState:
+    """스텁 서버 수신 상태"""
+
+    def __init__(self, fail_every=0, delay_ms=0):
+        self.fail_every = fail_every
+        self.delay_ms = delay_ms
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.duplicates = 0
+        self.received_rows = 0
+        self.keys = set()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """업로드 요청 처리기"""
+
+    def do_POST(self):
+        state = self.server.state
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        key = self.headers.get("Idempotency-Key")
+
+        with state.lock:
+            state.requests += 1
+            fail = state.fail_every and state.requests % state.fail_every == 0
+            if fail:
+                state.failures += 1
+
+        if state.delay_ms:
+            time.sleep(state.delay_ms / 1000)
+        if fail:
+            self.reply(503, {"status": "unavailable"})
+            return
+
+        try:
+            rows = json.loads(body)["rows"]
+        except (ValueError, KeyError):
+            self.reply(400, {"status": "invalid"})
+            return
+
+        with state.lock:
+            if key and key in state.keys:
+                state.duplicates += 1
+                status = "duplicate"
+            else:
+                state.keys.add(key)
+                state.received_rows += len(rows)
+                status = "accepted"
+        self.reply(200, {"status": status, "rows": len(rows)})
+
+    def reply(self, code, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(port=0, fail_every=0, delay_ms=0):
+    """
+    백그라운드 스레드에서 스텁 서버 시작
+
+    Returns:
+        서버 객체 (server.url: 전송 URL, server.state: 수신 상태, server.shutdown()으로 종료)
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    server.state = StubState(fail_every, delay_ms)
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/upload"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="업로드 스텁 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fail-every", type=int, default=0, help="N번째 요청마다 503 응답")
+    parser.add_argument("--delay-ms", type=int, default=0, help="응답 지연 (밀리초)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), StubHandler)
+    server.daemon_threads = True
+    server.state = StubState(args.fail_every, args.delay_ms)
+    print(f"🧪 스텁 서버 실행 중: http://127.0.0.1:{args.port}/upload (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        state = server.state
+        print(f"📊 수신: {state.received_rows}대 (요청 {state.requests}회, 중복 키 {state.duplicates}회)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+메모리 벤치마크 모듈
+클렌징 결과를 N배로 복제한 데이터로 리스팅 + 결과 시트 준비 단계의 최대 RSS를 측정하여
+기존 복사 방식(legacy)과 현재 방식(current)을 비교
+
+사용법:
+    python -m src.utils.memory_benchmark --date 250901 --scale 20
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import pickle
+import resource
+import subprocess
+import sys
+import tempfile
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.cleansing.common import reorder_cleansing_columns
+from src.config.constants import set_global_date
+
+
+def reset_peak_rss():
+    """최대 RSS 기록 초기화 (Linux만 지원, 데이터 로드 시점의 일시적 최대치 제외용)"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def get_peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB)"""
+    # Linux: 초기화 가능한 VmHWM 사용
+    if os.path.exists("/proc/self/status"):
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def run_legacy(df):
+    """리팩터링 전 복사 방식 재현 (비교용): 단계별 .copy()와 호출자 데이터 수정"""
+    from src.listing.listing_unified import (
+        EXCLUDE_OPTIONS,
+        EXCLUDE_PALISADE_SEATING,
+        EXCLUDE_SANTAFE_SEATING,
+        EXCLUDE_WHEEL_TIRE,
+        compute_rule_mask,
+    )
+
+    df = df[list(df.columns)].copy()
+    df["stock"] = pd.to_numeric(df["stock"], errors="coerce")
+    df["stock"] = df["stock"].fillna(0).astype(int)
+    rule_mask = pd.Series(compute_rule_mask(df), index=df.index)
+
+    all_df = df.copy()
+    filtered_df = df[df["stock"] >= 3].copy()
+    filtered_df = filtered_df[(rule_mask[filtered_df.index] & EXCLUDE_WHEEL_TIRE) == 0].copy()
+    filtered_df = filtered_df[(rule_mask[filtered_df.index] & EXCLUDE_OPTIONS) == 0]
+    seating_bits = EXCLUDE_SANTAFE_SEATING | EXCLUDE_PALISADE_SEATING
+    filtered_df = filtered_df[(rule_mask[filtered_df.index] & seating_bits) == 0]
+    upload_df = filtered_df[["code_sales_a", "stock", "model", "trim", "price"]].copy()
+    return all_df, filtered_df, upload_df
+
+
+def run_current(df):
+    """현재 방식: Copy-on-Write + 비트마스크 한 번 추출"""
+    from src.listing.listing_unified import build_upload_df, main as listing_main
+
+    df = reorder_cleansing_columns(df)
+    with contextlib.redirect_stdout(io.StringIO()):
+        result_dict = listing_main(df)
+    upload_df = build_upload_df(result_dict["filtered"])
+    return result_dict["all"], result_dict["filtered"], upload_df
+
+
+def run_worker(mode, input_path):
+    """하위 프로세스에서 한 가지 방식을 실행하고 RSS 측정 결과를 JSON으로 출력"""
+    with open(input_path, "rb") as f:
+        df = pickle.load(f)
+    gc.collect()
+    reset_peak_rss()
+    baseline = get_peak_rss_mb()
+    data_mb = df.memory_usage(deep=True).sum() / (1024 * 1024)
+
+    runner = run_legacy if mode == "legacy" else run_current
+    outputs = runner(df)
+
+    print(json.dumps({
+        "mode": mode,
+        "rows": len(df),
+        "data_mb": round(data_mb, 1),
+        "baseline_mb": round(baseline, 1),
+        "peak_mb": round(get_peak_rss_mb(), 1),
+        "filtered_rows": len(outputs[1]),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리스팅 단계 최대 RSS 비교 (legacy vs current)")
+    parser.add_argument("--date", help="원본 데이터 날짜 (YYMMDD)")
+    parser.add_argument("--scale", type=int, default=10, help="클렌징 결과 복제 배수")
+    parser.add_argument("--worker", choices=["legacy", "current"], help=argparse.SUPPRESS)
+    parser.add_argument("--input", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.input)
+        return
+
+    from src.cleansing.cleansing_unified import clean_all_data
+
+    if args.date:
+        set_global_date(args.date)
+    print("📋 클렌징 데이터 준비 중...")
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaned_df = clean_all_data()
+    scaled_df = pd.concat([cleaned_df] * args.scale, ignore_index=True)
+
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as f:
+        pickle.dump(scaled_df, f)
+        input_path = f.name
+
+    try:
+        results = []
+        for mode in ["legacy", "current"]:
+            completed = subprocess.run(
+                [sys.executable, "-m", "src.utils.memory_benchmark", "--worker", mode, "--input", input_path],
+                cwd=project_root,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    finally:
+        os.remove(input_path)
+
+    print(f"\n📊 메모리 벤치마크 ({results[0]['rows']}행, 데이터 {results[0]['data_mb']}MB)")
+    for result in results:
+        increase = result["peak_mb"] - result["baseline_mb"]
+        print(
+            f"   - {result['mode']:7s}: 최대 RSS {result['peak_mb']}MB "
+            f"(로드 후 {result['baseline_mb']}MB, 증가 {increase:.1f}MB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
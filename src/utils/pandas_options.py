@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+pandas 옵션 설정 모듈
+"""
+
+import pandas as pd
+
+
+def enable_copy_on_write():
+    """
+    pandas Copy-on-Write 활성화
+
+    컬럼 선택/assign 결과가 원본 데이터를 공유하고, 수정될 때만 복사되도록 함.
+    pandas 3.0부터는 항상 활성화되어 있어 설정하지 않음 (옵션 deprecated)
+    """
+    major = int(pd.__version__.split(".")[0])
+    if major >= 3:
+        return
+    try:
+        pd.set_option("mode.copy_on_write", True)
+    except (KeyError, pd.errors.OptionError):
+        # pandas 1.5 미만: 옵션 없음 (기존 복사 동작 유지)
+        pass
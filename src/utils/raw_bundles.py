@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+원본 zip 번들 모듈
+딜러 포털에서 받은 zip 파일을 풀지 않고 data/raw 안의 원본 파일처럼 사용
+
+- data/raw/*.zip 안의 재고리스트 파일을 파일명으로 찾아 바이트를 바로 읽음 (임시 파일 없음)
+- 한글 파일명: UTF-8 플래그가 있으면 그대로, 없으면 UTF-8 → CP949 순서로 해석
+- 폴더별 번들 목록은 zip 파일의 수정 시각/크기가 바뀌지 않는 한 한 번만 색인
+"""
+
+import io
+import os
+import zipfile
+from collections import namedtuple
+from datetime import datetime
+
+
+UTF8_FLAG = 0x800
+
+
+class BundleMember(namedtuple("BundleMember", ["bundle", "member", "name"])):
+    """zip 번들 안의 원본 파일 (bundle: zip 경로, member: zip 내부 이름, name: 해석된 파일명)"""
+
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{self.bundle}!{self.name}"
+
+
+# 폴더 -> (번들 서명, 파일명 -> BundleMember)
+_bundle_index = {}
+
+
+def decode_member_name(info):
+    """zip 항목 이름 해석 (UTF-8 플래그가 없으면 cp437로 읽힌 원래 바이트를 UTF-8/CP949로 해석)"""
+    if info.flag_bits & UTF8_FLAG:
+        return info.filename
+    raw = info.filename.encode("cp437")
+    for encoding in ("utf-8", "cp949"):
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return info.filename
+
+
+def list_bundles(raw_dir):
+    """폴더의 zip 번들 경로 목록 (이름순)"""
+    if not os.path.isdir(raw_dir):
+        return []
+    return sorted(
+        os.path.join(raw_dir, name) for name in os.listdir(raw_dir) if name.lower().endswith(".zip")
+    )
+
+
+def index_bundles(raw_dir):
+    """
+    폴더의 zip 번들 색인 (같은 파일명이 여러 번들에 있으면 이름순으로 먼저 나온 번들 사용)
+
+    Returns:
+        파일명 -> BundleMember dict
+    """
+    bundles = list_bundles(raw_dir)
+    signature = tuple((path, os.stat(path).st_mtime_ns, os.stat(path).st_size) for path in bundles)
+    cached = _bundle_index.get(raw_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    members = {}
+    for path in bundles:
+        try:
+            with zipfile.ZipFile(path) as archive:
+                for info in archive.infolist():
+                    if info.is_dir():
+                        continue
+                    name = os.path.basename(decode_member_name(info).replace("\\", "/"))
+                    members.setdefault(name, BundleMember(path, info.filename, name))
+        except zipfile.BadZipFile:
+            print(f"⚠️ zip 파일을 읽을 수 없습니다: {path}")
+    _bundle_index[raw_dir] = (signature, members)
+    return members
+
+
+def resolve_raw_file(path):
+    """
+    원본 파일 위치 확인 (폴더에 파일이 없으면 같은 폴더의 zip 번들에서 찾음)
+
+    Returns:
+        파일 경로 또는 BundleMember (어디에도 없으면 원래 경로)
+    """
+    if os.path.exists(path):
+        return path
+    member = index_bundles(os.path.dirname(path) or ".").get(os.path.basename(path))
+    return member if member is not None else path
+
+
+def raw_file_exists(source):
+    """원본 파일(또는 번들 항목) 존재 여부"""
+    return isinstance(source, BundleMember) or os.path.exists(source)
+
+
+def list_raw_names(raw_dir):
+    """폴더의 원본 파일명 목록 (폴더 파일 + zip 번들 항목)"""
+    names = set()
+    if os.path.isdir(raw_dir):
+        names.update(name for name in os.listdir(raw_dir) if not name.lower().endswith(".zip"))
+        names.update(index_bundles(raw_dir))
+    return sorted(names)
+
+
+def open_raw_stream(source):
+    """원본 바이트 스트림 열기 (해시 계산 등 순차 읽기용)"""
+    if isinstance(source, BundleMember):
+        archive = zipfile.ZipFile(source.bundle)
+        stream = archive.open(source.member)
+        stream._archive = archive  # 스트림이 닫힐 때까지 zip 파일 유지
+        return stream
+    return open(source, "rb")
+
+
+def open_raw_source(source):
+    """
+    엑셀 리더에 넘길 입력 (파일 경로는 그대로, 번들 항목은 메모리 버퍼)
+
+    xlsx/xls 리더는 임의 위치 읽기가 필요하므로 번들 항목은 압축을 푼 바이트를 메모리에 올림
+    """
+    if isinstance(source, BundleMember):
+        with zipfile.ZipFile(source.bundle) as archive:
+            return io.BytesIO(archive.read(source.member))
+    return source
+
+
+def get_raw_mtime(source):
+    """원본 파일 수정 시각 (번들 항목은 zip에 기록된 항목 시각, 초 단위 timestamp)"""
+    if isinstance(source, BundleMember):
+        with zipfile.ZipFile(source.bundle) as archive:
+            return datetime(*archive.getinfo(source.member).date_time).timestamp()
+    return os.path.getmtime(source)